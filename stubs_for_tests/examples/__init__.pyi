@@ -0,0 +1,14 @@
+
+#### This stub was autogenerated by Typedpy
+###########################################
+
+from typing import Union, Optional, Any, TypeVar, Type, NoReturn, Iterable
+from typedpy import Structure
+
+from .api_example import Foo as Foo
+from .api_example import Bar as Bar
+from .api_example import Blah as Blah
+from .api_example import FooOmit as FooOmit
+from .api_example import FooPick as FooPick
+from .api_example import FooPartial as FooPartial
+
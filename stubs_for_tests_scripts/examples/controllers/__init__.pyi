@@ -0,0 +1,10 @@
+
+#### This stub was autogenerated by Typedpy
+###########################################
+
+from typing import Union, Optional, Any, TypeVar, Type, NoReturn, Iterable
+from typedpy import Structure
+
+from .job_controller import JobController as JobController
+from .Scheduled_controller import ScheduledController as ScheduledController
+
@@ -0,0 +1,7 @@
+from typedpy import *
+
+
+class Example1(Structure):
+    name: String()
+
+    _required = ['name']
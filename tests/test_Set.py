@@ -1,3 +1,5 @@
+import pickle
+from copy import deepcopy
 from typing import Optional
 
 import pytest
@@ -231,3 +233,38 @@ def test_frozenset_is_supported(cls):
     assert foo.s == {"x", "y"}
     assert isinstance(foo.s, frozenset)
     assert set(serialize(foo)["s"]) == {"x", "y"}
+
+
+def test_plain_set_unless_tracking_changes():
+    e = Example(f={1, 2})
+    assert type(e.f) is set
+    e.f.add("x")
+    assert e.f == {1, 2, "x"}
+
+
+def test_update_is_validated():
+    e = Example(f={1, 2}).mark_clean()
+    e.f.add(3)
+    e.f |= {4}
+    e.f.discard(1)
+    assert e.f == {2, 3, 4}
+    with raises(TypeError):
+        e.f.add("x")
+    with raises(TypeError):
+        e.f.update({"y"})
+    assert e.f == {2, 3, 4}
+    with raises(ValueError):
+        e.b = {1, 2, 3}
+        e.b.pop()
+
+
+def test_pickle_and_copy_with_updates():
+    e = Example(f={1, 2}).mark_clean()
+    for copied in [pickle.loads(pickle.dumps(e)), deepcopy(e)]:
+        assert copied == e
+        copied.f.add(3)
+        assert copied.f == {1, 2, 3}
+        assert e.f == {1, 2}
+    tracking_copy = deepcopy(e)
+    with raises(TypeError):
+        tracking_copy.f.add("x")
@@ -0,0 +1,243 @@
+from pytest import raises
+
+from typedpy import (
+    Array,
+    Deserializer,
+    ImmutableStructure,
+    Integer,
+    Map,
+    String,
+    Structure,
+    apply_patch,
+    mappers,
+    serialize,
+    serialize_changes,
+)
+
+
+class Item(Structure):
+    name: String
+    quantity: Integer(minimum=0)
+
+
+class Customer(Structure):
+    name: String
+    email: String
+    _required = ["name"]
+
+    def __validate__(self):
+        if self.email == "invalid":
+            raise ValueError("invalid email")
+
+
+class Order(Structure):
+    order_id: Integer
+    status: String
+    customer: Customer
+    items: Array[Item]
+    item_by_name: Map[String, Item]
+    _required = ["order_id"]
+
+    _serialization_mapper = mappers.TO_CAMELCASE
+
+
+class CachedCustomer(ImmutableStructure):
+    name: String
+    email: String
+
+    _cache_serialization = True
+
+
+class ImmutableOrder(ImmutableStructure):
+    order_id: Integer
+    customer: Customer
+    items: Array[Item]
+    archived_items: Array[Item]
+
+
+def _order():
+    return Deserializer(Order).deserialize(
+        {
+            "orderId": 1,
+            "status": "new",
+            "customer": {"name": "john"},
+            "items": [{"name": "pen", "quantity": 1}],
+            "itemByName": {"pen": {"name": "pen", "quantity": 1}},
+        }
+    )
+
+
+def test_replace_and_add():
+    order = apply_patch(
+        _order(),
+        [
+            {"op": "replace", "path": "/orderId", "value": 2},
+            {"op": "add", "path": "/customer/email", "value": "john@example.com"},
+            {"op": "add", "path": "/items/-", "value": {"name": "book", "quantity": 2}},
+            {"op": "add", "path": "/itemByName/book", "value": {"name": "book", "quantity": 2}},
+        ],
+    )
+    assert order.order_id == 2
+    assert order.customer == Customer(name="john", email="john@example.com")
+    assert order.items == [Item(name="pen", quantity=1), Item(name="book", quantity=2)]
+    assert order.item_by_name["book"] == Item(name="book", quantity=2)
+
+
+def test_mutable_structure_is_patched_in_place():
+    order = _order()
+    assert apply_patch(order, [{"op": "remove", "path": "/status"}]) is order
+    assert order.status is None
+    order.items.append(Item(name="book", quantity=2))
+    assert len(order.items) == 2
+
+
+def test_remove_move_and_copy():
+    order = apply_patch(
+        _order(),
+        [
+            {"op": "add", "path": "/items/0", "value": {"name": "book", "quantity": 2}},
+            {"op": "move", "from": "/items/1", "path": "/items/0"},
+            {"op": "copy", "from": "/items/1", "path": "/itemByName/book"},
+            {"op": "remove", "path": "/itemByName/pen"},
+        ],
+    )
+    assert serialize(order)["items"] == [
+        {"name": "pen", "quantity": 1},
+        {"name": "book", "quantity": 2},
+    ]
+    assert serialize(order)["itemByName"] == {"book": {"name": "book", "quantity": 2}}
+    assert order.items[1] is not order.item_by_name["book"]
+
+
+def test_test_operation():
+    order = _order()
+    apply_patch(
+        order,
+        [
+            {"op": "test", "path": "/items/0", "value": {"name": "pen", "quantity": 1}},
+            {"op": "replace", "path": "/status", "value": "shipped"},
+        ],
+    )
+    assert order.status == "shipped"
+    with raises(ValueError) as excinfo:
+        apply_patch(order, [{"op": "test", "path": "/status", "value": "new"}])
+    assert "/status: test failed" in str(excinfo.value)
+
+
+def test_patch_is_atomic():
+    order = _order()
+    with raises(ValueError) as excinfo:
+        apply_patch(
+            order,
+            [
+                {"op": "replace", "path": "/status", "value": "shipped"},
+                {"op": "add", "path": "/customer/email", "value": "invalid"},
+            ],
+        )
+    assert "invalid email" in str(excinfo.value)
+    assert order == _order()
+
+
+def test_patch_is_atomic_for_any_exception():
+    class Validated(Structure):
+        name: String
+
+        def __validate__(self):
+            assert self.name != "invalid"
+
+    validated = Validated(name="john")
+    with raises(AssertionError):
+        apply_patch(validated, [{"op": "replace", "path": "/name", "value": "invalid"}])
+    assert validated.name == "john"
+    assert validated.__dict__["_instantiated"] is True
+
+
+def test_invalid_value_err():
+    order = _order()
+    with raises(ValueError) as excinfo:
+        apply_patch(order, [{"op": "replace", "path": "/items/0/quantity", "value": -1}])
+    assert "quantity: Got -1; Expected a minimum of 0" in str(excinfo.value)
+    assert order.items[0].quantity == 1
+
+
+def test_invalid_path_err():
+    with raises(ValueError) as excinfo:
+        apply_patch(_order(), [{"op": "replace", "path": "/order_id", "value": 2}])
+    assert "/order_id: 'order_id' is not a field of Order" in str(excinfo.value)
+
+    with raises(ValueError) as excinfo:
+        apply_patch(_order(), [{"op": "remove", "path": "/items/1"}])
+    assert "/items/1: index 1 is out of range" in str(excinfo.value)
+
+    with raises(ValueError) as excinfo:
+        apply_patch(_order(), [{"op": "replace", "path": "/customer/email", "value": "x"}])
+    assert "/customer/email: 'email' does not exist" in str(excinfo.value)
+
+
+def test_remove_required_field_err():
+    with raises(ValueError) as excinfo:
+        apply_patch(_order(), [{"op": "remove", "path": "/orderId"}])
+    assert "order_id is mandatory" in str(excinfo.value)
+
+
+def test_immutable_structure_returns_a_new_instance():
+    order = ImmutableOrder(
+        order_id=1,
+        customer=Customer(name="john"),
+        items=[Item(name="pen", quantity=1)],
+        archived_items=[Item(name="book", quantity=2)],
+    )
+    patched = apply_patch(
+        order,
+        [
+            {"op": "replace", "path": "/items/0/quantity", "value": 3},
+            {"op": "add", "path": "/customer/email", "value": "john@example.com"},
+        ],
+    )
+    assert patched.items[0].quantity == 3
+    assert patched.customer.email == "john@example.com"
+    assert order.items[0].quantity == 1
+    assert order.customer.email is None
+    assert patched.__dict__["archived_items"] is order.__dict__["archived_items"]
+    with raises(ValueError):
+        patched.order_id = 2
+
+
+def test_patch_tracked_changes():
+    order = _order().mark_clean()
+    apply_patch(
+        order,
+        [
+            {"op": "replace", "path": "/status", "value": "shipped"},
+            {"op": "add", "path": "/customer/email", "value": "john@example.com"},
+        ],
+    )
+    assert serialize_changes(order) == {
+        "status": "shipped",
+        "customer": {"email": "john@example.com"},
+    }
+
+
+def test_serialize_cached_structure_after_patch():
+    customer = CachedCustomer(name="john", email="john@example.com")
+    assert serialize(customer) == {"name": "john", "email": "john@example.com"}
+    patched = apply_patch(customer, [{"op": "replace", "path": "/name", "value": "jane"}])
+    assert patched.name == "jane"
+    assert serialize(patched) == {"name": "jane", "email": "john@example.com"}
+    assert serialize(customer) == {"name": "john", "email": "john@example.com"}
+
+
+def test_failed_patch_keeps_tracked_changes():
+    order = _order().mark_clean()
+    order.item_by_name["book"] = Item(name="book", quantity=2)
+    with raises(ValueError):
+        apply_patch(
+            order,
+            [
+                {"op": "remove", "path": "/itemByName/book"},
+                {"op": "replace", "path": "/items/0/quantity", "value": -1},
+            ],
+        )
+    assert serialize_changes(order) == {
+        "itemByName": {"book": {"name": "book", "quantity": 2}}
+    }
@@ -0,0 +1,197 @@
+import asyncio
+import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from pytest import raises
+
+from typedpy import (
+    Array,
+    DateField,
+    Deserializer,
+    ImmutableStructure,
+    Integer,
+    Map,
+    String,
+    Structure,
+    mappers,
+    serialize,
+    serialize_async,
+)
+
+
+class Item(Structure):
+    item_id: Integer(minimum=0)
+    name: String
+
+    _serialization_mapper = mappers.TO_CAMELCASE
+
+
+class Order(Structure):
+    order_id: Integer
+    items: Array[Item]
+    item_by_name: Map[String, Item]
+    tags: Array[String]
+
+    _serialization_mapper = mappers.TO_CAMELCASE
+
+
+class ImmutableOrder(ImmutableStructure):
+    items: Array[Item]
+
+
+def _payload(size):
+    items = [{"itemId": i, "name": f"item{i}"} for i in range(size)]
+    return {
+        "orderId": 1,
+        "items": items,
+        "itemByName": {x["name"]: x for x in items},
+        "tags": ["a", "b"],
+    }
+
+
+def _count_yields(coro):
+    """
+    run the coroutine, counting the times it yielded to the event loop
+    """
+    counter = {"count": 0, "done": False}
+
+    async def count():
+        while not counter["done"]:
+            counter["count"] += 1
+            await asyncio.sleep(0)
+
+    async def main():
+        counting = asyncio.ensure_future(count())
+        await asyncio.sleep(0)
+        res = await coro
+        counter["done"] = True
+        await counting
+        return res
+
+    return asyncio.run(main()), counter["count"]
+
+
+@pytest.mark.parametrize("size", [3, 1000])
+def test_deserialize_async(size):
+    payload = _payload(size)
+    result, yields = _count_yields(
+        Deserializer(Order).deserialize_async(payload, chunk_size=100)
+    )
+    assert result == Deserializer(Order).deserialize(payload)
+    assert yields >= (20 if size > 100 else 1)
+
+
+def test_deserialize_async_with_explicit_mapper():
+    payload = {
+        "id": 1,
+        "products": _payload(300)["items"],
+        "item_by_name": {},
+        "tags": [],
+    }
+    deserializer = Deserializer(
+        Order,
+        mapper={"order_id": "id", "items": "products"},
+    )
+    result = asyncio.run(deserializer.deserialize_async(payload, chunk_size=100))
+    assert result.order_id == 1
+    assert result.items[299] == Item(item_id=299, name="item299")
+
+
+def test_deserialize_async_err():
+    payload = _payload(300)
+    payload["items"][250]["itemId"] = -1
+    with raises(ValueError) as excinfo:
+        asyncio.run(Deserializer(Order).deserialize_async(payload, chunk_size=100))
+    assert "items_250: item_id: Got -1; Expected a minimum of 0" in str(excinfo.value)
+
+
+def test_deserialize_async_map_without_undefined():
+    class Product(Structure):
+        product_id: Integer
+
+    class Catalog(Structure):
+        product_by_name: Map[String, Product]
+
+    payload = {
+        "product_by_name": {f"p{i}": {"product_id": i, "extra": 1} for i in range(300)}
+    }
+    deserializer = Deserializer(Catalog)
+    result = asyncio.run(
+        deserializer.deserialize_async(payload, keep_undefined=False, chunk_size=100)
+    )
+    assert result == deserializer.deserialize(payload, keep_undefined=False)
+    assert result.product_by_name["p299"] == Product(product_id=299)
+
+
+def test_deserialize_async_map_like_sync():
+    class Catalog(Structure):
+        product_by_date: Map[DateField, Item]
+
+    payload = {
+        "product_by_date": {
+            str(datetime.date(2020, 1, 1) + datetime.timedelta(days=i)): {
+                "itemId": i,
+                "name": "x",
+            }
+            for i in range(300)
+        }
+    }
+    deserializer = Deserializer(Catalog)
+    result = asyncio.run(deserializer.deserialize_async(payload, chunk_size=100))
+    assert result == deserializer.deserialize(payload)
+    assert result.product_by_date[datetime.date(2020, 1, 2)] == Item(
+        item_id=1, name="x"
+    )
+
+    del payload["product_by_date"]["2020-01-03"]["name"]
+    with raises(TypeError) as sync_excinfo:
+        deserializer.deserialize(payload)
+    with raises(TypeError) as excinfo:
+        asyncio.run(deserializer.deserialize_async(payload, chunk_size=100))
+    assert str(excinfo.value) == str(sync_excinfo.value)
+
+
+def test_deserialize_async_keeps_error_type():
+    payload = _payload(300)
+    payload["itemByName"]["item250"]["itemId"] = "x"
+    with raises(TypeError):
+        asyncio.run(Deserializer(Order).deserialize_async(payload, chunk_size=100))
+
+
+def test_deserialize_async_with_structure_values():
+    payload = _payload(300)
+    payload["items"] = [Item(item_id=i, name="x") for i in range(300)]
+    result = asyncio.run(Deserializer(Order).deserialize_async(payload, chunk_size=100))
+    assert result.items[5] is payload["items"][5]
+
+
+def test_deserialize_async_offloaded_to_executor():
+    payload = _payload(300)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        result = asyncio.run(
+            Deserializer(Order).deserialize_async(
+                payload, executor_threshold=100, executor=executor
+            )
+        )
+    assert result == Deserializer(Order).deserialize(payload)
+
+
+@pytest.mark.parametrize("size", [3, 1000])
+def test_serialize_async(size):
+    order = Deserializer(Order).deserialize(_payload(size))
+    result, yields = _count_yields(serialize_async(order, chunk_size=100))
+    assert result == serialize(order)
+    assert result == _payload(size)
+    assert yields >= (20 if size > 100 else 1)
+
+
+def test_serialize_async_immutable():
+    order = ImmutableOrder(items=[Item(item_id=i, name="x") for i in range(250)])
+    assert asyncio.run(serialize_async(order, chunk_size=100)) == serialize(order)
+
+
+def test_serialize_async_offloaded_to_executor():
+    order = Deserializer(Order).deserialize(_payload(300))
+    result = asyncio.run(serialize_async(order, executor_threshold=100))
+    assert result == serialize(order)
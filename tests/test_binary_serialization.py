@@ -0,0 +1,113 @@
+import json
+from datetime import date
+
+from pytest import raises
+
+from typedpy import (
+    Anything,
+    Array,
+    Boolean,
+    DateField,
+    Enum,
+    Float,
+    ImmutableStructure,
+    Integer,
+    Map,
+    Set,
+    String,
+    Structure,
+    binary_schema_fingerprint,
+    deserialize_binary,
+    serialize,
+    serialize_binary,
+)
+
+
+class Address(Structure):
+    street: String
+    zip_code: Integer
+
+
+class Person(Structure):
+    name: String
+    age: Integer(minimum=0)
+    score: Float
+    active: Boolean
+    born: DateField
+    role: Enum["admin", "user"]
+    tags: Set[String]
+    scores: Map[String, Integer]
+    address: Address
+    previous_addresses: Array[Address]
+    extra: Anything
+    _required = ["name"]
+
+
+def _person():
+    return Person(
+        name="john",
+        age=30,
+        score=-1.5,
+        active=True,
+        born=date(2000, 1, 31),
+        role="admin",
+        tags={"a", "b"},
+        scores={"x": -5, "y": 2**70},
+        address=Address(street="main", zip_code=12345),
+        previous_addresses=[Address(street="old", zip_code=1)],
+        extra={"k": [1, None, 2.5, "s", False]},
+    )
+
+
+def test_round_trip():
+    person = _person()
+    data = serialize_binary(person)
+    assert deserialize_binary(Person, data) == person
+    assert deserialize_binary(Person, data, direct_trusted_mapping=True) == person
+    assert len(data) < len(json.dumps(serialize(person))) / 2
+
+
+def test_optional_fields():
+    person = Person(name="john")
+    assert deserialize_binary(Person, serialize_binary(person)) == person
+
+
+def test_immutable():
+    class Line(ImmutableStructure):
+        points: Array[Address]
+        name: String
+
+    line = Line(points=[Address(street="a", zip_code=1)], name="x")
+    assert deserialize_binary(Line, serialize_binary(line)) == line
+
+
+def test_incompatible_schema_err():
+    class Other(Structure):
+        name: String
+        age: Integer
+        _required = ["name"]
+
+    assert binary_schema_fingerprint(Other) != binary_schema_fingerprint(Person)
+    with raises(ValueError) as excinfo:
+        deserialize_binary(Other, serialize_binary(Person(name="john")))
+    assert "Other: Binary data was serialized with an incompatible schema" in str(
+        excinfo.value
+    )
+
+
+def test_invalid_values_err():
+    data = bytearray(serialize_binary(Person(name="john", age=3)))
+    data[-1] = 5  # zigzag encoding of -3
+    with raises(ValueError) as excinfo:
+        deserialize_binary(Person, bytes(data))
+    assert "age: Got -3; Expected a minimum of 0" in str(excinfo.value)
+
+
+def test_invalid_data_err():
+    data = serialize_binary(_person())
+    with raises(ValueError) as excinfo:
+        deserialize_binary(Person, data[:-3])
+    assert "Person: Invalid binary data" in str(excinfo.value)
+    with raises(ValueError) as excinfo:
+        deserialize_binary(Person, data + b"\x00")
+    assert "unexpected trailing bytes" in str(excinfo.value)
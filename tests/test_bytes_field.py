@@ -0,0 +1,109 @@
+import pickle
+from copy import deepcopy
+
+from pytest import raises
+
+from typedpy import (
+    Anything,
+    Bytes,
+    Deserializer,
+    ImmutableStructure,
+    String,
+    Structure,
+    serialize,
+)
+from typedpy.fields.bytes_field import decode_base64, encode_base64
+
+
+class Attachment(Structure):
+    name: String
+    content: Bytes(minLength=1, maxLength=20)
+
+    _required = ["content"]
+
+
+class Frame(Structure):
+    data: Bytes(as_memoryview=True)
+
+
+class Blob(ImmutableStructure):
+    data: Bytes(as_memoryview=True)
+
+
+def test_bytes_are_not_copied():
+    content = b"\x89PNG..."
+    attachment = Attachment(content=content)
+    assert attachment.content is content
+    assert Attachment(content=bytearray(b"abc")).content == b"abc"
+    assert isinstance(Attachment(content=memoryview(b"abc")).content, bytes)
+
+
+def test_bytes_in_immutable_structure_are_not_copied():
+    class Holder(ImmutableStructure):
+        content: Anything
+
+    content = b"abc"
+    assert Holder(content=content).content is content
+
+
+def test_memoryview():
+    buffer = bytearray(b"0123456789")
+    frame = Frame(data=memoryview(buffer)[2:5])
+    assert isinstance(frame.data, memoryview)
+    assert frame.data == b"234"
+    assert frame.data.readonly
+    buffer[2] = ord("x")
+    assert frame.data == b"x34"
+    assert deepcopy(frame) == frame
+    assert pickle.loads(pickle.dumps(frame)) == frame
+
+
+def test_memoryview_in_immutable_structure():
+    buffer = bytearray(b"0123456789")
+    blob = Blob(data=memoryview(buffer))
+    buffer[0] = ord("x")
+    assert blob.data == b"0123456789"
+    data = b"abc"
+    assert Blob(data=data).data.obj is data
+    assert deepcopy(blob) == blob
+    assert pickle.loads(pickle.dumps(blob)) == blob
+
+
+def test_serialization():
+    attachment = Attachment(name="a.png", content=b"\x89PNG...")
+    serialized = {"name": "a.png", "content": "iVBORy4uLg=="}
+    assert serialize(attachment) == serialized
+    assert Deserializer(Attachment).deserialize(serialized) == attachment
+    blob = Deserializer(Blob).deserialize({"data": "iVBORy4uLg=="})
+    assert blob.data == b"\x89PNG..."
+    assert type(Attachment.content.deserialize("iVBORy4uLg==")) is bytes
+
+
+def test_large_base64():
+    data = bytes(range(256)) * 2000 + b"x"
+    encoded = encode_base64(data)
+    assert encoded == encode_base64(memoryview(data))
+    assert decode_base64(encoded) == data
+    assert decode_base64("") == b""
+    for invalid in ["abc", "ab=c", "a\nbc", "ab\u00e9c"]:
+        with raises(ValueError):
+            decode_base64(invalid)
+
+
+def test_invalid_err():
+    with raises(ValueError) as excinfo:
+        Attachment(content=b"")
+    assert "content: Expected a minimum length of 1; Got 0 bytes" in str(excinfo.value)
+    with raises(ValueError) as excinfo:
+        Attachment(content=b"x" * 21)
+    assert "content: Expected a maximum length of 20; Got 21 bytes" in str(
+        excinfo.value
+    )
+    with raises(TypeError) as excinfo:
+        Attachment(content="abc")
+    assert "content: Got 'abc'; Expected bytes" in str(excinfo.value)
+    with raises(TypeError):
+        Attachment(content=5)
+    with raises(ValueError) as excinfo:
+        Deserializer(Attachment).deserialize({"content": "not base64!"})
+    assert "Expected a base64 string" in str(excinfo.value)
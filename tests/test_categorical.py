@@ -0,0 +1,102 @@
+import pickle
+
+from pytest import raises
+
+from typedpy import (
+    Categorical,
+    Deserializer,
+    Structure,
+    TypedPyDefaults,
+    deserialize_binary,
+    from_columns,
+    serialize_binary,
+    to_columns,
+)
+
+
+class Shipment(Structure):
+    country: Categorical(categories=["US", "UK"], pattern="[A-Z]{2}$")
+    status: Categorical
+
+    _required = []
+
+
+def _new_str(value: str) -> str:
+    return "".join(list(value))
+
+
+def test_values_are_interned():
+    first = Shipment(country=_new_str("FR"), status=_new_str("shipped"))
+    second = Deserializer(Shipment).deserialize({"country": _new_str("FR")})
+    assert first.country == "FR"
+    assert first.country is second.country
+    TypedPyDefaults.safe_trusted_instantiation = True
+    try:
+        trusted = Shipment.from_trusted_data(country=_new_str("FR"))
+        assert trusted.country is first.country
+    finally:
+        TypedPyDefaults.safe_trusted_instantiation = False
+    assert pickle.loads(pickle.dumps(first)).country is first.country
+
+
+def test_codes():
+    country = Shipment.get_all_fields_by_name()["country"]
+    assert country.code_of("UK") == 1
+    assert country.category(0) == "US"
+    assert country.categories[:2] == ("US", "UK")
+    with raises(ValueError):
+        country.category(1000)
+
+
+def test_validation_err():
+    with raises(ValueError) as excinfo:
+        Shipment(country="usa")
+    assert "country: Got 'usa'; Does not match regular expression" in str(
+        excinfo.value
+    )
+    with raises(TypeError):
+        Shipment(country=5)
+
+
+def test_max_categories_err():
+    class Task(Structure):
+        status: Categorical(max_categories=2)
+
+    Task(status="new")
+    Task(status="done")
+    Task(status="new")
+    with raises(ValueError) as excinfo:
+        Task(status="lost")
+    assert "status: Got 'lost'; Expected at most 2 categories" in str(excinfo.value)
+
+
+def test_binary_and_columns():
+    shipments = [Shipment(country="UK"), Shipment(country="DE")]
+    for shipment in shipments:
+        data = serialize_binary(shipment)
+        assert deserialize_binary(Shipment, data) == shipment
+    assert len(serialize_binary(shipments[0])) < len(serialize_binary(shipments[1]))
+    country = Shipment.get_all_fields_by_name()["country"]
+    columns = to_columns(shipments, ["country"], enum_codes=True)
+    assert columns == {"country": [1, country.code_of("DE")]}
+    assert from_columns(Shipment, columns, enum_codes=True) == shipments
+
+
+def test_max_interned():
+    class Event(Structure):
+        name: Categorical(categories=["start"], max_interned=2)
+
+    first = Event(name=_new_str("stop"))
+    assert Event(name=_new_str("stop")).name is first.name
+    many = [Event(name=_new_str("other")) for _ in range(2)]
+    assert many[0].name == many[1].name == "other"
+    assert many[0].name is not many[1].name
+    name = Event.get_all_fields_by_name()["name"]
+    assert name.categories == ("start", "stop")
+    assert name.find_code("other") is None
+    with raises(ValueError) as excinfo:
+        name.code_of("other")
+    assert "name: Got 'other'; Expected one of the 2 interned categories" in str(
+        excinfo.value
+    )
+    assert deserialize_binary(Event, serialize_binary(many[0])) == many[0]
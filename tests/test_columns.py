@@ -0,0 +1,161 @@
+from pytest import raises
+
+from typedpy import (
+    Array,
+    Enum,
+    ImmutableStructure,
+    Integer,
+    String,
+    Structure,
+    from_columns,
+    to_columns,
+)
+
+
+class Location(Structure):
+    city: String
+    zip_code: Integer
+
+    _required = ["city"]
+
+
+class Member(Structure):
+    name: String
+    role: Enum["admin", "user"]
+    age: Integer(minimum=0)
+    location: Location
+
+    _required = ["name"]
+
+
+def _members():
+    return [
+        Member(name="john", role="admin", age=30, location=Location(city="Paris")),
+        Member(name="jane", role="user"),
+    ]
+
+
+def test_round_trip():
+    columns = to_columns(_members())
+    assert columns == {
+        "name": ["john", "jane"],
+        "role": ["admin", "user"],
+        "age": [30, None],
+        "location.city": ["Paris", None],
+        "location.zip_code": [None, None],
+    }
+    assert from_columns(Member, columns) == _members()
+    assert from_columns(Member, columns, direct_trusted_mapping=True) == _members()
+
+
+def test_selected_fields():
+    columns = to_columns(_members(), ["name", "location.city"])
+    assert columns == {"name": ["john", "jane"], "location.city": ["Paris", None]}
+    assert from_columns(Member, columns) == [
+        Member(name="john", location=Location(city="Paris")),
+        Member(name="jane"),
+    ]
+
+
+def test_enum_codes_and_column_factory():
+    columns = to_columns(
+        _members(), ["name", "role"], enum_codes=True, column_factory=tuple
+    )
+    assert columns == {"name": ("john", "jane"), "role": (0, 1)}
+    assert from_columns(Member, columns, enum_codes=True) == [
+        Member(name="john", role="admin"),
+        Member(name="jane", role="user"),
+    ]
+
+
+def test_empty():
+    assert to_columns([], ["name"]) == {"name": []}
+    assert from_columns(Member, {"name": []}) == []
+
+
+def test_mixed_classes_err():
+    with raises(TypeError) as excinfo:
+        to_columns([Member(name="john"), Location(city="Paris")])
+    assert "Expected all the structures to be of class Member" in str(excinfo.value)
+
+
+def test_invalid_columns_err():
+    with raises(ValueError) as excinfo:
+        from_columns(Member, {"name": ["john"], "age": [1, 2]})
+    assert "Member: Expected all the columns to have the same length" in str(
+        excinfo.value
+    )
+    with raises(ValueError) as excinfo:
+        from_columns(Member, {"age": [1]})
+    assert "Member: missing required columns: ['name']" in str(excinfo.value)
+    with raises(ValueError) as excinfo:
+        from_columns(Member, {"name": ["john"], "name.x": [1]})
+    assert "name.x: name is not a Structure" in str(excinfo.value)
+    with raises(ValueError) as excinfo:
+        from_columns(Member, {"name": ["john"], "role": [5]}, enum_codes=True)
+    assert "role: Got 5; Expected an Enum code" in str(excinfo.value)
+
+
+def test_invalid_row_err():
+    with raises(ValueError) as excinfo:
+        from_columns(Member, {"name": ["john", "jane"], "age": [1, -1]})
+    assert "row 1: Member.age: Got -1; Expected a minimum of 0" in str(excinfo.value)
+
+
+def test_row_error_with_custom_exception_class():
+    class Undecodable(Structure):
+        name: String
+
+        def __validate__(self):
+            raise UnicodeDecodeError("utf-8", b"\xff", 0, 1, "invalid start byte")
+
+    with raises(ValueError) as excinfo:
+        from_columns(Undecodable, {"name": ["x"]})
+    assert str(excinfo.value).startswith("row 0: 'utf-8' codec")
+
+
+class Team(Structure):
+    name: String
+    scores: Array[Integer]
+    level: Integer = 1
+
+    _required = ["name"]
+
+    def __validate__(self):
+        if self.name == "invalid":
+            raise ValueError("invalid team")
+
+
+def test_created_instances_are_validated_and_updatable():
+    teams = from_columns(Team, {"name": ["a", "b"], "scores": [[1, 2], None]})
+    assert teams == [Team(name="a", scores=[1, 2]), Team(name="b")]
+    assert teams[1].level == 1
+    assert not teams[0].used_trusted_instantiation()
+
+    teams[0].scores.append(3)
+    assert teams[0].scores == [1, 2, 3]
+    with raises(TypeError):
+        teams[0].scores.append("x")
+    with raises(TypeError):
+        teams[0].level = "x"
+
+
+def test_row_err_from_validate_and_missing_values():
+    with raises(ValueError) as excinfo:
+        from_columns(Team, {"name": ["a", "invalid"]})
+    assert "row 1: invalid team" in str(excinfo.value)
+
+    with raises(TypeError) as excinfo:
+        from_columns(Team, {"name": ["a", None]})
+    assert "row 1: Team: missing a required argument: 'name'" in str(excinfo.value)
+
+
+def test_immutable_class():
+    class Point(ImmutableStructure):
+        x: Integer
+        y: Array[Integer]
+
+    points = from_columns(Point, {"x": [1, 2], "y": [[1], [2]]})
+    assert points == [Point(x=1, y=[1]), Point(x=2, y=[2])]
+    with raises(ValueError):
+        points[0].y.append(3)
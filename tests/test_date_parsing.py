@@ -0,0 +1,140 @@
+from datetime import date, datetime, time, timedelta, timezone
+
+from pytest import raises
+
+from typedpy import (
+    DateField,
+    DateString,
+    DateTime,
+    Deserializer,
+    Structure,
+    TimeString,
+    serialize,
+)
+from typedpy.extfields import TimeField
+from typedpy.extfields.date_parsing import (
+    get_date_parser,
+    get_datetime_parser,
+    get_formatter,
+    get_time_parser,
+)
+
+
+def test_parsers_match_strptime():
+    cases = [
+        ("%Y-%m-%d", "2020-01-31"),
+        ("%Y-%m-%d", "2020-1-31"),
+        ("%Y-%m-%dT%H:%M:%S", "2020-01-31T07:15:45"),
+        ("%Y-%m-%d %H:%M:%S", "2020-01-31 07:15:45"),
+        ("%m/%d/%y %H:%M:%S", "01/31/20 07:15:45"),
+        ("%m/%d/%y %H:%M:%S", "1/31/99 7:15:45"),
+        ("%d.%m.%Y %H:%M:%S.%f", "31.01.2020 07:15:45.123"),
+        ("%Y%m%d", "20200131"),
+        ("%b %d %Y", "Jan 31 2020"),
+    ]
+    for fmt, value in cases:
+        expected = datetime.strptime(value, fmt)
+        assert get_datetime_parser(fmt)(value) == expected
+        assert get_date_parser(fmt)(value) == expected.date()
+    assert get_time_parser("%H:%M:%S")("07:15:45") == time(7, 15, 45)
+    assert get_time_parser("%H:%M")("7:15") == time(7, 15)
+
+
+def test_parsers_errors_match_strptime():
+    for fmt, value in [
+        ("%Y-%m-%d", "2020-02-30"),
+        ("%Y-%m-%d", "2020-01-31 "),
+        ("%Y-%m-%dT%H:%M:%S", "2020-01-31T07:15:45+00:00"),
+        ("%m/%d/%y %H:%M:%S", "13/31/20 07:15:45"),
+        ("%H:%M:%S", "25:00:00"),
+    ]:
+        with raises(ValueError) as expected:
+            datetime.strptime(value, fmt)
+        with raises(ValueError) as excinfo:
+            get_datetime_parser(fmt)(value)
+        assert str(excinfo.value) == str(expected.value)
+
+
+def test_formatters_match_strftime():
+    values = [
+        datetime(2020, 1, 31, 7, 15, 45, 123),
+        datetime(999, 1, 31),
+        date(2020, 1, 31),
+        time(7, 15, 45, 123),
+    ]
+    for fmt in ["%Y-%m-%d", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M:%S", "%H:%M:%S"]:
+        for value in values:
+            assert get_formatter(fmt)(value) == value.strftime(fmt)
+
+
+def test_fields_errors():
+    class Foo(Structure):
+        d: DateField
+        t: TimeField
+        ds: DateString
+        ts: TimeString
+        _required = []
+
+    with raises(ValueError) as excinfo:
+        Foo(d="2020-02-30")
+    assert "d: Got '2020-02-30'; day is out of range for month" in str(excinfo.value)
+    with raises(ValueError) as excinfo:
+        Foo(t="7:15")
+    assert "t: Got '7:15'; time data '7:15' does not match format '%H:%M:%S'" in str(
+        excinfo.value
+    )
+    with raises(ValueError) as excinfo:
+        Foo(ds="2020-13-01")
+    assert "ds: Got '2020-13-01'; time data '2020-13-01' does not match format" in str(
+        excinfo.value
+    )
+    with raises(ValueError) as excinfo:
+        Foo(ts="24:00:00")
+    assert "ts: Got '24:00:00'; time data '24:00:00' does not match format" in str(
+        excinfo.value
+    )
+    assert Foo(ds="2020-1-1", ts="7:1:1").ds == "2020-1-1"
+
+
+def test_cache():
+    class Foo(Structure):
+        timestamp: DateTime(datetime_format="%Y-%m-%d %H:%M:%S", cache_size=10)
+        d: DateField(cache_size=10)
+        _required = []
+
+    foo1 = Foo(timestamp="2020-01-31 07:15:45", d="2020-01-31")
+    foo2 = Foo(timestamp="2020-01-31 07:15:45", d="2020-01-31")
+    assert foo1.timestamp is foo2.timestamp
+    assert foo1.d is foo2.d
+    assert foo1.timestamp == datetime(2020, 1, 31, 7, 15, 45)
+    with raises(ValueError):
+        Foo(d="2020-02-30")
+
+
+def test_store_epoch():
+    class Foo(Structure):
+        timestamp: DateTime(datetime_format="%Y-%m-%dT%H:%M:%S", store_epoch=True)
+
+    epoch = 1580454945
+    foo = Deserializer(Foo).deserialize({"timestamp": epoch})
+    assert foo.__dict__["timestamp"] == epoch
+    assert foo.timestamp == datetime(2020, 1, 31, 7, 15, 45)
+    assert serialize(foo) == {"timestamp": "2020-01-31T07:15:45"}
+    assert Foo(timestamp=datetime(2020, 1, 31, 7, 15, 45)) == foo
+    assert hash(Foo(timestamp=serialize(foo)["timestamp"])) == hash(foo)
+
+
+def test_store_epoch_round_trip():
+    class Foo(Structure):
+        timestamp: DateTime(store_epoch=True)
+
+    for value in [
+        datetime(2020, 1, 31, 7, 15, 45, 123456),
+        # a gap and a fold of daylight saving time in many time zones
+        datetime(2021, 3, 28, 2, 30),
+        datetime(2021, 10, 31, 1, 30, fold=1),
+    ]:
+        assert Foo(timestamp=value).timestamp == value
+    with raises(ValueError) as excinfo:
+        Foo(timestamp=datetime(2020, 1, 31, tzinfo=timezone(timedelta(hours=2))))
+    assert "Expected a naive datetime in UTC" in str(excinfo.value)
@@ -0,0 +1,112 @@
+import io
+import json
+
+import pytest
+from pytest import raises
+
+from typedpy import Array, Deserializer, Integer, String, Structure
+from typedpy.serialization.streaming import iter_json_array
+
+
+class Item(Structure):
+    id: Integer(minimum=0)
+    name: String
+    tags: Array[String]
+
+    _required = ["id", "name"]
+
+
+items = [{"id": i, "name": f"name-{i}", "tags": ["a", "b"]} for i in range(100)]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1024])
+def test_iter_deserialize_top_level_array(chunk_size):
+    f = io.StringIO(json.dumps(items))
+    result = list(Deserializer(Item).iter_deserialize(f, chunk_size=chunk_size))
+    assert result == [Item(**x) for x in items]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 1024])
+def test_iter_deserialize_from_binary_file_with_path(chunk_size):
+    doc = {
+        "meta": {"count": 2, "names": ["x", "y"]},
+        "data": {"before": [1, 2], "events": items[:3], "after": "ignored"},
+    }
+    f = io.BytesIO(json.dumps(doc, indent=2).encode("utf-8"))
+    result = list(
+        Deserializer(Item).iter_deserialize(
+            f, path="data.events", chunk_size=chunk_size
+        )
+    )
+    assert [x.id for x in result] == [0, 1, 2]
+
+
+def test_iter_deserialize_is_lazy():
+    f = io.StringIO(json.dumps(items))
+    it = Deserializer(Item).iter_deserialize(f, chunk_size=16)
+    assert next(it).id == 0
+    assert f.tell() < len(json.dumps(items))
+
+
+def test_iter_deserialize_empty_array():
+    assert list(Deserializer(Item).iter_deserialize(io.StringIO(" [ ] "))) == []
+
+
+def test_iter_deserialize_multibyte_characters_across_chunks():
+    content = [{"id": 1, "name": "שלום עולם"}]
+    f = io.BytesIO(json.dumps(content, ensure_ascii=False).encode("utf-8"))
+    result = list(Deserializer(Item).iter_deserialize(f, chunk_size=3))
+    assert result[0].name == "שלום עולם"
+
+
+def test_iter_deserialize_error_with_custom_exception_class():
+    class Strict(Structure):
+        name: String
+
+        def __validate__(self):
+            raise UnicodeDecodeError("utf-8", b"\xff", 0, 1, "invalid start byte")
+
+    with raises(ValueError) as excinfo:
+        list(Deserializer(Strict).iter_deserialize(io.StringIO('[{"name": "x"}]')))
+    assert "element 0: " in str(excinfo.value)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2])
+def test_iter_json_array_chunk_ends_inside_a_character(chunk_size):
+    content = ["é", "€ 😀", {"name": "ü"}]
+    f = io.BytesIO(json.dumps(content, ensure_ascii=False).encode("utf-8"))
+    assert list(iter_json_array(f, chunk_size=chunk_size)) == content
+
+
+def test_iter_deserialize_invalid_element_err():
+    content = [{"id": 1, "name": "a"}, {"id": -1, "name": "b"}]
+    it = Deserializer(Item).iter_deserialize(io.StringIO(json.dumps(content)))
+    assert next(it).id == 1
+    with raises(ValueError) as excinfo:
+        next(it)
+    assert "element 1: id: Got -1; Expected a minimum of 0" in str(excinfo.value)
+
+
+def test_iter_json_array_numbers_split_between_chunks():
+    assert list(iter_json_array(io.StringIO("[12345, 678.5,9]"), chunk_size=2)) == [
+        12345,
+        678.5,
+        9,
+    ]
+
+
+def test_iter_json_array_not_an_array_err():
+    with raises(ValueError) as excinfo:
+        list(iter_json_array(io.StringIO('{"a": 1}')))
+    assert "Expected '['; Got '{'" in str(excinfo.value)
+
+
+def test_iter_json_array_path_not_found_err():
+    with raises(ValueError) as excinfo:
+        list(iter_json_array(io.StringIO('{"a": [1]}'), path="b"))
+    assert "key 'b' not found" in str(excinfo.value)
+
+
+def test_iter_json_array_truncated_input_err():
+    with raises(ValueError):
+        list(iter_json_array(io.StringIO('[{"a": 1}, {"a": '), chunk_size=4))
@@ -1,3 +1,4 @@
+import copy
 import sys
 from typing import Optional
 
@@ -17,6 +18,7 @@ from typedpy import (
     convert_dict,
 )
 from typedpy import Deleted
+from typedpy.serialization.versioned_mapping import get_versions_converter
 
 
 class Bar(ImmutableStructure):
@@ -122,6 +124,92 @@ def test_version_conversion_without_deserializer():
     )
 
 
+def test_version_conversion_does_not_modify_input():
+    original = copy.deepcopy(in_version_1)
+    converted = convert_dict(in_version_1, Foo._versions_mapping)
+    assert in_version_1 == original
+    converted["bar"]["a"].append(1)
+    assert in_version_1 == original
+
+
+def test_version_conversion_shares_untouched_subtrees():
+    class Example(Versioned):
+        big: Map[String, Array[Integer]]
+        i: int
+
+        _versions_mapping = [
+            {"i": Constant(1)},
+            {"i": FunctionCall(func=lambda x: x + 1)},
+        ]
+
+    big = {str(i): [i] for i in range(100)}
+    converted = convert_dict({"version": 1, "big": big}, Example._versions_mapping)
+    assert converted == {"version": 3, "big": big, "i": 2}
+    assert converted["big"] is big
+
+
+def test_versions_are_composed_into_one_mapping():
+    calls = []
+
+    def double(x):
+        calls.append(x)
+        return x * 2
+
+    versions_mapping = [
+        {"a": "b", "b": "a"},
+        {"c": FunctionCall(func=double, args=["a"])},
+        {"d": "c", "c": Deleted},
+        {"e": "d", "nested._mapper": {"x": "y"}},
+        {"nested._mapper": {"y": Deleted}},
+    ]
+    converted = convert_dict(
+        {"version": 1, "a": 1, "b": 2, "nested": [{"y": 1}, {"y": 2}]},
+        versions_mapping,
+    )
+    assert converted == {
+        "version": 6,
+        "a": 2,
+        "b": 2,
+        "d": 4,
+        "e": 4,
+        "nested": [{"x": 1}, {"x": 2}],
+    }
+    assert calls == [2]
+
+def test_version_converter_is_cached_per_start_version():
+    assert get_versions_converter(Foo, 1) is get_versions_converter(Foo, 1)
+    assert get_versions_converter(Foo, 2) is not get_versions_converter(Foo, 1)
+    assert get_versions_converter(Foo, 2)(in_version_2) == convert_dict(
+        in_version_2, Foo._versions_mapping
+    )
+
+
+def test_version_converter_cache_is_bounded():
+    from typedpy.serialization.versioned_mapping import _converters_by_class
+
+    get_versions_converter(Foo, 4)
+    size = len(_converters_by_class)
+    for version in [5, 6, 1000, 0, -1, "x"]:
+        get_versions_converter(Foo, version)
+    assert len(_converters_by_class) == size
+    assert get_versions_converter(Foo, 1000) is get_versions_converter(Foo, 4)
+    assert get_versions_converter(Foo, 1000)({"version": 1000}) == {"version": 1000}
+
+
+def test_version_conversion_of_missing_nested_content():
+    converted = convert_dict(
+        {"version": 2, "i": 1, "j": 2, "old_m": {}}, Foo._versions_mapping
+    )
+    assert converted == {
+        "version": 4,
+        "i": 100,
+        "j": 2,
+        "m": {},
+        "nested": None,
+        "bar": None,
+    }
+
+
 def test_deserialize_versioned_mapper_defect():
     class FooBar(ImmutableStructure):
         data = String
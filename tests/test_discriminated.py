@@ -0,0 +1,201 @@
+import datetime
+
+from pytest import raises
+
+from typedpy import (
+    Array,
+    DateField,
+    Deserializer,
+    Discriminated,
+    FastSerializable,
+    HasTypes,
+    Map,
+    String,
+    Structure,
+    create_serializer,
+    serialize,
+)
+from typedpy.serialization import discriminated
+
+
+class Created(Structure):
+    id: str
+    date: DateField
+
+
+class Deleted(Structure):
+    id: str
+    reason: str
+
+
+class Renamed(Structure):
+    id: str
+    kind: str
+    name: str
+
+
+def _event_field():
+    return Discriminated[
+        "kind", {"created": Created, "deleted": Deleted, "renamed": Renamed}
+    ]
+
+
+class Message(Structure):
+    events: Array[_event_field()]
+    last_event: _event_field()
+    _required = ["events"]
+
+
+def _payload():
+    return {
+        "events": [
+            {"kind": "created", "id": "1", "date": "2020-01-31"},
+            {"kind": "deleted", "id": "1", "reason": "spam"},
+        ],
+        "last_event": {"kind": "renamed", "id": "2", "name": "john"},
+    }
+
+
+def _message():
+    return Message(
+        events=[
+            Created(id="1", date=datetime.date(2020, 1, 31)),
+            Deleted(id="1", reason="spam"),
+        ],
+        last_event=Renamed(id="2", kind="renamed", name="john"),
+    )
+
+
+def test_deserialize():
+    assert Deserializer(Message).deserialize(_payload()) == _message()
+
+
+def test_deserialize_trusted():
+    assert (
+        Deserializer(Message).deserialize(_payload(), direct_trusted_mapping=True)
+        == _message()
+    )
+    message = Deserializer(Message).deserialize(
+        {"events": [{"kind": "deleted", "id": "1", "reason": 5}]},
+        direct_trusted_mapping=True,
+    )
+    assert message.events[0].used_trusted_instantiation()
+    assert message.events[0].reason == 5
+
+
+def test_serialize():
+    assert serialize(_message()) == _payload()
+
+
+def test_fast_serialization():
+    class FastMessage(Structure, FastSerializable):
+        events: Array[_event_field()]
+        event_by_id: Map[String, _event_field()]
+
+    create_serializer(FastMessage)
+    message = FastMessage(
+        events=[Deleted(id="1", reason="spam")],
+        event_by_id={"1": Deleted(id="1", reason="spam")},
+    )
+    assert message.serialize() == {
+        "events": [{"kind": "deleted", "id": "1", "reason": "spam"}],
+        "event_by_id": {"1": {"kind": "deleted", "id": "1", "reason": "spam"}},
+    }
+
+
+def test_unknown_discriminator_value_err():
+    with raises(ValueError) as excinfo:
+        Deserializer(Message).deserialize({"events": [{"kind": "updated", "id": "1"}]})
+    assert "kind: Got 'updated'; Expected one of ['created', 'deleted', 'renamed']" in str(
+        excinfo.value
+    )
+
+
+def test_invalid_content_err():
+    with raises(ValueError) as excinfo:
+        Deserializer(Message).deserialize(
+            {"events": [{"kind": "created", "id": "1", "date": "xyz"}]}
+        )
+    assert "events_0: date: Got 'xyz'; time data 'xyz' does not match format" in str(
+        excinfo.value
+    )
+
+
+def test_wrong_class_err():
+    class Other(Structure):
+        id: str
+
+    with raises(TypeError) as excinfo:
+        Message(events=[Other(id="1")])
+    assert (
+        "events_0: Expected an instance of one of ['Created', 'Deleted', 'Renamed']; Got Other"
+        in str(excinfo.value)
+    )
+
+
+def test_from_has_types():
+    class Employee(Structure, HasTypes):
+        name: str
+
+    class Engineer(Employee):
+        pass
+
+    class Firm(Structure):
+        employees: Array[Discriminated[Employee]]
+
+    class Sales(Employee):
+        pass
+
+    serialized = {
+        "employees": [
+            {"type": "engineer", "name": "john"},
+            {"type": "sales", "name": "joe"},
+            {"type": "employee", "name": "jane"},
+        ]
+    }
+    firm = Deserializer(Firm).deserialize(serialized)
+    assert firm.employees == [
+        Engineer(name="john"),
+        Sales(name="joe"),
+        Employee(name="jane"),
+    ]
+    assert serialize(firm) == serialized
+
+
+def test_unknown_value_does_not_rescan_subclasses(monkeypatch):
+    class Animal(Structure, HasTypes):
+        name: str
+
+    class Zoo(Structure):
+        animal: Discriminated[Animal]
+
+    scans = []
+    original = discriminated._all_subclasses
+    monkeypatch.setattr(
+        discriminated,
+        "_all_subclasses",
+        lambda cls: scans.append(cls) or original(cls),
+    )
+    for _ in range(3):
+        with raises(ValueError):
+            Deserializer(Zoo).deserialize({"animal": {"type": "cat", "name": "x"}})
+    assert not scans
+
+    class Cat(Animal):
+        pass
+
+    zoo = Deserializer(Zoo).deserialize({"animal": {"type": "cat", "name": "x"}})
+    assert zoo.animal == Cat(name="x")
+
+
+def test_invalid_definition_err():
+    with raises(TypeError) as excinfo:
+        Discriminated[Created]
+    assert "Expected a Structure class that inherits from HasTypes" in str(
+        excinfo.value
+    )
+    with raises(TypeError) as excinfo:
+        Discriminated["kind", {"a": str}]
+    assert "Discriminated: Expected a Structure class; Got <class 'str'>" in str(
+        excinfo.value
+    )
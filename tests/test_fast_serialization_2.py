@@ -44,7 +44,9 @@ from typedpy import (
     FunctionCall,
     Deserializer,
     DateTime,
+    DoNotSerialize,
 )
+from typedpy.structures.structures import failed_to_create_fast_serializer
 
 
 class SimpleStruct(Structure, FastSerializable):
@@ -375,22 +377,25 @@ def test_serialize_with_camel_case_setting(no_defensive_copy_on_get):
     }
 
 
-def test_serialize_with_mapper_with_functions_not_supported(no_defensive_copy_on_get):
+def test_serialize_with_mapper_with_functions(no_defensive_copy_on_get):
+    def my_func():
+        pass
+
     class Foo(Structure, FastSerializable):
         function = Function
         i = Integer
+        j = Integer
 
         _serialization_mapper = {
             "function": FunctionCall(func=lambda f: f.__name__),
-            "i": FunctionCall(func=lambda x: x + 5),
+            "i": FunctionCall(func=lambda x, y: x + y, args=["i", "j"]),
+            "j": DoNotSerialize,
         }
 
-    with raises(ValueError) as excinfo:
-        create_serializer(Foo)
-
-    assert "Function mappers are not supported in fast serialization" in str(
-        excinfo.value
-    )
+    create_serializer(Foo)
+    foo = Foo(function=my_func, i=5, j=3)
+    assert Foo.serialize(foo) == {"function": "my_func", "i": 8}
+    assert not getattr(Foo, failed_to_create_fast_serializer, False)
 
 
 def test_enum_serialization_returns_string_name(no_defensive_copy_on_get):
@@ -1,5 +1,7 @@
 import enum
 import sys
+from collections import deque
+from decimal import Decimal
 from typing import Optional
 
 from pytest import mark
@@ -38,6 +40,11 @@ from typedpy import (
     serialize,
     Deserializer,
     Serializer,
+    Constant,
+    DecimalNumber,
+    Deque,
+    Tuple,
+    Versioned,
 )
 
 
@@ -236,3 +243,95 @@ def test_optional_fastserializable(no_defensive_copy_on_get, allow_none_for_opti
         Foo(s1=None, s="xxx", arr=[None, Bar(i=5), None])
     ).serialize()
     assert serialized == {"s": "xxx", "arr": [None, {"i": 5}, None]}
+
+
+def test_serialize_collections_of_structures(no_defensive_copy_on_get):
+    class Bar(Structure, FastSerializable):
+        i: int
+
+    class Foo(Structure, FastSerializable):
+        m: Map[String, Bar]
+        t: Tuple[Integer, Bar]
+        d: Deque[Bar]
+
+    foo = Foo(m={"a": Bar(i=1)}, t=(2, Bar(i=3)), d=deque([Bar(i=4)]))
+    assert serialize(foo) == {"m": {"a": {"i": 1}}, "t": [2, {"i": 3}], "d": [{"i": 4}]}
+    assert getattr(Foo, created_fast_serializer)
+
+
+class NotFastBar(Structure):
+    i: int
+
+
+@mark.parametrize(
+    "field", [Map[String, NotFastBar], Tuple[Integer, NotFastBar], Deque[NotFastBar]]
+)
+def test_collections_of_non_fastserializable_err(field):
+    class Foo(Structure, FastSerializable):
+        value = field
+
+    with raises(TypeError) as excinfo:
+        create_serializer(Foo)
+    assert "NotFastBar is not FastSerializable" in str(excinfo.value)
+
+
+def test_serialize_decimal_like_slow_path(no_defensive_copy_on_get):
+    class Foo(Structure, FastSerializable):
+        d: DecimalNumber
+        n: Number
+
+    class SlowFoo(Structure):
+        d: DecimalNumber
+        n: Number
+
+    foo = Foo(d=Decimal("1.5"), n=Decimal("2.5"))
+    assert foo.serialize() == {"d": 1.5, "n": "2.5"}
+    assert foo.serialize() == serialize(SlowFoo(d=Decimal("1.5"), n=Decimal("2.5")))
+
+
+def test_serialize_nested_decimal_like_slow_path(no_defensive_copy_on_get):
+    class Foo(Structure, FastSerializable):
+        u: AnyOf[Number, String]
+        a: Array[Number]
+        m: Map[String, Number]
+
+    class SlowFoo(Structure):
+        u: AnyOf[Number, String]
+        a: Array[Number]
+        m: Map[String, Number]
+
+    values = dict(u=Decimal("1.5"), a=[Decimal("2.5"), 3], m={"x": Decimal("4.5")})
+    assert Foo(**values).serialize() == {"u": "1.5", "a": ["2.5", 3], "m": {"x": "4.5"}}
+    assert Foo(**values).serialize() == serialize(SlowFoo(**values))
+
+
+def test_serialize_versioned(no_defensive_copy_on_get):
+    class Foo(Versioned, FastSerializable):
+        i: int
+
+        _versions_mapping = [{"i": Constant(1)}]
+
+    assert serialize(Foo(i=5)) == {"version": 2, "i": 5}
+    assert getattr(Foo, created_fast_serializer)
+
+
+def test_serialize_additional_serialization(no_defensive_copy_on_get):
+    class Foo(Structure, FastSerializable):
+        i: int
+
+        def _additional_serialization(self) -> dict:
+            return {"double": self.i * 2, "lazy": lambda: "computed"}
+
+    assert Foo(i=2).serialize() == {"i": 2, "double": 4, "lazy": "computed"}
+
+
+def test_serialize_additional_serialization_must_be_dict(no_defensive_copy_on_get):
+    class Foo(Structure, FastSerializable):
+        i: int
+
+        def _additional_serialization(self):
+            return [1]
+
+    with raises(TypeError) as excinfo:
+        Foo(i=2).serialize()
+    assert "_additional_serialization must return a dict" in str(excinfo.value)
@@ -4,8 +4,10 @@ from pytest import raises
 
 from typedpy import (
     FastSerializable,
+    Integer,
     ImmutableStructure,
     OneOf,
+    String,
     Structure,
     create_serializer,
     serialize,
@@ -28,28 +30,53 @@ create_serializer(Foo1)
 create_serializer(Foo2)
 
 
-def test_fastserializable_AnyOf_unsupported():
+def test_fastserializable_AnyOf():
     class Bar(Structure, FastSerializable):
         foo: Union[Foo1, Foo2]
+        foos: list[Union[Foo1, Foo2, int, None]]
 
-    with raises(TypeError) as excinfo:
-        create_serializer(Bar)
-    assert (
-        "AnyOf(i.e. Union) is not FastSerializable when it can be multiple types"
-        in str(excinfo.value)
-    )
+    create_serializer(Bar)
+    bar = Bar(foo=Foo2(foo2="x"), foos=[Foo1(foo1="a"), 5, Foo2(foo2="b"), None])
+    assert bar.serialize() == {
+        "foo": {"foo2": "x"},
+        "foos": [{"foo1": "a"}, 5, {"foo2": "b"}, None],
+    }
+    assert Bar.serialize(Bar(foo=Foo1(foo1="y"), foos=[])) == {
+        "foo": {"foo1": "y"},
+        "foos": [],
+    }
 
 
-def test_fastserializable_OneOf_unsupported():
+def test_fastserializable_OneOf():
     class Bar(Structure, FastSerializable):
         foo: OneOf[Foo1, Foo2]
+        i: OneOf[Integer(maximum=5), String, Integer(minimum=10)]
+
+    create_serializer(Bar)
+    assert Bar(foo=Foo1(foo1="x"), i=12).serialize() == {"foo": {"foo1": "x"}, "i": 12}
+    assert Bar(foo=Foo2(foo2="y"), i="a").serialize() == {"foo": {"foo2": "y"}, "i": "a"}
+
+
+def test_fastserializable_union_with_non_fastserializable_option_err():
+    class Foo3(Structure):
+        foo3: str
+
+    class Bar(Structure, FastSerializable):
+        foo: Union[Foo1, Foo3]
 
     with raises(TypeError) as excinfo:
         create_serializer(Bar)
-    assert (
-        "<OneOf [<ClassReference: Foo1>, <ClassReference: Foo2>]> Field is not FastSerializable"
-        in str(excinfo.value)
-    )
+    assert "Foo3 is not FastSerializable" in str(excinfo.value)
+
+
+def test_union_is_serialized_in_fast_path():
+    class Bar(Structure, FastSerializable):
+        foo: Union[Foo1, Foo2, str]
+
+    assert serialize(Bar(foo=Foo2(foo2="x"))) == {"foo": {"foo2": "x"}}
+    assert serialize(Bar(foo="abc")) == {"foo": "abc"}
+    assert getattr(Bar, created_fast_serializer)
+    assert not getattr(Bar, failed_to_create_fast_serializer, False)
 
 
 def test_fastserializable_optional():
@@ -0,0 +1,142 @@
+import pytest
+from pytest import raises
+
+from typedpy import (
+    Array,
+    Deserializer,
+    FastSerializable,
+    FunctionCall,
+    Integer,
+    Map,
+    String,
+    Structure,
+    get_masked_serializer,
+    mappers,
+    serialize,
+)
+
+
+class Employee(Structure):
+    first_name: String
+    last_name: String
+    salary: Integer
+
+    _serialization_mapper = mappers.TO_CAMELCASE
+
+
+class Department(Structure):
+    name: String
+    budget: Integer
+    manager: Employee
+    employees: Array[Employee]
+    employee_by_id: Map[String, Employee]
+
+    _serialization_mapper = {
+        "budget": FunctionCall(func=lambda x: x * 1000),
+        "name": "title",
+    }
+
+
+class FastEmployee(Employee, FastSerializable):
+    pass
+
+
+def _department():
+    employees = [
+        Employee(first_name=f"f{i}", last_name=f"l{i}", salary=i) for i in range(3)
+    ]
+    return Department(
+        name="rnd",
+        budget=5,
+        manager=employees[0],
+        employees=employees,
+        employee_by_id={str(i): e for i, e in enumerate(employees)},
+    )
+
+
+def test_serialize_top_level_fields():
+    department = _department()
+    assert serialize(department, fields=["name", "budget"]) == {
+        "title": "rnd",
+        "budget": 5000,
+    }
+
+
+def test_serialize_whole_nested_field_like_regular_serialization():
+    department = _department()
+    full = serialize(department)
+    assert serialize(department, fields=["employees", "manager"]) == {
+        "employees": full["employees"],
+        "manager": full["manager"],
+    }
+
+
+def test_serialize_nested_paths():
+    department = _department()
+    assert serialize(
+        department,
+        fields=["employees.first_name", "manager.salary", "employee_by_id.last_name"],
+    ) == {
+        "manager": {"salary": 0},
+        "employees": [{"firstName": "f0"}, {"firstName": "f1"}, {"firstName": "f2"}],
+        "employee_by_id": {
+            "0": {"lastName": "l0"},
+            "1": {"lastName": "l1"},
+            "2": {"lastName": "l2"},
+        },
+    }
+
+
+def test_other_fields_are_not_read():
+    class Exploding:
+        def __getattr__(self, item):
+            raise AssertionError("should not be read")
+
+    department = _department()
+    department.__dict__["employee_by_id"] = Exploding()
+    assert serialize(department, fields=["manager.first_name"]) == {
+        "manager": {"firstName": "f0"}
+    }
+
+
+def test_same_mask_compiles_once():
+    assert get_masked_serializer(
+        Department, ["name", "employees.salary"]
+    ) is get_masked_serializer(Department, ("employees.salary", "name"))
+
+
+def test_fast_serializable_with_mask():
+    employee = FastEmployee(first_name="a", last_name="b", salary=3)
+    assert employee.serialize() == serialize(employee)
+    assert employee.serialize(fields=["last_name"]) == {"lastName": "b"}
+
+
+def test_mask_with_lazy_deserialization_reads_only_masked_fields():
+    serialized = serialize(_department())
+    serialized["employees"][1]["salary"] = "invalid"
+    department = Deserializer(Department).deserialize(serialized, lazy=True)
+    assert serialize(department, fields=["manager.last_name"]) == {
+        "manager": {"lastName": "l0"}
+    }
+
+
+@pytest.mark.parametrize(
+    "fields, message",
+    [
+        (["xyz"], "Field mask: 'xyz' is not a field of Department"),
+        (["manager.xyz"], "Field mask: 'xyz' is not a field of Employee"),
+        (
+            ["name.x"],
+            "Field mask: 'name' of Department is not a Structure or a collection of Structures",
+        ),
+    ],
+)
+def test_invalid_mask_err(fields, message):
+    with raises(TypeError) as excinfo:
+        serialize(_department(), fields=fields)
+    assert message in str(excinfo.value)
+
+
+def test_mask_of_non_structure_err():
+    with raises(TypeError):
+        serialize([1, 2], fields=["x"])
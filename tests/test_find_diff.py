@@ -1,6 +1,6 @@
 import sys
 from pytest import mark
-from typedpy import Array, Map, Set, Structure
+from typedpy import Array, ImmutableStructure, Map, Set, Structure, serialize
 from typedpy.testing import find_diff
 
 
@@ -321,3 +321,15 @@ def test_find_diff_list_different_length():
 #
 #     assert bar1 == bar2
 #
+
+
+def test_find_diff_ignores_internal_bookkeeping():
+    class Location(ImmutableStructure):
+        city: str
+        _cache_serialization = True
+
+    cached = Location(city="Paris")
+    serialize(cached)
+    assert "_serialization_cache" in cached.__dict__
+    assert find_diff(cached, Location(city="Paris")) == {}
+    assert find_diff(Location(city="Paris"), cached) == {}
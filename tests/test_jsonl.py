@@ -0,0 +1,153 @@
+import gzip
+import io
+import json
+
+import pytest
+from pytest import raises
+
+from typedpy import (
+    Array,
+    Integer,
+    String,
+    Structure,
+    mappers,
+    read_jsonl,
+    write_jsonl,
+)
+
+
+class Bar(Structure):
+    x: Integer
+    values: Array[String]
+
+
+class Foo(Structure):
+    i: Integer(minimum=0)
+    first_name: String
+    bar: Bar
+
+    _serialization_mapper = mappers.TO_CAMELCASE
+
+
+foos = [
+    Foo(i=i, first_name=f"name{i}", bar=Bar(x=i * 2, values=["a", str(i)]))
+    for i in range(10)
+]
+
+
+def test_write_then_read_file(tmp_path):
+    path = str(tmp_path / "foos.jsonl")
+    assert write_jsonl(path, foos, lines_per_write=3) == 10
+    with open(path, encoding="utf-8") as f:
+        lines = f.read().splitlines()
+    assert len(lines) == 10
+    assert json.loads(lines[1]) == {
+        "i": 1,
+        "firstName": "name1",
+        "bar": {"x": 2, "values": ["a", "1"]},
+    }
+    assert list(read_jsonl(path, Foo)) == foos
+
+
+@pytest.mark.parametrize("path", ["foos.jsonl.gz", "foos.jsonl"])
+def test_gzip(tmp_path, path):
+    full_path = str(tmp_path / path)
+    compression = None if path.endswith(".gz") else "gzip"
+    write_jsonl(full_path, (f for f in foos), compression=compression)
+    with gzip.open(full_path, "rt") as f:
+        assert len(f.read().splitlines()) == 10
+    assert list(read_jsonl(full_path, Foo, compression=compression)) == foos
+
+
+def test_text_and_binary_file_objects():
+    text_file = io.StringIO()
+    write_jsonl(text_file, foos)
+    binary_file = io.BytesIO()
+    write_jsonl(binary_file, foos)
+    assert binary_file.getvalue().decode("utf-8") == text_file.getvalue()
+
+    text_file.seek(0)
+    binary_file.seek(0)
+    assert list(read_jsonl(text_file, Foo)) == foos
+    assert list(read_jsonl(binary_file, Foo)) == foos
+
+
+def test_read_with_reject_sink():
+    content = "\n".join(
+        [
+            '{"i": 1, "firstName": "a", "bar": {"x": 1, "values": []}}',
+            '{"i": -1, "firstName": "b", "bar": {"x": 1, "values": []}}',
+            "",
+            "not a json",
+            '{"i": 3, "firstName": "c", "bar": {"x": 1, "values": []}}',
+        ]
+    )
+    rejected = []
+    result = list(
+        read_jsonl(
+            io.StringIO(content),
+            Foo,
+            reject=lambda line_number, line, err: rejected.append((line_number, line)),
+        )
+    )
+    assert [f.i for f in result] == [1, 3]
+    assert rejected == [
+        (2, '{"i": -1, "firstName": "b", "bar": {"x": 1, "values": []}}'),
+        (4, "not a json"),
+    ]
+
+
+def test_read_aborts_on_invalid_line_by_default():
+    content = '{"i": 1, "firstName": "a", "bar": {"x": 1, "values": []}}\n{"i": 1}\n'
+    it = read_jsonl(io.StringIO(content), Foo)
+    assert next(it).i == 1
+    with raises(TypeError) as excinfo:
+        next(it)
+    assert str(excinfo.value).startswith("line 2: ")
+
+
+def test_read_invalid_json_err():
+    with raises(ValueError) as excinfo:
+        list(read_jsonl(io.StringIO("{]"), Foo))
+    assert str(excinfo.value).startswith("line 1: ")
+
+
+def test_read_invalid_utf8_err():
+    with raises(ValueError) as excinfo:
+        list(read_jsonl(io.BytesIO(b'{"i": "\xff"}\n'), Foo))
+    assert str(excinfo.value).startswith("line 1: 'utf-8' codec can't decode")
+
+
+def test_read_with_explicit_mapper():
+    content = '{"number": 5, "name": "x", "bar": {"x": 1, "values": []}}\n'
+    result = list(
+        read_jsonl(
+            io.StringIO(content),
+            Foo,
+            mapper={"i": "number", "first_name": "name"},
+        )
+    )
+    assert result[0].i == 5
+    assert result[0].first_name == "x"
+
+
+def test_read_with_strict_mapping():
+    content = '{"i": 5, "first_name": "x", "bar": {"x": 1, "values": []}}\n'
+    assert list(read_jsonl(io.StringIO(content), Foo))[0].i == 5
+    with raises(TypeError):
+        list(read_jsonl(io.StringIO(content), Foo, use_strict_mapping=True))
+
+
+def test_file_is_closed_when_reading_stops(tmp_path):
+    path = str(tmp_path / "foos.jsonl")
+    write_jsonl(path, foos)
+    reader = read_jsonl(path, Foo)
+    assert next(reader) == foos[0]
+    f = reader.gi_frame.f_locals["f"]
+    reader.close()
+    assert f.closed
+
+
+def test_invalid_compression_err():
+    with raises(ValueError):
+        write_jsonl(io.StringIO(), foos, compression="zip")
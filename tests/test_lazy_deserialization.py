@@ -0,0 +1,163 @@
+import pickle
+from copy import deepcopy
+
+import pytest
+from pytest import raises
+
+from typedpy import (
+    Array,
+    Deserializer,
+    ImmutableStructure,
+    Integer,
+    Map,
+    String,
+    Structure,
+    mappers,
+    serialize,
+)
+
+
+class Address(Structure):
+    street: String
+    zip_code: Integer(minimum=0)
+
+    _serialization_mapper = mappers.TO_CAMELCASE
+
+
+class Person(Structure):
+    id: Integer
+    name: String
+    address: Address
+    addresses: Array[Address]
+    address_by_name: Map[String, Address]
+
+    _required = ["id", "name", "address"]
+
+    def __validate__(self):
+        if self.address.zip_code == self.id:
+            raise ValueError("zip code cannot be the id")
+
+
+class ImmutablePerson(ImmutableStructure):
+    id: Integer
+    addresses: Array[Address]
+
+
+def _payload(**kw):
+    return {
+        "id": 1,
+        "name": "john",
+        "address": {"street": "main", "zipCode": 10},
+        "addresses": [{"street": "a", "zipCode": 11}],
+        "address_by_name": {"home": {"street": "b", "zipCode": 12}},
+        **kw,
+    }
+
+
+def test_lazy_fields_are_deserialized_on_first_access():
+    person = Deserializer(Person).deserialize(_payload(), lazy=True)
+    assert person.id == 1
+    assert "address" not in person.__dict__
+    assert person.address == Address(street="main", zip_code=10)
+    assert "address" in person.__dict__
+    assert "addresses" not in person.__dict__
+    assert person.addresses[0].zip_code == 11
+
+
+def test_materialize_equals_regular_deserialization():
+    person = Deserializer(Person).deserialize(_payload(), lazy=True)
+    assert person.materialize() is person
+    assert person == Deserializer(Person).deserialize(_payload())
+    assert "_lazy_fields" not in person.__dict__
+
+
+def test_top_level_is_validated_immediately():
+    with raises(TypeError) as excinfo:
+        Deserializer(Person).deserialize({"id": 1, "name": "john"}, lazy=True)
+    assert "missing a required argument: 'address'" in str(excinfo.value)
+
+    with raises(TypeError):
+        Deserializer(Person).deserialize(_payload(id="x"), lazy=True)
+
+
+def test_invalid_lazy_field_err_on_access():
+    payload = _payload(addresses=[{"street": "a", "zipCode": -1}])
+    person = Deserializer(Person).deserialize(payload, lazy=True)
+    assert person.address.street == "main"
+    for _ in range(2):
+        with raises(ValueError) as excinfo:
+            person.addresses
+        assert "zip_code: Got -1; Expected a minimum of 0" in str(excinfo.value)
+    with raises(ValueError):
+        person.materialize()
+
+
+def test_structure_validation_runs_once_all_fields_are_deserialized():
+    person = Deserializer(Person).deserialize(
+        _payload(address={"street": "main", "zipCode": 1}), lazy=True
+    )
+    assert person.name == "john"
+    with raises(ValueError) as excinfo:
+        person.materialize()
+    assert "zip code cannot be the id" in str(excinfo.value)
+    with raises(ValueError) as excinfo:
+        person.materialize()
+    assert "zip code cannot be the id" in str(excinfo.value)
+    with raises(ValueError):
+        serialize(person)
+
+
+def test_setting_lazy_field_overrides_it():
+    person = Deserializer(Person).deserialize(_payload(), lazy=True)
+    person.addresses = []
+    person.materialize()
+    assert person.addresses == []
+
+
+@pytest.mark.parametrize(
+    "operation",
+    [
+        serialize,
+        str,
+        deepcopy,
+        lambda p: pickle.loads(pickle.dumps(p)),
+    ],
+)
+def test_operations_on_whole_structure_materialize_it(operation):
+    person = Deserializer(Person).deserialize(_payload(), lazy=True)
+    expected = Deserializer(Person).deserialize(_payload())
+    assert operation(person) == operation(expected)
+    assert "_lazy_fields" not in person.__dict__
+
+
+def test_lazy_immutable():
+    person = Deserializer(ImmutablePerson).deserialize(
+        {"id": 1, "addresses": [{"street": "a", "zipCode": 11}]}, lazy=True
+    )
+    with raises(ValueError):
+        person.id = 2
+    assert person.addresses[0].street == "a"
+    with raises(ValueError) as excinfo:
+        person.addresses.append(Address(street="b", zip_code=1))
+    assert "is immutable" in str(excinfo.value)
+    with raises(ValueError):
+        person.id = 2
+
+
+def test_lazy_immutable_is_never_mutable_while_loading():
+    instantiated_while_loading = []
+
+    class ObservedAddress(Address):
+        def __validate__(self):
+            instantiated_while_loading.append(owner.__dict__["_instantiated"])
+
+    class ImmutableOwner(ImmutableStructure):
+        id: Integer
+        address: ObservedAddress
+
+    owner = Deserializer(ImmutableOwner).deserialize(
+        {"id": 1, "address": {"street": "a", "zipCode": 11}}, lazy=True
+    )
+    assert owner.address.street == "a"
+    assert instantiated_while_loading == [True]
+    assert "_lazy_fields" not in owner.__dict__
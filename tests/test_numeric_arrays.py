@@ -0,0 +1,112 @@
+import pickle
+from array import array
+
+from pytest import raises
+
+from typedpy import (
+    Deserializer,
+    FloatArray,
+    IntArray,
+    Structure,
+    serialize,
+    structure_to_schema,
+)
+
+
+class Reading(Structure):
+    counts: IntArray(minimum=0, maxItems=5)
+    samples: FloatArray(minimum=-40, maximum=85, exclusiveMaximum=True)
+    steps: IntArray(typecode="h", multiplesOf=5)
+
+    _required = []
+
+
+def test_stored_as_array():
+    reading = Reading(counts=[1, 2], samples=(1, 2.5), steps=array("q", [5, 10]))
+    assert reading.counts == array("q", [1, 2])
+    assert reading.samples == array("d", [1.0, 2.5])
+    assert reading.steps == array("h", [5, 10])
+
+
+def test_value_is_copied():
+    counts = array("q", [1, 2])
+    reading = Reading(counts=counts)
+    counts[0] = 5
+    assert reading.counts == array("q", [1, 2])
+
+
+def test_buffers():
+    reading = Reading(
+        counts=memoryview(array("l", [1, 2])),
+        samples=memoryview(array("f", [1.5])),
+    )
+    assert reading.counts == array("q", [1, 2])
+    assert reading.samples == array("d", [1.5])
+    with raises(TypeError) as excinfo:
+        Reading(counts=memoryview(array("d", [1.5])))
+    assert "counts: Expected integers; Got a buffer of format 'd'" in str(excinfo.value)
+
+
+def test_constraints_err():
+    with raises(ValueError) as excinfo:
+        Reading(counts=[3, 1, -2, 4])
+    assert "counts_2: Got -2; Expected a minimum of 0" in str(excinfo.value)
+    with raises(ValueError) as excinfo:
+        Reading(samples=[1, 85])
+    assert "samples_1: Got 85.0; Expected a maximum of less than 85" in str(
+        excinfo.value
+    )
+    with raises(ValueError) as excinfo:
+        Reading(steps=[5, 7])
+    assert "steps_1: Got 7; Expected a multiple of 5" in str(excinfo.value)
+    with raises(ValueError) as excinfo:
+        Reading(counts=[1] * 6)
+    assert "counts: Expected length of at most 5; Got 6" in str(excinfo.value)
+    with raises(ValueError) as excinfo:
+        Reading(steps=[5, 100000])
+    assert "steps: signed short integer is greater than maximum" in str(excinfo.value)
+
+
+def test_minimum_and_maximum_with_nan():
+    with raises(ValueError) as excinfo:
+        Reading(samples=[float("nan"), -100.0])
+    assert "samples_1: Got -100.0; Expected a minimum of -40" in str(excinfo.value)
+    with raises(ValueError) as excinfo:
+        Reading(samples=[float("nan"), 100.0])
+    assert "samples_1: Got 100.0; Expected a maximum of less than 85" in str(
+        excinfo.value
+    )
+    assert len(Reading(samples=[float("nan"), 1.0]).samples) == 2
+
+
+def test_types_err():
+    with raises(TypeError) as excinfo:
+        Reading(counts=[1, 2.5])
+    assert "counts: Expected integers;" in str(excinfo.value)
+    with raises(TypeError) as excinfo:
+        Reading(counts=array("d", [1]))
+    assert "counts: Expected integers; Got an array of typecode 'd'" in str(
+        excinfo.value
+    )
+    with raises(TypeError) as excinfo:
+        Reading(samples=5)
+    assert "samples: Got 5; Expected a list of numbers" in str(excinfo.value)
+    with raises(TypeError):
+        IntArray(typecode="d")
+
+
+def test_serialization():
+    reading = Reading(counts=[1, 2], samples=[1.5])
+    assert serialize(reading) == {"counts": [1, 2], "samples": [1.5]}
+    serialized = {"counts": [1, 2], "samples": [1.5]}
+    assert Deserializer(Reading).deserialize(serialized) == reading
+    assert pickle.loads(pickle.dumps(reading)) == reading
+
+
+def test_json_schema():
+    schema, _ = structure_to_schema(Reading, {})
+    assert schema["properties"]["counts"] == {
+        "type": "array",
+        "items": {"type": "integer", "minimum": 0},
+        "maxItems": 5,
+    }
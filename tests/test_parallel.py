@@ -0,0 +1,113 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from pytest import raises
+
+from typedpy import (
+    Array,
+    Deserializer,
+    Integer,
+    String,
+    Structure,
+    serialize,
+    serialize_many,
+)
+from typedpy.serialization.parallel import _ordered_results
+
+
+class Bar(Structure):
+    x: Integer
+    tags: Array[String]
+
+
+class Foo(Structure):
+    i: Integer(minimum=0)
+    name: String
+    bar: Bar
+
+
+records = [
+    {"i": i, "name": f"name{i}", "bar": {"x": i, "tags": ["a", str(i)]}}
+    for i in range(50)
+]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_deserialize_many(workers):
+    result = Deserializer(Foo).deserialize_many(records, workers=workers, chunk_size=7)
+    assert result == [Deserializer(Foo).deserialize(r) for r in records]
+
+
+def test_deserialize_many_with_mapper():
+    mapped_records = [{"number": r["i"], **r} for r in records]
+    result = Deserializer(Foo, mapper={"i": "number"}).deserialize_many(
+        mapped_records, workers=2, chunk_size=20
+    )
+    assert [f.i for f in result] == list(range(50))
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_deserialize_many_validate_only(workers):
+    invalid = [*records[:3], {**records[3], "i": -1}]
+    result = Deserializer(Foo).deserialize_many(
+        invalid, workers=workers, chunk_size=2, validate_only=True
+    )
+    assert result[:3] == [None, None, None]
+    assert "Expected a minimum of 0" in result[3]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_deserialize_many_invalid_record_err(workers):
+    invalid = [*records[:3], {**records[3], "i": -1}]
+    with raises(ValueError) as excinfo:
+        Deserializer(Foo).deserialize_many(invalid, workers=workers, chunk_size=2)
+    assert str(excinfo.value).startswith("record 3: ")
+
+
+class Undecodable(Structure):
+    name: String
+
+    def __validate__(self):
+        raise UnicodeDecodeError("utf-8", b"\xff", 0, 1, "invalid start byte")
+
+
+def test_deserialize_many_error_with_custom_exception_class():
+    with raises(ValueError) as excinfo:
+        Deserializer(Undecodable).deserialize_many([{"name": "x"}], workers=1)
+    assert str(excinfo.value).startswith("record 0: 'utf-8' codec")
+
+
+def test_deserialize_many_local_class_err():
+    class Local(Structure):
+        i: int
+
+    with raises(TypeError) as excinfo:
+        Deserializer(Local).deserialize_many([{"i": 1}], workers=2)
+    assert "Local must be importable" in str(excinfo.value)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_serialize_many(workers):
+    foos = Deserializer(Foo).deserialize_many(records, workers=1)
+    assert serialize_many(foos, workers=workers, chunk_size=9) == [
+        serialize(f) for f in foos
+    ]
+
+
+def test_pending_chunks_are_bounded():
+    consumed = []
+    consumed_by_task = {}
+
+    def tasks():
+        for i in range(100):
+            consumed.append(i)
+            yield (i,)
+
+    def task(i):
+        consumed_by_task[i] = len(consumed)
+        return i
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = list(_ordered_results(executor, task, tasks(), 4))
+    assert results == list(range(100))
+    assert all(count <= i + 5 for i, count in consumed_by_task.items())
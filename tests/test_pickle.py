@@ -1,6 +1,8 @@
 import enum
 import pickle
+import sys
 from collections import deque
+from copy import deepcopy
 
 import pytest
 from pytest import raises
@@ -19,6 +21,7 @@ from typedpy import (
     ImmutableStructure,
     Deque,
 )
+from typedpy.commons import Undefined
 
 
 class Values(enum.Enum):
@@ -67,6 +70,21 @@ class ImmutableExample(ImmutableStructure):
     _required = []
 
 
+class Nested(Structure):
+    arr = Array[Array[Integer]]
+    map1 = Map[String, Deque[Integer]]
+
+
+class WithUndefined(Structure):
+    i = Integer
+    s = String
+    arr = Array[Integer]
+
+    _required = []
+    _additionalProperties = True
+    _enable_undefined_value = True
+
+
 @pytest.fixture(name="original_object")
 def fixture_original_object():
     return Example(
@@ -106,14 +124,10 @@ def test_complex_pickle(original_object):
     assert unpickled == original_object
 
 
-def test_pickle_with_implicit_non_typedpy_wrappers_fails(original_object):
+def test_pickle_with_implicit_non_typedpy_wrappers(original_object):
     original_object.points = [Point(1, 1), Point(2, 2)]
-    with raises(TypeError) as ex:
-        pickle.dumps(original_object)
-    assert (
-        "pickling of implicit wrappers for non-Typedpy fields are unsupported"
-        in str(ex.value)
-    )
+    unpickled = pickle.loads(pickle.dumps(original_object))
+    assert [(p._x, p._y) for p in unpickled.points] == [(1, 1), (2, 2)]
 
 
 def test_complex_pickle_of_immutable(original_immutable_object):
@@ -149,3 +163,107 @@ def test_structure_reference_is_unsupported():
     with raises(TypeError) as excinfo:
         pickle.dumps(Bar(s={"a": 1}))
     assert "s: StructuredReference Cannot be pickled" in str(excinfo.value)
+
+
+def test_pickle_does_not_include_field_definitions(original_object):
+    pickled = pickle.dumps(original_object)
+    assert b"typedpy.fields" not in pickled
+    assert b"_field_definition" not in pickled
+
+
+def test_pickle_stores_the_field_names_once(original_object):
+    pickled = pickle.dumps([deepcopy(original_object) for _ in range(10)])
+    assert pickled.count(b"enum_arr") == 1
+
+
+def test_pickle_does_not_validate_again(original_object, monkeypatch):
+    pickled = pickle.dumps(original_object)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("validated again")
+
+    monkeypatch.setattr(Example, "__validate__", fail)
+    monkeypatch.setattr(String, "__set__", fail)
+    unpickled = pickle.loads(pickled)
+    assert unpickled.__dict__ == original_object.__dict__
+
+
+def test_pickle_of_nested_collections_maintains_validations():
+    original = Nested(arr=[[1, 2], [3]], map1={"a": deque([1])})
+    unpickled = pickle.loads(pickle.dumps(original))
+    assert unpickled == original
+
+    unpickled.arr.append([4])
+    assert unpickled.arr == [[1, 2], [3], [4]]
+    with raises(TypeError):
+        unpickled.arr.append(["x"])
+    with raises(TypeError):
+        unpickled.map1["b"] = deque(["x"])
+    assert original.arr == [[1, 2], [3]]
+
+
+def test_pickle_of_immutable_remains_immutable(original_immutable_object):
+    unpickled = pickle.loads(pickle.dumps(original_immutable_object))
+    with raises(ValueError):
+        unpickled.arr.append("x")
+    with raises(ValueError):
+        unpickled.map1["z"] = [1]
+    with raises(ValueError):
+        unpickled.i = 4
+
+
+def test_pickle_maintains_none_fields_and_additional_properties():
+    original = WithUndefined(i=None, arr=[1], other=5)
+    unpickled = pickle.loads(pickle.dumps(original))
+    assert unpickled == original
+    assert unpickled.i is None
+    assert unpickled.s is Undefined
+    assert unpickled.other == 5
+
+
+class Changing(Structure):
+    i = Integer
+    s = String
+
+    _required = []
+
+
+def _redefine_changing(monkeypatch, **fields):
+    changed = type("Changing", (Structure,), {**fields, "__module__": __name__})
+    monkeypatch.setattr(sys.modules[__name__], "Changing", changed)
+    return changed
+
+
+def test_unpickle_after_the_fields_were_reordered_and_added(monkeypatch):
+    pickled = pickle.dumps(Changing(i=5, s="x"))
+    changed = _redefine_changing(
+        monkeypatch, s=String, j=Integer, i=Integer, _required=[]
+    )
+    unpickled = pickle.loads(pickled)
+    assert isinstance(unpickled, changed)
+    assert unpickled == changed(i=5, s="x")
+
+
+def test_unpickle_after_the_fields_changed_validates_again(monkeypatch):
+    pickled = pickle.dumps(Changing(i=5, s="x"))
+    _redefine_changing(monkeypatch, i=Integer(maximum=3), j=String, _required=[])
+    with raises(ValueError) as excinfo:
+        pickle.loads(pickled)
+    assert "i: Got 5; Expected a maximum of 3" in str(excinfo.value)
+
+    _redefine_changing(
+        monkeypatch, i=Integer, s=String, j=Integer, _additionalProperties=True
+    )
+    with raises(TypeError) as excinfo:
+        pickle.loads(pickled)
+    assert "missing a required argument: 'j'" in str(excinfo.value)
+
+
+def test_unpickle_after_a_field_was_removed(monkeypatch):
+    pickled = pickle.dumps(Changing(i=5, s="x"))
+    _redefine_changing(
+        monkeypatch, i=Integer, _required=[], _additionalProperties=False
+    )
+    with raises(TypeError) as excinfo:
+        pickle.loads(pickled)
+    assert "got an unexpected keyword argument 's'" in str(excinfo.value)
@@ -0,0 +1,159 @@
+import json
+from typing import Optional
+
+from pytest import raises
+
+from typedpy import (
+    Array,
+    DateField,
+    Deserializer,
+    Integer,
+    Map,
+    Set,
+    String,
+    Structure,
+    Versioned,
+    deserialize_positional,
+    serialize,
+    serialize_positional,
+)
+
+
+class Point(Structure):
+    x: Integer
+    y: Integer
+    _required = []
+
+
+class Shape(Structure):
+    name: String
+    points: Array[Point]
+    point_by_name: Map[String, Point]
+    unique_points: Set[Point]
+    created: DateField
+    description: String
+    _required = ["name"]
+
+
+def _shape():
+    return Shape(
+        name="triangle",
+        points=[Point(x=0, y=0), Point(x=1, y=0), Point(x=0, y=1)],
+        point_by_name={"origin": Point(x=0, y=0)},
+        unique_points={Point(x=1, y=1)},
+        created="2020-01-31",
+    )
+
+
+def test_round_trip():
+    shape = _shape()
+    serialized = serialize_positional(shape)
+    assert serialized == [
+        "triangle",
+        [[0, 0], [1, 0], [0, 1]],
+        {"origin": [0, 0]},
+        [[1, 1]],
+        "2020-01-31",
+    ]
+    assert len(json.dumps(serialized)) < len(json.dumps(serialize(shape))) / 2
+    assert deserialize_positional(Shape, serialized) == shape
+    assert (
+        deserialize_positional(Shape, serialized, direct_trusted_mapping=True) == shape
+    )
+    assert Deserializer(Shape).deserialize(serialize(shape)) == shape
+
+
+def test_missing_values():
+    assert serialize_positional(Point(y=1)) == [None, 1]
+    assert serialize_positional(Point(x=1)) == [1]
+    assert deserialize_positional(Point, [None, 1]) == Point(y=1)
+    assert deserialize_positional(Point, []) == Point()
+
+
+def test_none_is_not_confused_with_missing_value():
+    class Foo(Structure):
+        count: Optional[Integer] = 5
+        name: String
+        description: Optional[String]
+        _required = []
+
+    foo = Foo(count=None, name="a")
+    serialized = serialize_positional(foo)
+    assert serialized == [None, "a", None, 0b1]
+    assert deserialize_positional(Foo, serialized) == foo
+    assert deserialize_positional(Foo, serialized).count is None
+    assert (
+        deserialize_positional(Foo, serialized, direct_trusted_mapping=True).count
+        is None
+    )
+    assert serialize_positional(Foo(name="a", description=None)) == [
+        5,
+        "a",
+        None,
+        0b100,
+    ]
+    assert deserialize_positional(Foo, [None, "a"]).count == 5
+
+
+def test_validation_err():
+    with raises(TypeError) as excinfo:
+        deserialize_positional(Shape, ["triangle", [["a", 0]]])
+    assert "Point.x: Expected <class 'int'>; Got 'a'" in str(excinfo.value)
+    with raises(TypeError) as excinfo:
+        deserialize_positional(Shape, {"name": "triangle"})
+    assert "Shape: Expected a list" in str(excinfo.value)
+    with raises(ValueError) as excinfo:
+        deserialize_positional(Point, [1, 2, 3, 4])
+    assert "Point: Expected at most 2 values; Got 4" in str(excinfo.value)
+    with raises(ValueError) as excinfo:
+        deserialize_positional(Point, [1, 2, 3])
+    assert (
+        "Point: Expected a bitmask of the fields that are None after the 2 values; Got 3"
+        in str(excinfo.value)
+    )
+
+
+def test_nested_collections_and_optionals():
+    class Grid(Structure):
+        rows: Array[Array[Point]]
+        corners: Map[String, Optional[Point]]
+        center: Optional[Point]
+
+    grid = Grid(
+        rows=[[Point(x=0, y=0), Point(x=1, y=0)], [Point(x=0, y=1)]],
+        corners={"a": Point(x=1, y=1), "b": None},
+        center=Point(x=2, y=2),
+    )
+    serialized = serialize_positional(grid)
+    assert serialized == [
+        [[[0, 0], [1, 0]], [[0, 1]]],
+        {"a": [1, 1], "b": None},
+        [2, 2],
+    ]
+    assert deserialize_positional(Grid, serialized) == grid
+
+
+def test_structure_of_another_class_err():
+    with raises(TypeError) as excinfo:
+        deserialize_positional(Shape, ["triangle", [Shape(name="x")]])
+    assert "Expected a list" in str(excinfo.value)
+
+
+def test_versioned_has_schema_hash():
+    class Foo(Versioned):
+        name: String
+        _versions_mapping = [{}]
+
+    serialized = serialize_positional(Foo(name="a"))
+    assert len(serialized) == 3
+    assert serialized[1:] == [2, "a"]
+    assert deserialize_positional(Foo, serialized) == Foo(name="a")
+
+    class Bar(Versioned):
+        name: String
+        age: Integer
+        _versions_mapping = [{}]
+
+    with raises(ValueError) as excinfo:
+        deserialize_positional(Bar, serialized)
+    assert "Bar: Expected schema hash" in str(excinfo.value)
@@ -0,0 +1,122 @@
+from pytest import raises
+
+from typedpy import (
+    Array,
+    Constant,
+    Deserializer,
+    Integer,
+    Map,
+    String,
+    Structure,
+    Versioned,
+    mappers,
+)
+
+
+class Owner(Structure):
+    first_name: String
+    age: Integer(minimum=0)
+
+    _serialization_mapper = mappers.TO_CAMELCASE
+
+
+class Order(Structure):
+    id: Integer
+    status: String
+    owner: Owner
+    items: Array[Integer]
+    props: Map[String, String]
+
+    _required = ["id", "owner", "items"]
+    _serialization_mapper = {"status": "state"}
+
+
+payload = {
+    "id": 1,
+    "state": "new",
+    "owner": {"firstName": "joe", "age": 40},
+    "items": [1, 2, 3],
+    "props": {},
+}
+
+
+def test_deserialize_selected_fields():
+    order = Deserializer(Order, fields=["id", "status", "owner.first_name"]).deserialize(
+        payload
+    )
+    assert order.__class__.__name__ == "ProjectedOrder"
+    assert set(order.get_all_fields_by_name()) == {"id", "status", "owner"}
+    assert order.id == 1
+    assert order.status == "new"
+    assert order.owner.first_name == "joe"
+    assert set(order.owner.get_all_fields_by_name()) == {"first_name"}
+
+
+def test_other_fields_are_not_validated():
+    invalid = {**payload, "items": "xyz", "owner": {"firstName": "joe", "age": -1}}
+    order = Deserializer(Order, fields=["id", "owner.first_name"]).deserialize(invalid)
+    assert order.owner.first_name == "joe"
+
+
+def test_selected_fields_are_validated():
+    invalid = {**payload, "owner": {"firstName": "joe", "age": -1}}
+    with raises(ValueError) as excinfo:
+        Deserializer(Order, fields=["id", "owner"]).deserialize(invalid)
+    assert "age: Got -1; Expected a minimum of 0" in str(excinfo.value)
+
+
+def test_required_fields_of_projection():
+    with raises(TypeError) as excinfo:
+        Deserializer(Order, fields=["id", "owner.first_name"]).deserialize({"id": 1})
+    assert "missing a required argument: 'owner'" in str(excinfo.value)
+    order = Deserializer(Order, fields=["id", "status"]).deserialize({"id": 1})
+    assert order.status is None
+
+
+def test_only_overrides_the_fields_of_the_deserializer():
+    deserializer = Deserializer(Order, fields=["id"])
+    assert deserializer.deserialize(payload, only=["status"]).status == "new"
+    assert deserializer.deserialize(payload, only=["owner"]).owner == Owner(
+        first_name="joe", age=40
+    )
+    assert Deserializer(Order).deserialize(payload, only=["items"]).items == [1, 2, 3]
+
+
+def test_projection_with_explicit_mapper():
+    deserializer = Deserializer(
+        Order, mapper={"id": "order_id"}, fields=["id", "owner.age"]
+    )
+    order = deserializer.deserialize({"order_id": 5, "owner": {"age": 3}})
+    assert order.id == 5
+    assert order.owner.age == 3
+
+
+def test_projection_class_is_reused():
+    deserializer = Deserializer(Order, fields=["status", "id"])
+    assert (
+        deserializer.deserialize(payload).__class__
+        is Deserializer(Order, fields=["id", "status"]).deserialize(payload).__class__
+    )
+
+
+def test_invalid_field_err():
+    with raises(TypeError) as excinfo:
+        Deserializer(Order, fields=["id", "xyz"])
+    assert "Projection: 'xyz' is not a field of Order" in str(excinfo.value)
+
+
+def test_projection_into_non_structure_err():
+    with raises(TypeError) as excinfo:
+        Deserializer(Order, fields=["items.x"])
+    assert "Projection: 'items' of Order is not a Structure" in str(excinfo.value)
+
+
+def test_projection_of_versioned():
+    class Foo(Versioned):
+        a: int
+        b: str
+
+        _versions_mapping = [{"a": Constant(5)}]
+
+    foo = Deserializer(Foo, fields=["a"]).deserialize({"version": 1, "b": 1})
+    assert foo.a == 5
@@ -0,0 +1,187 @@
+import enum
+import mmap
+from typing import Optional
+
+from pytest import raises
+
+from typedpy import (
+    Array,
+    Boolean,
+    Enum,
+    Float,
+    Integer,
+    RecordArray,
+    String,
+    Structure,
+    record_format,
+)
+
+
+class Side(enum.Enum):
+    BUY = 1
+    SELL = 2
+
+
+class Tick(Structure):
+    symbol: String(maxLength=8)
+    price: Float
+    volume: Integer(minimum=0)
+    side: Enum[Side]
+    final: Boolean
+    note: String(maxLength=4)
+    _required = ["symbol", "price", "volume", "side", "final"]
+
+
+def _ticks(count=10):
+    return [
+        Tick(symbol="ABC", price=1.5 + i, volume=i, side=Side.BUY, final=i % 2 == 0)
+        for i in range(count)
+    ]
+
+
+def test_record_format():
+    assert record_format(Tick) == "<33sdqH??17s"
+    with raises(TypeError) as excinfo:
+
+        class Foo(Structure):
+            name: String
+            values: Array[Integer]
+
+        record_format(Foo)
+    assert (
+        "name: Expected an Integer, Float, Boolean, Enum, or String with maxLength or max_bytes"
+        in str(excinfo.value)
+    )
+
+
+def test_pack_and_access():
+    ticks = _ticks()
+    records = RecordArray.from_structures(Tick, ticks)
+    assert len(records) == 10
+    assert len(records.buffer) == 10 * records.record_size
+    assert records[3] == ticks[3]
+    assert records[-1] == ticks[-1]
+    assert list(records) == ticks
+    assert records.to_structures() == ticks
+    assert records.get(3, "price") == 4.5
+    assert records.get(3, "side") is Side.BUY
+    assert records.get(3, "note") is None
+    assert records.column("volume") == list(range(10))
+    assert bytes(records.record_view(1)) == bytes(records.buffer[70:140])
+    with raises(IndexError):
+        records[10]
+    with raises(KeyError):
+        records.get(0, "xyz")
+
+
+def test_slice_is_a_view():
+    records = RecordArray.from_structures(Tick, _ticks())
+    view = records[2:5]
+    assert len(view) == 3
+    assert view.to_structures() == _ticks()[2:5]
+    records[2] = Tick(symbol="X", price=0.5, volume=1, side=Side.SELL, final=True)
+    assert view.get(0, "symbol") == "X"
+
+
+def test_append_and_set():
+    records = RecordArray(Tick)
+    records.extend(_ticks(2))
+    tick = Tick(symbol="XYZ", price=2.0, volume=7, side="SELL", final=True, note="hi")
+    records.append(tick)
+    assert records[2] == tick
+    records[0] = tick
+    assert records.to_structures() == [tick, _ticks(2)[1], tick]
+
+
+def test_validation():
+    records = RecordArray.from_structures(Tick, _ticks(1))
+    buffer = bytearray(records.buffer)
+    buffer[41:49] = (-1).to_bytes(8, "little", signed=True)
+    with raises(ValueError) as excinfo:
+        RecordArray(Tick, buffer)[0]
+    assert "volume: Got -1; Expected a minimum of 0" in str(excinfo.value)
+    assert RecordArray(Tick, buffer, direct_trusted_mapping=True).get(0, "volume") == -1
+
+    with raises(ValueError) as excinfo:
+        RecordArray(Tick, buffer[:-1])
+    assert "Tick: Expected a buffer size that is a multiple of 70" in str(excinfo.value)
+    with raises(ValueError) as excinfo:
+        records.append(
+            Tick(symbol="ABC", price=1.0, volume=2**63, side=Side.BUY, final=True)
+        )
+    with raises(TypeError):
+        RecordArray(Tick, bytes(records.buffer)).append(_ticks(1)[0])
+
+
+def test_optional_and_non_ascii_string():
+    class Reading(Structure):
+        label: String(maxLength=3)
+        value: Optional[int]
+
+    assert record_format(Reading) == "<13s?q"
+    readings = [Reading(label="ééé", value=None), Reading(label="a€", value=5)]
+    records = RecordArray.from_structures(Reading, readings)
+    assert records.to_structures() == readings
+    assert records.get(0, "label") == "ééé"
+    assert records.column("value") == [None, 5]
+
+
+def test_string_that_ends_with_null_characters():
+    class Message(Structure):
+        text: String(maxLength=4)
+
+    messages = [Message(text="a\0\0"), Message(text=""), Message(text="\0")]
+    records = RecordArray.from_structures(Message, messages)
+    assert records.to_structures() == messages
+    assert records.column("text") == ["a\0\0", "", "\0"]
+
+
+def test_max_bytes():
+    class Message(Structure):
+        code: String(maxLength=100)
+        text: String
+        count: Integer
+
+    assert record_format(Message, max_bytes={"code": 8, "text": 300}) == "<9s302sq"
+    messages = [
+        Message(code="ABC", text="x" * 300, count=1),
+        Message(code="é", text="", count=2),
+    ]
+    records = RecordArray.from_structures(
+        Message, messages, max_bytes={"code": 8, "text": 300}
+    )
+    assert records.record_size == 319
+    assert records.to_structures() == messages
+    assert records[1:].get(0, "code") == "é"
+    assert (
+        RecordArray(
+            Message, records.buffer, max_bytes={"code": 8, "text": 300}
+        ).to_structures()
+        == messages
+    )
+
+    with raises(ValueError) as excinfo:
+        records.append(Message(code="ABCDEFGHI", text="", count=3))
+    assert "code: Got 'ABCDEFGHI'; Expected at most 8 bytes in UTF-8" in str(
+        excinfo.value
+    )
+    with raises(ValueError) as excinfo:
+        record_format(Message, max_bytes={"code": 8, "xyz": 1})
+    assert "max_bytes: 'xyz' is not a field of Message" in str(excinfo.value)
+    with raises(ValueError) as excinfo:
+        record_format(Message, max_bytes={"code": 0, "text": 1})
+    assert "max_bytes: code: Expected a positive int; Got 0" in str(excinfo.value)
+    with raises(TypeError) as excinfo:
+        record_format(Message, max_bytes={"text": 1, "count": 8})
+    assert "max_bytes: count: Expected a String field" in str(excinfo.value)
+
+
+def test_mmap(tmp_path):
+    path = tmp_path / "ticks.bin"
+    path.write_bytes(RecordArray.from_structures(Tick, _ticks(100)).buffer)
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            records = RecordArray(Tick, buffer)
+            assert len(records) == 100
+            assert records[99] == _ticks(100)[99]
+            del records
@@ -0,0 +1,119 @@
+from pytest import raises
+
+from typedpy import (
+    Array,
+    FastSerializable,
+    ImmutableStructure,
+    Integer,
+    String,
+    Structure,
+    mappers,
+    serialize,
+)
+
+
+class Location(ImmutableStructure):
+    city_name: String
+    zip_code: Integer
+
+    _cache_serialization = True
+
+
+class FastLocation(ImmutableStructure, FastSerializable):
+    city_name: String
+
+    _cache_serialization = True
+
+
+class Policy(ImmutableStructure):
+    code: Integer
+    locations: Array[Location]
+
+    _cache_serialization = True
+
+
+class CamelCasePolicy(ImmutableStructure):
+    locations: Array[Location]
+
+    _serialization_mapper = mappers.TO_CAMELCASE
+
+
+class MutableLocation(Structure):
+    city_name: String
+
+    _cache_serialization = True
+
+
+def test_serialization_is_cached():
+    location = Location(city_name="Paris", zip_code=75001)
+    serialized = serialize(location)
+    assert serialized == {"city_name": "Paris", "zip_code": 75001}
+    location.__dict__["city_name"] = "Rome"
+    assert serialize(location) == serialized
+
+
+def test_parent_reuses_cached_children():
+    location = Location(city_name="Paris", zip_code=75001)
+    serialize(location)
+    location.__dict__["city_name"] = "Rome"
+    policy = Policy(code=1, locations=[location])
+    serialized = serialize(policy)
+    assert serialized["locations"][0] == {"city_name": "Paris", "zip_code": 75001}
+    assert serialize(policy) == serialized
+
+
+def test_result_is_shared():
+    location = Location(city_name="Paris", zip_code=75001)
+    serialized = serialize(location)
+    assert serialize(location) is serialized
+    assert serialize(Policy(code=1, locations=[location]))["locations"][0] is serialized
+    assert serialize(location, camel_case_convert=True) is serialize(
+        location, camel_case_convert=True
+    )
+
+
+def test_separate_cache_per_variant():
+    location = Location(city_name="Paris", zip_code=75001)
+    assert serialize(location, camel_case_convert=True) == {
+        "cityName": "Paris",
+        "zipCode": 75001,
+    }
+    assert serialize(location) == {"city_name": "Paris", "zip_code": 75001}
+    assert serialize(location, mapper={"city_name": "city"}) == {
+        "city": "Paris",
+        "zip_code": 75001,
+    }
+    assert serialize(CamelCasePolicy(locations=[location])) == {
+        "locations": [{"cityName": "Paris", "zipCode": 75001}]
+    }
+    assert serialize(location) == {"city_name": "Paris", "zip_code": 75001}
+
+
+def test_fast_serializable_is_cached():
+    location = FastLocation(city_name="Paris")
+    assert location.serialize() is location.serialize()
+    location.__dict__["city_name"] = "Rome"
+    assert location.serialize() == {"city_name": "Paris"}
+    assert serialize(location) == {"city_name": "Paris"}
+
+
+def test_cache_is_not_part_of_the_instance():
+    location = Location(city_name="Paris", zip_code=75001)
+    serialize(location)
+    assert location == Location(city_name="Paris", zip_code=75001)
+    assert "_serialization_cache" not in str(location)
+    assert "_serialization_cache" not in dir(location)
+
+
+def test_mutable_structure_is_not_cached():
+    location = MutableLocation(city_name="Paris")
+    assert serialize(location) == {"city_name": "Paris"}
+    location.city_name = "Rome"
+    assert serialize(location) == {"city_name": "Rome"}
+
+
+def test_immutable_cannot_be_changed():
+    location = Location(city_name="Paris", zip_code=75001)
+    serialize(location)
+    with raises(ValueError):
+        location.city_name = "Rome"
@@ -0,0 +1,178 @@
+from pytest import raises
+
+from typedpy import (
+    Array,
+    Deserializer,
+    Integer,
+    Map,
+    Set,
+    String,
+    Structure,
+    mappers,
+    serialize_changes,
+)
+
+
+class Customer(Structure):
+    name: String
+    email: String
+    _required = ["name"]
+
+
+class Item(Structure):
+    name: String
+    quantity: Integer
+
+
+class Order(Structure):
+    order_id: Integer
+    status: String
+    customer: Customer
+    items: Array[Item]
+    item_by_name: Map[String, Item]
+    quantity_by_name: Map[String, Integer]
+    tags: Set[String]
+    _required = ["order_id"]
+
+
+class CamelOrder(Structure):
+    order_status: String
+    customer: Customer
+    _serialization_mapper = mappers.TO_CAMELCASE
+
+
+def _order():
+    return Deserializer(Order).deserialize(
+        {
+            "order_id": 1,
+            "status": "new",
+            "customer": {"name": "john", "email": "john@example.com"},
+            "items": [{"name": "pen", "quantity": 1}],
+            "item_by_name": {"pen": {"name": "pen", "quantity": 1}},
+            "quantity_by_name": {"pen": 1, "book": 2},
+            "tags": ["new"],
+        }
+    )
+
+
+def test_no_changes():
+    assert serialize_changes(_order().mark_clean()) == {}
+
+
+def test_top_level_changes():
+    order = _order().mark_clean()
+    order.status = "shipped"
+    order.order_id = 2
+    assert serialize_changes(order) == {"order_id": 2, "status": "shipped"}
+
+
+def test_deleted_field():
+    order = _order().mark_clean()
+    del order["status"]
+    assert serialize_changes(order) == {"status": None}
+
+
+def test_nested_change():
+    order = _order().mark_clean()
+    order.customer.email = "j@example.com"
+    assert serialize_changes(order) == {"customer": {"email": "j@example.com"}}
+
+
+def test_replaced_nested_structure_is_serialized_in_full():
+    order = _order().mark_clean()
+    order.customer = Customer(name="jane")
+    assert serialize_changes(order) == {"customer": {"name": "jane"}}
+
+
+def test_array_change_serializes_the_whole_array():
+    order = _order().mark_clean()
+    order.items.append(Item(name="book", quantity=2))
+    assert serialize_changes(order) == {
+        "items": [{"name": "pen", "quantity": 1}, {"name": "book", "quantity": 2}]
+    }
+
+
+def test_change_of_structure_in_array():
+    order = _order().mark_clean()
+    order.items[0].quantity = 5
+    assert serialize_changes(order) == {"items": [{"name": "pen", "quantity": 5}]}
+
+
+def test_change_of_structure_in_map():
+    order = _order().mark_clean()
+    order.item_by_name["pen"].quantity = 3
+    assert serialize_changes(order) == {"item_by_name": {"pen": {"quantity": 3}}}
+
+
+def test_changes_with_serialization_mapper():
+    order = CamelOrder(order_status="new", customer=Customer(name="john")).mark_clean()
+    order.order_status = "shipped"
+    order.customer.email = "j@example.com"
+    assert serialize_changes(order) == {
+        "orderStatus": "shipped",
+        "customer": {"email": "j@example.com"},
+    }
+
+
+def test_mark_clean_resets_the_changes():
+    order = _order().mark_clean()
+    order.status = "shipped"
+    order.customer.email = "j@example.com"
+    order.mark_clean()
+    assert serialize_changes(order) == {}
+    order.order_id = 3
+    assert serialize_changes(order) == {"order_id": 3}
+
+
+def test_changes_are_not_tracked_err():
+    with raises(ValueError) as excinfo:
+        serialize_changes(_order())
+    assert "Order: changes are not tracked. Call mark_clean() first" in str(
+        excinfo.value
+    )
+
+
+def test_map_changed_in_place():
+    order = _order().mark_clean()
+    del order.quantity_by_name["pen"]
+    order.quantity_by_name["pencil"] = 3
+    order.quantity_by_name.update({"eraser": 4})
+    assert serialize_changes(order) == {
+        "quantity_by_name": {"pen": None, "pencil": 3, "eraser": 4}
+    }
+
+
+def test_map_of_structures_changed_in_place():
+    order = _order().mark_clean()
+    del order.item_by_name["pen"]
+    assert serialize_changes(order) == {"item_by_name": {"pen": None}}
+    order.item_by_name["book"] = Item(name="book", quantity=2)
+    assert serialize_changes(order) == {
+        "item_by_name": {"pen": None, "book": {"name": "book", "quantity": 2}}
+    }
+
+
+def test_replaced_map_deletes_the_missing_keys():
+    order = _order().mark_clean()
+    order.quantity_by_name["eraser"] = 4
+    order.quantity_by_name = {"book": 3}
+    assert serialize_changes(order) == {
+        "quantity_by_name": {"book": 3, "pen": None, "eraser": None}
+    }
+
+
+def test_set_change():
+    order = _order().mark_clean()
+    order.tags.add("urgent")
+    assert sorted(serialize_changes(order)["tags"]) == ["new", "urgent"]
+
+
+def test_failed_update_is_not_a_change():
+    order = _order().mark_clean()
+    with raises(TypeError):
+        order.order_id = "x"
+    with raises(TypeError):
+        order.quantity_by_name["pen"] = "x"
+    with raises(TypeError):
+        order.tags.add(1)
+    assert serialize_changes(order) == {}
@@ -0,0 +1,221 @@
+import pickle
+from array import array
+from copy import deepcopy
+
+from pytest import raises
+
+from typedpy import (
+    Deserializer,
+    Enum,
+    Float,
+    ImmutableStructure,
+    Integer,
+    Serializer,
+    String,
+    Structure,
+    StructureArray,
+    StructureColumns,
+    serialize,
+)
+
+
+class Worker(Structure):
+    name: String
+    salary: Integer(minimum=0)
+    rate: Float
+    level: Enum["junior", "senior"]
+
+    _required = ["name", "salary", "rate"]
+
+
+class Firm(Structure):
+    workers: StructureArray[Worker]
+
+
+class Manager(Structure):
+    name: String
+    salary: Integer
+    level: Integer = 1
+
+    def __validate__(self):
+        if self.salary > 1000 * self.level:
+            raise ValueError("salary is too high for the level")
+
+
+class Department(Structure):
+    managers: StructureArray[Manager]
+
+
+class ImmutableFirm(ImmutableStructure):
+    workers: StructureArray[Worker]
+
+
+def _firm():
+    return Firm(
+        workers=[
+            Worker(name="john", salary=100, rate=1.5, level="senior"),
+            {"name": "jane", "salary": 200, "rate": 2},
+        ]
+    )
+
+
+def test_rows_and_columns():
+    workers = _firm().workers
+    assert len(workers) == 2
+    assert isinstance(workers, StructureColumns)
+    assert workers.column("salary") == array("q", [100, 200])
+    assert workers.column("rate") == array("d", [1.5, 2.0])
+    assert workers.column("level") == ["senior", None]
+    assert workers[1].name == "jane"
+    assert workers[-1].level is None
+    assert workers[0] == Worker(name="john", salary=100, rate=1.5, level="senior")
+    assert workers[1].to_structure() == Worker(name="jane", salary=200, rate=2.0)
+    assert [w.name for w in workers] == ["john", "jane"]
+
+
+def test_update_is_validated():
+    workers = _firm().workers
+    workers[1].salary = 300
+    assert workers.get(1, "salary") == 300
+    with raises(ValueError) as excinfo:
+        workers[1].salary = -1
+    assert "salary: Got -1; Expected a minimum of 0" in str(excinfo.value)
+    with raises(ValueError) as excinfo:
+        workers.append({"name": "x", "salary": 1})
+    assert "Worker.rate: Expected a value" in str(excinfo.value)
+    with raises(TypeError):
+        workers.append({"name": "x", "salary": "1", "rate": 1.0})
+    assert len(workers) == 2
+
+
+def test_large_integer():
+    workers = _firm().workers
+    workers.append(Worker(name="rich", salary=2**70, rate=1.0))
+    assert workers.column("salary") == [100, 200, 2**70]
+
+
+def test_extend_columns():
+    workers = StructureColumns(Worker)
+    workers.extend_columns({"name": ["a", "b"], "salary": [1, 2], "rate": [1, 2]})
+    assert workers == [
+        Worker(name="a", salary=1, rate=1.0),
+        Worker(name="b", salary=2, rate=2.0),
+    ]
+    with raises(ValueError) as excinfo:
+        workers.extend_columns({"name": ["c"], "salary": [-1], "rate": [1]})
+    assert "Expected a minimum of 0" in str(excinfo.value)
+    with raises(KeyError):
+        workers.extend_columns({"foo": [1]})
+    assert len(workers) == 2
+
+
+def test_filter_and_sort():
+    workers = _firm().workers
+    workers.append(Worker(name="joe", salary=150, rate=1.0, level="junior"))
+    assert workers.filter("salary", lambda v: v > 120).column("name") == ["jane", "joe"]
+    workers.sort("salary", reverse=True)
+    assert workers.column("name") == ["jane", "joe", "john"]
+    workers.sort("level")
+    assert workers.column("name") == ["jane", "joe", "john"]
+    assert workers[1:].column("name") == ["joe", "john"]
+
+
+def test_serialization():
+    firm = _firm()
+    serialized = {
+        "workers": [
+            {"name": "john", "salary": 100, "rate": 1.5, "level": "senior"},
+            {"name": "jane", "salary": 200, "rate": 2.0},
+        ]
+    }
+    assert Serializer(firm).serialize() == serialized
+    assert serialize(firm) == serialized
+    deserialized = Deserializer(Firm).deserialize(serialized)
+    assert deserialized == firm
+    assert isinstance(deserialized.workers, StructureColumns)
+    assert firm.workers.to_json().startswith('[{"name": "john"')
+
+
+def test_pickle_and_copy():
+    firm = _firm()
+    assert pickle.loads(pickle.dumps(firm)) == firm
+    assert deepcopy(firm) == firm
+
+
+def test_invalid_value_err():
+    with raises(TypeError) as excinfo:
+        Firm(workers=[{"name": "x", "salary": 1, "rate": 1.0}, 5])
+    assert "Expected an instance of Worker or a dict; Got 5" in str(excinfo.value)
+    with raises(TypeError) as excinfo:
+        Firm(workers=5)
+    assert "workers: Got 5; Expected a list of Worker" in str(excinfo.value)
+    with raises(TypeError):
+        StructureArray[Integer]
+
+
+def test_defaults():
+    managers = Department(managers=[{"name": "john", "salary": 500}]).managers
+    assert managers[0].level == 1
+    managers.extend_columns({"name": ["jane"], "salary": [600]})
+    assert managers.column("level") == [1, 1]
+    deserialized = Deserializer(Department).deserialize(
+        {"managers": [{"name": "joe", "salary": 700}]}
+    )
+    assert deserialized.managers[0].to_structure() == Manager(name="joe", salary=700)
+
+
+def test_class_validation_of_rows():
+    with raises(ValueError) as excinfo:
+        Department(managers=[{"name": "john", "salary": 5000}])
+    assert "salary is too high for the level" in str(excinfo.value)
+    with raises(ValueError):
+        Deserializer(Department).deserialize(
+            {"managers": [{"name": "john", "salary": 5000}]}
+        )
+    managers = Department(managers=[{"name": "john", "salary": 500}]).managers
+    with raises(ValueError):
+        managers.extend_columns({"name": ["jane"], "salary": [6000]})
+    with raises(ValueError):
+        managers[0].salary = 5000
+    assert managers[0].salary == 500
+    managers[0].level = 5
+    managers[0].salary = 5000
+    assert managers[0].to_structure() == Manager(name="john", salary=5000, level=5)
+
+
+def test_immutable_structure():
+    workers = StructureColumns(Worker, [{"name": "john", "salary": 100, "rate": 1.5}])
+    firm = ImmutableFirm(workers=workers)
+    assert firm.workers is firm.workers
+    workers.append({"name": "jane", "salary": 200, "rate": 2})
+    assert len(firm.workers) == 1
+    with raises(ValueError) as excinfo:
+        firm.workers[0].salary = 7
+    assert "workers: Field is immutable" in str(excinfo.value)
+    with raises(ValueError):
+        firm.workers.append({"name": "jane", "salary": 200, "rate": 2})
+    with raises(ValueError):
+        firm.workers.sort("salary")
+    assert firm.workers[0].salary == 100
+    for copied in [deepcopy(firm), pickle.loads(pickle.dumps(firm))]:
+        assert copied == firm
+        with raises(ValueError):
+            copied.workers.append({"name": "jane", "salary": 200, "rate": 2})
+    mutable_copy = firm.workers.copy()
+    mutable_copy.append({"name": "jane", "salary": 200, "rate": 2})
+    assert len(mutable_copy) == 2
+
+
+def test_error_with_custom_exception_class():
+    class Undecodable(Structure):
+        name: String
+
+        def __validate__(self):
+            raise UnicodeDecodeError("utf-8", b"\xff", 0, 1, "invalid start byte")
+
+    class Container(Structure):
+        rows: StructureArray[Undecodable]
+
+    with raises(ValueError) as excinfo:
+        Container(rows=[{"name": "x"}])
+    assert "rows: 'utf-8' codec" in str(excinfo.value)
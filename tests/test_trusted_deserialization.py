@@ -1,3 +1,4 @@
+import collections
 import enum
 import sys
 import time
@@ -9,14 +10,19 @@ import pytest
 
 from typedpy import (
     Array,
+    Constant,
     DateField,
+    DateTime,
+    Deque,
     Deserializer,
     Extend,
     FastSerializable,
     FunctionCall,
     ImmutableStructure,
+    Map,
     PositiveInt,
     Set,
+    Tuple,
     create_serializer,
     mappers,
 )
@@ -214,7 +220,7 @@ def test_trusted_deserialization_with_mapper():
     assert trusted_result == untrusted_result
 
 
-def test_trusted_deserialization_with_invalid_mapper():
+def test_trusted_deserialization_with_function_mapper():
     class PolicyWithMapper(ImmutableStructure):
         soft_limit: PositiveInt
         hard_limit: PositiveInt
@@ -226,12 +232,84 @@ def test_trusted_deserialization_with_invalid_mapper():
     deserializer = Deserializer(target_class=PolicyWithMapper)
     # Given
     serialized = {"hard_limit": 5, "soft_limit": 4, "codes": [1, 2, 3]}
-    deserializer.deserialize(input_data=serialized)
 
-    # When/ Then
-    with pytest.raises(ValueError) as excinfo:
-        deserializer.deserialize(input_data=serialized, direct_trusted_mapping=True)
-    assert "unsupported for trusted deserialization" in str(excinfo.value)
+    # When
+    deserialized = deserializer.deserialize(
+        input_data=serialized, direct_trusted_mapping=True
+    )
+
+    # Then
+    assert deserialized == deserializer.deserialize(input_data=serialized)
+    assert deserialized.soft_limit == 400
+    assert deserialized.used_trusted_instantiation()
+
+
+def test_trusted_deserialization_with_complex_mapper():
+    class Bar(ImmutableStructure):
+        b: int
+
+    class Foo(ImmutableStructure):
+        a: int
+        name: str
+        source: str
+        bar: Bar
+
+        _deserialization_mapper = {
+            "a": FunctionCall(func=lambda x, y: x + y, args=["x", "y"]),
+            "name": "details.name",
+            "source": Constant("trusted"),
+            "bar._mapper": {"b": "B"},
+        }
+
+    deserializer = Deserializer(target_class=Foo)
+    serialized = {"x": 1, "y": 2, "details": {"name": "abc"}, "bar": {"B": 5}}
+
+    deserialized = deserializer.deserialize(
+        input_data=serialized, direct_trusted_mapping=True
+    )
+
+    assert deserialized == Foo(a=3, name="abc", source="trusted", bar=Bar(b=5))
+    assert deserialized == deserializer.deserialize(input_data=serialized)
+    assert deserialized.used_trusted_instantiation()
+
+
+@pytest.mark.skipif(sys.version_info < (3, 9), reason="requires python3.9 or higher")
+def test_trusted_deserialization_of_map_tuple_and_deque():
+    class Bar(ImmutableStructure):
+        b: int
+        updated: DateTime
+
+        _serialization_mapper = mappers.TO_CAMELCASE
+
+    class Foo(ImmutableStructure):
+        bar_by_name: Map[str, Bar]
+        counts: dict[str, int]
+        point: Tuple[int, DateField]
+        bars: Deque[Bar]
+        names: Deque[str]
+
+    deserializer = Deserializer(target_class=Foo)
+    serialized = {
+        "bar_by_name": {"x": {"b": 1, "updated": "01/02/20 10:20:30"}},
+        "counts": {"a": 1},
+        "point": [1, "2020-01-02"],
+        "bars": [{"b": 2, "updated": "01/03/20 10:20:30"}],
+        "names": ["a", "b"],
+    }
+
+    deserialized = deserializer.deserialize(
+        input_data=serialized, direct_trusted_mapping=True
+    )
+
+    assert deserialized == deserializer.deserialize(input_data=serialized)
+    assert deserialized.used_trusted_instantiation()
+    assert deserialized.bar_by_name["x"].used_trusted_instantiation()
+    assert deserialized.bar_by_name["x"].updated == datetime.datetime(
+        2020, 1, 2, 10, 20, 30
+    )
+    assert deserialized.point == (1, date(2020, 1, 2))
+    assert isinstance(deserialized.bars, collections.deque)
+    assert deserialized.bars[0].b == 2
 
 
 @pytest.mark.skipif(sys.version_info < (3, 9), reason="requires python3.9 or higher")
@@ -0,0 +1,182 @@
+import dataclasses
+import json
+import uuid
+from datetime import date, datetime, time
+from decimal import Decimal
+
+import pytest
+from pytest import raises
+
+from typedpy import (
+    Anything,
+    Deserializer,
+    FastSerializable,
+    Field,
+    Structure,
+    create_serializer,
+    register_standard_type_encoders,
+    register_type_encoder,
+    serialize,
+    unregister_type_encoder,
+    write_jsonl,
+)
+from typedpy.serialization.type_encoders import encode_value
+
+
+class Vector:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+    def __eq__(self, other):
+        return (self.x, self.y) == (other.x, other.y)
+
+
+class Vector3D(Vector):
+    pass
+
+
+@pytest.fixture()
+def registered_types():
+    register_type_encoder(uuid.UUID, str, uuid.UUID)
+    register_type_encoder(Vector, lambda p: [p.x, p.y], lambda v: Vector(*v))
+    yield
+    unregister_type_encoder(uuid.UUID)
+    unregister_type_encoder(Vector)
+
+
+class Foo(Structure):
+    id: Field[uuid.UUID]
+    point: Field[Vector]
+    anything: Anything
+    _required = []
+
+
+def test_encode_and_decode(registered_types):
+    foo = Foo(id=uuid.UUID(int=1), point=Vector(1, 2), anything=uuid.UUID(int=2))
+    serialized = serialize(foo)
+    assert serialized == {
+        "id": "00000000-0000-0000-0000-000000000001",
+        "point": [1, 2],
+        "anything": "00000000-0000-0000-0000-000000000002",
+    }
+    deserialized = Deserializer(Foo).deserialize(serialized)
+    assert deserialized.id == uuid.UUID(int=1)
+    assert deserialized.point == Vector(1, 2)
+    assert deserialized.anything == "00000000-0000-0000-0000-000000000002"
+
+
+def test_subclass_uses_encoder_of_base(registered_types):
+    assert serialize(Foo(anything=Vector3D(1, 2))) == {"anything": [1, 2]}
+    register_type_encoder(Vector3D, lambda p: {"x": p.x, "y": p.y})
+    assert serialize(Foo(anything=Vector3D(1, 2))) == {"anything": {"x": 1, "y": 2}}
+    unregister_type_encoder(Vector3D)
+    assert serialize(Foo(anything=Vector3D(1, 2))) == {"anything": [1, 2]}
+
+
+def test_fast_serialization(registered_types):
+    class Bar(Structure, FastSerializable):
+        id: Field[uuid.UUID]
+        anything: Anything
+
+    create_serializer(Bar)
+    assert Bar(id=uuid.UUID(int=1), anything=Vector(1, 2)).serialize() == {
+        "id": "00000000-0000-0000-0000-000000000001",
+        "anything": [1, 2],
+    }
+
+
+def test_undefined_attributes_and_jsonl(registered_types, tmp_path):
+    foo = Foo(anything=1, extra=uuid.UUID(int=1))
+    assert serialize(foo)["extra"] == "00000000-0000-0000-0000-000000000001"
+    path = tmp_path / "foo.jsonl"
+    write_jsonl(str(path), [foo])
+    assert (
+        json.loads(path.read_text())["extra"] == "00000000-0000-0000-0000-000000000001"
+    )
+
+
+def test_dataclass():
+    @dataclasses.dataclass
+    class Item:
+        name: str
+        tags: list
+
+    assert serialize(Foo(anything=Item(name="a", tags=["x"]))) == {
+        "anything": {"name": "a", "tags": ["x"]}
+    }
+
+
+def test_nested_values_are_encoded_without_json_round_trip(
+    registered_types, monkeypatch
+):
+    def dumps(*args, **kwargs):
+        raise AssertionError("json.dumps should not be called")
+
+    monkeypatch.setattr(json, "dumps", dumps)
+    value = {
+        "points": (Vector(1, 2), Vector3D(3, 4)),
+        1: [uuid.UUID(int=1), None, True, 1.5],
+        None: {"nested": [Vector(5, 6)]},
+    }
+    assert encode_value(value) == {
+        "points": [[1, 2], [3, 4]],
+        "1": ["00000000-0000-0000-0000-000000000001", None, True, 1.5],
+        "null": {"nested": [[5, 6]]},
+    }
+
+
+def test_encode_value_not_supported_by_json_err():
+    with raises(TypeError) as excinfo:
+        encode_value({(1, 2): "a"})
+    assert "keys must be str, int, float, bool or None, not tuple" in str(excinfo.value)
+    with raises(TypeError) as excinfo:
+        encode_value([{1, 2}])
+    assert "Object of type set is not JSON serializable" in str(excinfo.value)
+
+
+def test_standard_type_encoders():
+    class Bar(Structure):
+        id: Field[uuid.UUID]
+        data: Field[bytes]
+        anything: Anything
+        _required = []
+
+    register_standard_type_encoders()
+    try:
+        bar = Bar(
+            id=uuid.UUID(int=1),
+            data=b"\x00\x01",
+            anything=[datetime(2020, 1, 31, 7, 15), date(2020, 1, 31), Decimal("1.5")],
+        )
+        serialized = serialize(bar)
+        assert serialized == {
+            "id": "00000000-0000-0000-0000-000000000001",
+            "data": "AAE=",
+            "anything": ["2020-01-31T07:15:00", "2020-01-31", "1.5"],
+        }
+        deserialized = Deserializer(Bar).deserialize(serialized)
+        assert deserialized.id == bar.id
+        assert deserialized.data == bar.data
+    finally:
+        for cls in [uuid.UUID, Decimal, datetime, date, time, bytes]:
+            unregister_type_encoder(cls)
+
+
+def test_decoder_error(registered_types):
+    with raises(ValueError) as excinfo:
+        Deserializer(Foo).deserialize({"id": "xyz"})
+    assert "id: Got 'xyz'; badly formed hexadecimal UUID string" in str(excinfo.value)
+
+
+def test_not_serializable_without_encoder():
+    with raises(ValueError) as excinfo:
+        serialize(Foo(anything=1, extra=uuid.UUID(int=1)))
+    assert "extra: cannot serialize value" in str(excinfo.value)
+
+
+def test_register_invalid_err():
+    with raises(TypeError):
+        register_type_encoder("UUID", str)
+    with raises(TypeError):
+        register_type_encoder(uuid.UUID, "str")
@@ -47,6 +47,26 @@ from .serialization import (
     HasTypes,
     create_serializer,
     FastSerializable,
+    Discriminated,
+    read_jsonl,
+    write_jsonl,
+    serialize_many,
+    serialize_async,
+    get_masked_serializer,
+    serialize_changes,
+    apply_patch,
+    register_type_encoder,
+    unregister_type_encoder,
+    register_standard_type_encoders,
+    serialize_binary,
+    deserialize_binary,
+    binary_schema_fingerprint,
+    serialize_positional,
+    deserialize_positional,
+    RecordArray,
+    record_format,
+    to_columns,
+    from_columns,
 )
 
 from .extfields import (
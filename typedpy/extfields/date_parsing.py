@@ -0,0 +1,230 @@
+"""
+Parsers and formatters of dates and times that are specialized, once, for a format.
+datetime.strptime is slow, since it interprets the format on every call. Instead:
+
+* ISO-8601 formats are parsed with fromisoformat, and formatted with isoformat.
+* Other formats that consist of numeric directives separated by literals are parsed with a
+  precompiled regular expression.
+
+A value that the fast path does not accept is parsed with strptime, so the results and the
+errors are always the same as those of strptime.
+"""
+import re
+from datetime import date, datetime, time
+from functools import lru_cache
+
+# The same patterns that strptime uses, restricted to ASCII digits
+_directive_patterns = {
+    "Y": r"\d\d\d\d",
+    "y": r"\d\d",
+    "m": r"1[0-2]|0[1-9]|[1-9]",
+    "d": r"3[01]|[12]\d|0[1-9]|[1-9]| [1-9]",
+    "H": r"2[0-3]|[0-1]\d|\d",
+    "M": r"[0-5]\d|\d",
+    "S": r"6[0-1]|[0-5]\d|\d",
+    "f": r"[0-9]{1,6}",
+}
+
+# the index of each directive in the arguments of the datetime constructor
+_directive_positions = {"Y": 0, "y": 0, "m": 1, "d": 2, "H": 3, "M": 4, "S": 5, "f": 6}
+
+
+def _two_digit_year(value: str) -> int:
+    year = int(value)
+    return year + 2000 if year <= 68 else year + 1900
+
+
+def _microseconds(value: str) -> int:
+    return int(value.ljust(6, "0"))
+
+
+_directive_converters = {"y": _two_digit_year, "f": _microseconds}
+
+# For ISO formats: the length of the value, and the expected separators by their index
+_iso_formats = {
+    "%Y-%m-%d": (10, ((4, "-"), (7, "-"))),
+    "%Y-%m-%dT%H:%M:%S": (19, ((4, "-"), (7, "-"), (10, "T"), (13, ":"), (16, ":"))),
+    "%Y-%m-%d %H:%M:%S": (19, ((4, "-"), (7, "-"), (10, " "), (13, ":"), (16, ":"))),
+    "%H:%M:%S": (8, ((2, ":"), (5, ":"))),
+}
+
+
+def _compile_regex_parser(datetime_format: str):
+    """
+    Returns a function that parses a string in the given format to a datetime, or returns None
+    if the string is not in the canonical form of the format. Returns None if the format is
+    not supported.
+    """
+    pattern = []
+    converters = []
+    previous_is_directive = False
+    for token in re.split(r"(%.)", datetime_format):
+        if not token:
+            continue
+        if token == "%%":
+            pattern.append("%")
+            previous_is_directive = False
+        elif token.startswith("%"):
+            directive = token[1]
+            # adjacent directives are ambiguous, so leave them to strptime
+            if directive not in _directive_patterns or previous_is_directive:
+                return None
+            pattern.append(f"({_directive_patterns[directive]})")
+            converters.append(
+                (
+                    _directive_positions[directive],
+                    _directive_converters.get(directive, int),
+                )
+            )
+            previous_is_directive = True
+        else:
+            if "%" in token:
+                return None
+            pattern.append(re.escape(token))
+            previous_is_directive = False
+    positions = [position for position, _ in converters]
+    if not converters or len(set(positions)) != len(positions):
+        return None
+    fullmatch = re.compile("".join(pattern), re.ASCII).fullmatch
+    indexed_converters = tuple(enumerate(converters))
+
+    def parse(value: str):
+        match = fullmatch(value)
+        if match is None:
+            return None
+        groups = match.groups()
+        args = [1900, 1, 1, 0, 0, 0, 0]
+        for index, (position, convert) in indexed_converters:
+            args[position] = convert(groups[index])
+        try:
+            return datetime(*args)
+        except ValueError:
+            return None
+
+    return parse
+
+
+def _matches_iso_layout(value, length, separators) -> bool:
+    if len(value) != length:
+        return False
+    for index, char in separators:
+        if value[index] != char:
+            return False
+    return True
+
+
+@lru_cache(maxsize=128)
+def get_datetime_parser(datetime_format: str):
+    """
+    Returns a function that parses a string to a datetime, like datetime.strptime(value, datetime_format)
+    """
+    iso_layout = _iso_formats.get(datetime_format)
+    if iso_layout and iso_layout[0] == 19:
+        length, separators = iso_layout
+
+        def parse_iso(value):
+            if value.__class__ is str and _matches_iso_layout(
+                value, length, separators
+            ):
+                try:
+                    return datetime.fromisoformat(value)
+                except ValueError:
+                    pass
+            return datetime.strptime(value, datetime_format)
+
+        return parse_iso
+
+    parse_fast = _compile_regex_parser(datetime_format)
+    if parse_fast is None:
+        return lambda value: datetime.strptime(value, datetime_format)
+
+    def parse(value):
+        result = parse_fast(value) if value.__class__ is str else None
+        return (
+            result if result is not None else datetime.strptime(value, datetime_format)
+        )
+
+    return parse
+
+
+@lru_cache(maxsize=128)
+def get_date_parser(date_format: str):
+    """
+    Returns a function that parses a string to a date, like datetime.strptime(value, date_format).date()
+    """
+    if date_format == "%Y-%m-%d":
+        length, separators = _iso_formats[date_format]
+
+        def parse_iso(value):
+            if value.__class__ is str and _matches_iso_layout(
+                value, length, separators
+            ):
+                try:
+                    return date.fromisoformat(value)
+                except ValueError:
+                    pass
+            return datetime.strptime(value, date_format).date()
+
+        return parse_iso
+    parse_datetime = get_datetime_parser(date_format)
+    return lambda value: parse_datetime(value).date()
+
+
+@lru_cache(maxsize=128)
+def get_time_parser(time_format: str):
+    """
+    Returns a function that parses a string to a time, like datetime.strptime(value, time_format).time()
+    """
+    if time_format == "%H:%M:%S":
+        length, separators = _iso_formats[time_format]
+
+        def parse_iso(value):
+            if value.__class__ is str and _matches_iso_layout(
+                value, length, separators
+            ):
+                try:
+                    return time.fromisoformat(value)
+                except ValueError:
+                    pass
+            return datetime.strptime(value, time_format).time()
+
+        return parse_iso
+    parse_datetime = get_datetime_parser(time_format)
+    return lambda value: parse_datetime(value).time()
+
+
+@lru_cache(maxsize=128)
+def get_formatter(datetime_format: str):
+    """
+    Returns a function that formats a date, time or datetime, like value.strftime(datetime_format)
+    """
+    if datetime_format == "%Y-%m-%d":
+
+        def format_date(value):
+            if value.__class__ is date and value.year >= 1000:
+                return value.isoformat()
+            return value.strftime(datetime_format)
+
+        return format_date
+    if datetime_format in ("%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M:%S"):
+        separator = datetime_format[8]
+
+        def format_datetime(value):
+            if (
+                value.__class__ is datetime
+                and value.year >= 1000
+                and value.tzinfo is None
+            ):
+                return value.isoformat(separator, "seconds")
+            return value.strftime(datetime_format)
+
+        return format_datetime
+    if datetime_format == "%H:%M:%S":
+
+        def format_time(value):
+            if value.__class__ is time and value.tzinfo is None:
+                return value.isoformat("seconds")
+            return value.strftime(datetime_format)
+
+        return format_time
+    return lambda value: value.strftime(datetime_format)
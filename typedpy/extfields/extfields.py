@@ -3,12 +3,24 @@ Additional types of fields: datefield, datetime, timestring, DateString,
 Hostname, etc.
 """
 import json
-from datetime import datetime, date, time
+from datetime import datetime, date, time, timezone
+from functools import lru_cache
 import re
 
 from typedpy.commons import wrap_val
 from typedpy.structures import TypedField
 from typedpy.fields import SerializableField, String
+from .date_parsing import (
+    get_date_parser,
+    get_datetime_parser,
+    get_formatter,
+    get_time_parser,
+)
+
+
+def _with_cache(parse, cache_size: int):
+    return lru_cache(maxsize=cache_size)(parse) if cache_size else parse
+
 
 EmailAddress = String(pattern=r"(^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9]+$)")
 
@@ -92,12 +104,13 @@ class DateString(String):
 
     def __init__(self, *args, date_format="%Y-%m-%d", **kwargs):
         self._format = date_format
+        self._parse = get_datetime_parser(date_format)
         super().__init__(*args, **kwargs)
 
     def __set__(self, instance, value):
         super().__set__(instance, value)
         try:
-            datetime.strptime(value, self._format)
+            self._parse(value)
         except ValueError as ex:
             raise ValueError(
                 f"{self._name}: Got {wrap_val(value)}; {ex.args[0]}"
@@ -120,10 +133,12 @@ class TimeString(TypedField):
 
     _ty = str
 
+    _parse = staticmethod(get_time_parser("%H:%M:%S"))
+
     def __set__(self, instance, value):
         super().__set__(instance, value)
         try:
-            datetime.strptime(value, "%H:%M:%S")
+            self._parse(value)
         except ValueError as ex:
             raise ValueError(
                 f"{self._name}: Got {wrap_val(value)}; {ex.args[0]}"
@@ -150,6 +165,9 @@ class DateField(SerializableField):
     Arguments:
          date_format(str): optional
              The date format used to convert to/from a string. Default is '%Y-%m-%d'
+         cache_size(int): optional
+             If positive, the dates of up to this number of recently parsed strings are cached, which
+             is useful when the same dates repeat across many records. Default is 0 (no cache).
 
     Example:
 
@@ -165,16 +183,18 @@ class DateField(SerializableField):
 
     """
 
-    def __init__(self, *args, date_format="%Y-%m-%d", **kwargs):
+    def __init__(self, *args, date_format="%Y-%m-%d", cache_size: int = 0, **kwargs):
         self._date_format = date_format
+        self._parse = _with_cache(get_date_parser(date_format), cache_size)
+        self._formatter = get_formatter(date_format)
         super().__init__(*args, **kwargs)
 
     def serialize(self, value):
-        return value.strftime(self._date_format)
+        return self._formatter(value)
 
     def deserialize(self, value):
         try:
-            return datetime.strptime(value, self._date_format).date()
+            return self._parse(value)
         except ValueError as ex:
             raise ValueError(f"{self._name}: Got { wrap_val(value)}; {str(ex)}") from ex
 
@@ -204,8 +224,10 @@ class DateField(SerializableField):
 
 
 class TimeField(SerializableField):
-    def __init__(self, format_str="%H:%M:%S", **kwargs):
+    def __init__(self, format_str="%H:%M:%S", cache_size: int = 0, **kwargs):
         self._format = format_str
+        self._parse = _with_cache(get_time_parser(format_str), cache_size)
+        self._formatter = get_formatter(format_str)
         super().__init__(**kwargs)
 
     def __set__(self, instance, value):
@@ -213,11 +235,11 @@ class TimeField(SerializableField):
         super().__set__(instance, parsed_time)
 
     def serialize(self, value: time):
-        return value.strftime(self._format)
+        return self._formatter(value)
 
     def deserialize(self, value):
         try:
-            return datetime.strptime(value, self._format).time()
+            return self._parse(value)
         except ValueError as ex:
             raise ValueError(f"{self._name}: Got {wrap_val(value)}; {str(ex)}") from ex
 
@@ -233,6 +255,10 @@ class TimeField(SerializableField):
         return "TimeField()" if schema == {"type": "string", "format": "time"} else None
 
 
+def _from_utc_epoch(value) -> datetime:
+    return datetime.fromtimestamp(value, tz=timezone.utc).replace(tzinfo=None)
+
+
 class DateTime(SerializableField):
     """
     A datetime.datetime field. Can accept either a datetime object, or a string
@@ -241,6 +267,15 @@ class DateTime(SerializableField):
     Arguments:
         datetime_format(str): optional
             The format used to convert to/from a string. Default is '%m/%d/%y %H:%M:%S'
+        cache_size(int): optional
+            If positive, the datetimes of up to this number of recently parsed strings are cached, which
+            is useful when the same timestamps repeat across many records. Default is 0 (no cache).
+        store_epoch(bool): optional
+            If True, the value is stored as a POSIX timestamp, and converted to a datetime only when
+            it is accessed. Integer timestamps, as commonly found in the input, are then stored as they
+            are, without creating a datetime. In this mode, all the values are naive datetimes in UTC,
+            so that they are returned exactly as they were assigned, regardless of the local time zone.
+            Timezone-aware datetimes are rejected. Default is False.
 
     Example:
 
@@ -256,32 +291,67 @@ class DateTime(SerializableField):
 
     """
 
-    def __init__(self, *args, datetime_format="%m/%d/%y %H:%M:%S", **kwargs):
+    def __init__(
+        self,
+        *args,
+        datetime_format="%m/%d/%y %H:%M:%S",
+        cache_size: int = 0,
+        store_epoch: bool = False,
+        **kwargs,
+    ):
         self._datetime_format = datetime_format
+        self._parse = _with_cache(get_datetime_parser(datetime_format), cache_size)
+        self._formatter = get_formatter(datetime_format)
+        self._store_epoch = store_epoch
         super().__init__(*args, **kwargs)
 
     def serialize(self, value: datetime):
-        return value.strftime(self._datetime_format)
+        if value.__class__ is not datetime and isinstance(value, (int, float)):
+            value = _from_utc_epoch(value)
+        return self._formatter(value)
 
     def deserialize(self, value):
         try:
             if isinstance(value, int) and 2000000000 > value > 1000000000:
-                return datetime.fromtimestamp(value)
-            return datetime.strptime(value, self._datetime_format)
+                # in store_epoch mode, the timestamp is stored as is
+                return value if self._store_epoch else datetime.fromtimestamp(value)
+            return self._parse(value)
         except ValueError as ex:
             raise ValueError(f"{self._name}: Got {wrap_val(value)}; {str(ex)}") from ex
 
+    def __get__(self, instance, owner):
+        value = super().__get__(instance, owner)
+        if self._store_epoch and isinstance(value, (int, float)):
+            return _from_utc_epoch(value)
+        return value
+
     def __set__(self, instance, value):
         if isinstance(value, datetime):
+            super().__set__(instance, self._to_stored(value))
+        elif (
+            self._store_epoch
+            and isinstance(value, int)
+            and 2000000000 > value > 1000000000
+        ):
             super().__set__(instance, value)
         elif isinstance(value, (str, int)):
             as_datetime = self.deserialize(value)
-            super().__set__(instance, as_datetime)
+            super().__set__(instance, self._to_stored(as_datetime))
         else:
             raise TypeError(
                 f"{self._name}: Got {wrap_val(value)}; Expected datetime or str"
             )
 
+    def _to_stored(self, value: datetime):
+        if not self._store_epoch:
+            return value
+        if value.tzinfo is not None:
+            raise ValueError(
+                f"{self._name}: Got {wrap_val(value)}; Expected a naive datetime in UTC"
+            )
+        timestamp = value.replace(tzinfo=timezone.utc).timestamp()
+        return int(timestamp) if timestamp.is_integer() else timestamp
+
     @property
     def get_type(self):
         return datetime
@@ -42,3 +42,7 @@ from .boolean import Boolean
 from .strings import String, SizedString, ImmutableString
 
 from .collections_impl import SizedCollection, _DictStruct, _ListStruct, _DequeStruct
+from .structure_array import StructureArray, StructureColumns
+from .numeric_arrays import IntArray, FloatArray
+from .bytes_field import Bytes
+from .categorical import Categorical
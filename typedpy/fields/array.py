@@ -1,3 +1,4 @@
+from decimal import Decimal
 from typing import Callable
 
 from typedpy.structures import (
@@ -10,6 +11,7 @@ from typedpy.structures import (
 from typedpy.commons import python_ver_atleast_39
 from .collections_impl import (
     _ListStruct,
+    _wrap_unpickled,
     SizedCollection,
     ContainNestedFieldMixin,
     _CollectionMeta,
@@ -168,6 +170,13 @@ class Array(
             return _ListStruct(self, instance, value, self._name)
         return value
 
+    def _from_pickled_value(self, value, instance):
+        items = self.items
+        if hasattr(items, "_from_pickled_value"):
+            temp_st = Structure()
+            value = [items._from_pickled_value(v, temp_st) for v in value]
+        return _wrap_unpickled(_ListStruct, self, instance, value, self._name)
+
     def serialize(self, value):
         cached: Callable = getattr(self, "_serialize", None)
         if cached is not None:
@@ -175,9 +184,14 @@ class Array(
         items = self.items
         if items is not None:
             if isinstance(items, Field):
-                if isinstance(items, Number) or items.__class__ is String:
+                if items.__class__ is String:
                     self._serialize = lambda value: value
                     return value
+                if isinstance(items, Number):
+                    self._serialize = lambda value: [
+                        str(x) if x.__class__ is Decimal else x for x in value
+                    ]
+                    return self._serialize(value)
                 if isinstance(items, ClassReference):
                     serializer = items._ty.serialize
                     self._serialize = lambda value: [serializer(x) for x in value]
@@ -0,0 +1,135 @@
+import binascii
+import re
+
+from typedpy.commons import wrap_val
+from .serializable_field import SerializableField
+
+_BASE64_PATTERN = re.compile(r"[A-Za-z0-9+/]*={0,2}")
+
+
+def encode_base64(data) -> str:
+    """
+    Encode binary data to a base64 string, directly from its buffer, without copying it first
+    """
+    return binascii.b2a_base64(memoryview(data).cast("B"), newline=False).decode(
+        "ascii"
+    )
+
+
+def decode_base64(value: str) -> bytes:
+    """
+    The inverse of :func:`encode_base64`. The string is validated and decoded as is, without
+    encoding it to bytes first
+    """
+    if len(value) % 4 or not _BASE64_PATTERN.fullmatch(value):
+        raise ValueError("Invalid base64 string")
+    return binascii.a2b_base64(value)
+
+
+class Bytes(SerializableField):
+    """
+    A binary field. Accepts bytes, bytearray, memoryview, or any other object that supports
+    the buffer protocol, such as an mmap. It is serialized to a base64 string.
+
+    By default, the value is stored as bytes. An immutable bytes object is stored as is,
+    without a copy, and is never defensively copied, even in an immutable structure.
+    Other objects are copied to a new bytes object.
+
+    With as_memoryview=True, the value is stored as a read-only memoryview of the original
+    object, without copying it at all. This is useful for large blobs that are sliced from a
+    bigger buffer, but note that changes in the original buffer are visible through the field.
+    In an immutable structure, a memoryview of a mutable buffer is copied.
+
+    Arguments:
+        minLength(int): optional
+            The minimal number of bytes
+        maxLength(int): optional
+            The maximal number of bytes
+        as_memoryview(bool): optional
+            Store a read-only memoryview instead of bytes. Default is False.
+
+    Example:
+
+    .. code-block:: python
+
+        class Attachment(Structure):
+            name: String
+            content: Bytes(maxLength=10_000_000)
+
+        attachment = Attachment(name="a.png", content=b"\\x89PNG...")
+        assert serialize(attachment) == {"name": "a.png", "content": "iVBORy4uLg=="}
+
+    """
+
+    def __init__(
+        self,
+        *args,
+        minLength: int = None,
+        maxLength: int = None,
+        as_memoryview: bool = False,
+        **kwargs,
+    ):
+        self.minLength = minLength
+        self.maxLength = maxLength
+        self.as_memoryview = as_memoryview
+        super().__init__(*args, **kwargs)
+
+    def _to_stored(self, value):
+        if isinstance(value, str):
+            raise TypeError(f"{self._name}: Got {wrap_val(value)}; Expected bytes")
+        try:
+            if self.as_memoryview:
+                return memoryview(value).cast("B").toreadonly()
+            return value if isinstance(value, bytes) else bytes(memoryview(value))
+        except TypeError:
+            raise TypeError(
+                f"{self._name}: Got {wrap_val(value)}; Expected bytes"
+            ) from None
+
+    def _validate_length(self, value):
+        size = len(value)
+        if self.minLength is not None and size < self.minLength:
+            raise ValueError(
+                f"{self._name}: Expected a minimum length of {self.minLength}; Got {size} bytes"
+            )
+        if self.maxLength is not None and size > self.maxLength:
+            raise ValueError(
+                f"{self._name}: Expected a maximum length of {self.maxLength}; Got {size} bytes"
+            )
+
+    def __set__(self, instance, value):
+        if getattr(instance, "_trust_supplied_values", False):
+            super().__set__(instance, value)
+            return
+        value = self._to_stored(value)
+        self._validate_length(value)
+        super().__set__(instance, value)
+
+    @property
+    def get_type(self):
+        return bytes
+
+    def serialize(self, value):
+        return encode_base64(value)
+
+    def deserialize(self, value):
+        if not isinstance(value, str):
+            raise TypeError(
+                f"{self._name}: Got {wrap_val(value)}; Expected a base64 string"
+            )
+        try:
+            decoded = decode_base64(value)
+        except (binascii.Error, ValueError) as ex:
+            raise ValueError(
+                f"{self._name}: Got {wrap_val(value[:20])}...; Expected a base64 string"
+            ) from ex
+        return memoryview(decoded).toreadonly() if self.as_memoryview else decoded
+
+    def __serialize__(self, value):
+        return bytes(value) if isinstance(value, memoryview) else value
+
+    def _from_pickled_value(self, value, instance):
+        return memoryview(value) if self.as_memoryview else value
+
+    def to_json_schema(self) -> dict:
+        return {"type": "string", "contentEncoding": "base64"}
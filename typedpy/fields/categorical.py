@@ -0,0 +1,141 @@
+import threading
+
+from typedpy.commons import wrap_val
+from typedpy.structures import Field
+from .strings import String
+
+# guards the addition of new categories. Looking up existing ones does not need it.
+_lock = threading.Lock()
+
+
+class Categorical(String):
+    """
+    A String field for values of low cardinality, such as a country or a status, that repeat
+    across many structures. Every distinct value is interned in a per-field table, so that all
+    the structures share a single str object per value. This saves memory, and makes equality
+    checks of the values identity-fast.
+    A value is validated only the first time it is seen. Afterwards, it is just looked up.
+    To keep the table from growing without a limit when the values are not really of low
+    cardinality, once it holds max_interned values, new values are validated and kept as
+    they are, without interning them.
+
+    Every category in the table has an integer code: its index in the table. It can be used by
+    :func:`to_columns` (with enum_codes=True) and by :func:`serialize_binary`.
+    The codes of the predefined categories are fixed. The codes of other values depend on
+    the order in which they were first seen, so they are only valid within the same process,
+    and must not be persisted or sent to another process.
+
+    Arguments:
+        categories(list[str]): optional
+            Predefined categories, with fixed codes. Other values are still allowed.
+        max_categories(int): optional
+            The maximal number of distinct values. A new value beyond it raises a ValueError.
+        max_interned(int): optional
+            The maximal number of values to intern. Default is 10000.
+        minLength, maxLength, pattern: optional
+            Like in :class:`String`
+
+    Example:
+
+    .. code-block:: python
+
+        class Order(Structure):
+            country: Categorical(categories=["US", "UK"], max_categories=300)
+            status: Categorical
+
+        first = Order(country="US", status="shipped")
+        second = Order(country="US", status="".join(["ship", "ped"]))
+        assert first.status is second.status
+
+    """
+
+    def __init__(
+        self, *args, categories=None, max_categories=None, max_interned=10000, **kwargs
+    ):
+        self._categories = []
+        self._code_by_value = {}
+        self.max_categories = max_categories
+        self.max_interned = max(max_interned, len(categories or []))
+        super().__init__(*args, **kwargs)
+        for value in categories or []:
+            self._intern(value)
+        self.predefined_size = len(self._categories)
+
+    @property
+    def categories(self) -> tuple:
+        """
+        All the known categories, ordered by their codes
+        """
+        return tuple(self._categories)
+
+    def _intern(self, value: str) -> str:
+        code = self._code_by_value.get(value)
+        if code is not None:
+            return self._categories[code]
+        self._validate(value)
+        with _lock:
+            code = self._code_by_value.get(value)
+            if code is None:
+                if (
+                    self.max_categories is not None
+                    and len(self._categories) >= self.max_categories
+                ):
+                    raise ValueError(
+                        f"{self._name}: Got {wrap_val(value)}; Expected at most"
+                        f" {self.max_categories} categories"
+                    )
+                if len(self._categories) >= self.max_interned:
+                    return value
+                code = len(self._categories)
+                self._categories.append(value)
+                self._code_by_value[value] = code
+        return self._categories[code]
+
+    def _intern_trusted(self, value):
+        try:
+            return self._intern(value)
+        except (TypeError, ValueError):
+            return value
+
+    def code_of(self, value: str) -> int:
+        """
+        Returns the code of a value, adding it as a new category if needed.
+        Raises ValueError if the table is full, so that the value has no code.
+        """
+        self._intern(value)
+        code = self._code_by_value.get(value)
+        if code is None:
+            raise ValueError(
+                f"{self._name}: Got {wrap_val(value)}; Expected one of the"
+                f" {self.max_interned} interned categories, that have a code"
+            )
+        return code
+
+    def find_code(self, value):
+        """
+        Returns the code of a value, or None if it is not a known category
+        """
+        return self._code_by_value.get(value)
+
+    def category(self, code: int) -> str:
+        """
+        Returns the value of a code
+        """
+        if not isinstance(code, int) or not 0 <= code < len(self._categories):
+            raise ValueError(f"{self._name}: Got {wrap_val(code)}; Expected a code")
+        return self._categories[code]
+
+    def __set__(self, instance, value):
+        if not isinstance(value, str):
+            super().__set__(instance, value)
+        elif getattr(instance, "_trust_supplied_values", False):
+            super().__set__(instance, self._intern_trusted(value))
+        else:
+            # _intern validates the values that were not seen before
+            Field.__set__(self, instance, self._intern(value))
+
+    def _from_trusted_value(self, value, instance):
+        return self._intern_trusted(value) if isinstance(value, str) else value
+
+    def _from_pickled_value(self, value, instance):
+        return self._from_trusted_value(value, instance)
@@ -10,6 +10,7 @@ from typedpy.structures import (
     TypedPyDefaults,
 )
 from typedpy.structures.consts import DISABLE_PROTECTION
+from typedpy.structures.structures import changed_fields, changed_keys
 
 
 class _CollectionMeta(FieldMeta):
@@ -310,6 +311,25 @@ class _DequeStruct(deque, ImmutableMixin, _IteratorProxyMixin):
         super().__init__(state["the_values"])
 
 
+def _assign_updated_map(the_map, copied, keys):
+    """
+    Assign the updated copy of a map to its field. In a structure that tracks its changes, only
+    the keys that were changed in place are recorded, rather than the whole field.
+    """
+    instance = the_map._instance
+    name = getattr(the_map._field_definition, "_name", None)
+    the_dict = instance.__dict__
+    changed = the_dict.get(changed_fields)
+    if changed is None or name in changed:
+        setattr(instance, name, copied)
+        return
+    keys_by_name = the_dict[changed_keys]
+    previous_keys = keys_by_name.get(name, set())
+    setattr(instance, name, copied)
+    changed.discard(name)
+    keys_by_name[name] = previous_keys | set(keys)
+
+
 class _DictStruct(dict, ImmutableMixin):
     """
     This is a useful wrapper for the content of dict in an Map field.
@@ -331,9 +351,7 @@ class _DictStruct(dict, ImmutableMixin):
         copied = self.copy()
         copied.__setitem__(key, value)
         if getattr(self, "_instance", None):
-            setattr(
-                self._instance, getattr(self._field_definition, "_name", None), copied
-            )
+            _assign_updated_map(self, copied, [key])
 
         super().__setitem__(key, value)
 
@@ -365,25 +383,25 @@ class _DictStruct(dict, ImmutableMixin):
         self._raise_if_immutable()
         copied = self.copy()
         del copied[key]
-        setattr(self._instance, getattr(self._field_definition, "_name", None), copied)
+        _assign_updated_map(self, copied, [key])
 
     def update(self, *args, **kwargs):
         self._raise_if_immutable()
         copied = self.copy()
-        res = copied.update(*args, **kwargs)
-        setattr(self._instance, getattr(self._field_definition, "_name", None), copied)
-        return res
+        updates = dict(*args, **kwargs)
+        copied.update(updates)
+        _assign_updated_map(self, copied, updates)
 
     def pop(self, k):
         self._raise_if_immutable()
         copied = self.copy()
         res = copied.pop(k)
-        setattr(self._instance, getattr(self._field_definition, "_name", None), copied)
+        _assign_updated_map(self, copied, [k])
         return res
 
     def clear(self) -> None:
         self._raise_if_immutable()
-        setattr(self._instance, getattr(self._field_definition, "_name", None), {})
+        _assign_updated_map(self, {}, list(dict.keys(self)))
 
     def __getstate__(self):
         return {
@@ -400,6 +418,137 @@ class _DictStruct(dict, ImmutableMixin):
         super().__init__(state["mydict"])
 
 
+class _SetStruct(set, ImmutableMixin):
+    """
+    This is a useful wrapper for the content of set in a Set field.
+    It ensures that an update of the form:
+     mystruct.my_set.add(val)
+    Will not bypass the validation of the Set.
+    """
+
+    def __init__(self, the_set, struct_instance, myset, name):
+        self._field_definition = the_set
+        self._instance = struct_instance
+        self._name = name
+        super().__init__(myset)
+
+    def _update(self, method, *args):
+        self._raise_if_immutable()
+        copied = set(self)
+        res = getattr(copied, method)(*args)
+        if res is not NotImplemented:
+            setattr(self._instance, self._field_name, copied)
+        return res
+
+    @property
+    def _field_name(self):
+        return getattr(self._field_definition, "_name", None)
+
+    def add(self, element):
+        self._update("add", element)
+
+    def discard(self, element):
+        self._update("discard", element)
+
+    def remove(self, element):
+        self._update("remove", element)
+
+    def pop(self):
+        return self._update("pop")
+
+    def clear(self) -> None:
+        self._update("clear")
+
+    def update(self, *others):
+        self._update("update", *others)
+
+    def difference_update(self, *others):
+        self._update("difference_update", *others)
+
+    def intersection_update(self, *others):
+        self._update("intersection_update", *others)
+
+    def symmetric_difference_update(self, other):
+        self._update("symmetric_difference_update", other)
+
+    def _update_in_place(self, method, other):
+        if self._update(method, other) is NotImplemented:
+            return NotImplemented
+        return self._instance.__dict__[self._field_name]
+
+    def __ior__(self, other):
+        return self._update_in_place("__ior__", other)
+
+    def __iand__(self, other):
+        return self._update_in_place("__iand__", other)
+
+    def __isub__(self, other):
+        return self._update_in_place("__isub__", other)
+
+    def __ixor__(self, other):
+        return self._update_in_place("__ixor__", other)
+
+    def copy(self):
+        copied = set(self)
+        return deepcopy(copied) if self._is_immutable() else copied
+
+    def __deepcopy__(self, memo):
+        instance_id = id(self._instance)
+        return _SetStruct(
+            the_set=self._field_definition,
+            struct_instance=memo.get(instance_id, self._instance),
+            myset={deepcopy(v) for v in set.__iter__(self)},
+            name=self._name,
+        )
+
+    def __reduce__(self):
+        return _SetStruct, (None, None, (), None), self.__getstate__()
+
+    def __getstate__(self):
+        return {
+            "_instance": self._instance,
+            "_set": self._field_definition,
+            "myset": set(self),
+            "_name": self._name,
+        }
+
+    def __setstate__(self, state):
+        self._field_definition = state["_set"]
+        self._instance = state["_instance"]
+        self._name = state["_name"]
+        set.update(self, state["myset"])
+
+
+def _unwrap_collections(value):
+    """
+    Strip the collection wrappers from a value, recursively, leaving plain lists, deques, dicts and sets.
+    Used for pickling, so that the stream does not include the owner structure or the field
+    definitions.
+    """
+    if isinstance(value, _ListStruct):
+        return [_unwrap_collections(v) for v in list.__iter__(value)]
+    if isinstance(value, _DictStruct):
+        return {k: _unwrap_collections(v) for k, v in dict.items(value)}
+    if isinstance(value, _DequeStruct):
+        return deque(_unwrap_collections(v) for v in deque.__iter__(value))
+    if isinstance(value, _SetStruct):
+        return set(set.__iter__(value))
+    return value
+
+
+def _wrap_unpickled(wrapper_class, field, instance, values, name):
+    """
+    Create a collection wrapper for values that were just unpickled. These values are not shared
+    with anything else, so unlike the regular constructor, no defensive copy is made.
+    """
+    wrapper = wrapper_class.__new__(wrapper_class)
+    wrapper._field_definition = field
+    wrapper._instance = instance
+    wrapper._name = name
+    super(wrapper_class, wrapper).__init__(values)
+    return wrapper
+
+
 class ContainNestedFieldMixin(Field):
     def _set_immutable(self, immutable: bool):
         items = getattr(self, "items", None)
@@ -410,3 +559,6 @@ class ContainNestedFieldMixin(Field):
             for item in items:
                 if isinstance(item, Field):
                     item._set_immutable(immutable)
+
+    def __serialize__(self, value):
+        return _unwrap_collections(value)
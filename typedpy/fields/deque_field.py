@@ -4,6 +4,7 @@ from typedpy.structures import Field, Structure, TypedField, ImmutableField
 from .array import _get_items, extract_field_value
 from .collections_impl import (
     _DequeStruct,
+    _wrap_unpickled,
     SizedCollection,
     ContainNestedFieldMixin,
     _CollectionMeta,
@@ -104,6 +105,13 @@ class Deque(
 
         super().__set__(instance, _DequeStruct(self, instance, value, self._name))
 
+    def _from_pickled_value(self, value, instance):
+        items = self.items
+        if hasattr(items, "_from_pickled_value"):
+            temp_st = Structure()
+            value = deque(items._from_pickled_value(v, temp_st) for v in value)
+        return _wrap_unpickled(_DequeStruct, self, instance, value, self._name)
+
     def serialize(self, value):
         if self.items is not None:
             if isinstance(self.items, Field):
@@ -4,6 +4,7 @@ from typedpy.structures import TypedField, Structure, ImmutableField
 
 from .collections_impl import (
     _DictStruct,
+    _wrap_unpickled,
     SizedCollection,
     ContainNestedFieldMixin,
     _CollectionMeta,
@@ -84,6 +85,15 @@ class Map(
 
         super().__set__(instance, _DictStruct(self, instance, value, self._name))
 
+    def _from_pickled_value(self, value, instance):
+        value_field = self.items[1] if self.items is not None else None
+        if hasattr(value_field, "_from_pickled_value"):
+            temp_st = Structure()
+            value = {
+                k: value_field._from_pickled_value(v, temp_st) for k, v in value.items()
+            }
+        return _wrap_unpickled(_DictStruct, self, instance, value, self._name)
+
     def serialize(self, value):
         if self.items is not None:
             key_field, value_field = self.items[0], self.items[1]
@@ -42,6 +42,45 @@ class MultiFieldWrapper:
     def get_fields(self):
         return self._fields
 
+    def _field_options_for(self, value):
+        """
+        The field options that are worth trying for the given value. Options that use the
+        plain type check of :class:`TypedField` are filtered by the type of the value, and the
+        result is cached per type.
+        """
+        options_by_type = self.__dict__.setdefault("_options_by_type", {})
+        value_type = value.__class__
+        options = options_by_type.get(value_type)
+        if options is None:
+            options = [
+                field
+                for field in self.get_fields()
+                if not (
+                    isinstance(field, TypedField)
+                    and field.__class__._validate is TypedField._validate
+                )
+                or isinstance(value, field._ty)
+            ]
+            options_by_type[value_type] = options
+        return options
+
+    def _serialize_by_matching_field(self, value):
+        """
+        Serialize the value using the first field option that it is valid for
+        """
+        if value is None:
+            return None
+        for field in self._field_options_for(value):
+            validate = getattr(field, "_validate", None)
+            if validate is not None:
+                try:
+                    validate(value)
+                except Exception:  # pylint: disable=broad-except
+                    continue
+            return field.serialize(value)
+        name = getattr(self, "_name", None)
+        raise ValueError(f"{name}: cannot serialize value: {wrap_val(value)}")
+
 
 class AllOf(MultiFieldWrapper, Field, metaclass=_JSONSchemaDraft4ReuseMeta):
     """
@@ -111,6 +150,9 @@ class AnyOf(MultiFieldWrapper, Field, metaclass=_JSONSchemaDraft4ReuseMeta):
                     self._is_optional = True
                 else:
                     self._not_nonefield = f
+            self._has_multiple_types = (
+                len([f for f in self.get_fields() if not isinstance(f, NoneField)]) > 1
+            )
         else:
             raise TypeError("AnyOf definition must include at least one field option")
 
@@ -142,6 +184,8 @@ class AnyOf(MultiFieldWrapper, Field, metaclass=_JSONSchemaDraft4ReuseMeta):
         return _str_for_multioption_field(self)
 
     def serialize(self, value):
+        if self._has_multiple_types:
+            return self._serialize_by_matching_field(value)
         return None if value is None else self._not_nonefield.serialize(value)
 
 
@@ -193,7 +237,7 @@ class OneOf(MultiFieldWrapper, Field, metaclass=_JSONSchemaDraft4ReuseMeta):
         return _str_for_multioption_field(self)
 
     def serialize(self, value):
-        raise TypeError("Not FastSerializable")
+        return self._serialize_by_matching_field(value)
 
 
 class NotField(MultiFieldWrapper, Field, metaclass=_JSONSchemaDraft4ReuseMeta):
@@ -74,6 +74,10 @@ class Number(Field):
             self._validate(value)
         super().__set__(instance, value)
 
+    def serialize(self, value):
+        # like in serialize(), a Decimal is serialized as a string, so that it is JSON-compatible
+        return str(value) if value.__class__ is Decimal else value
+
 
 class Positive(Number):
     """
@@ -0,0 +1,280 @@
+from array import array
+
+from typedpy.commons import wrap_val
+from .collections_impl import SizedCollection
+from .serializable_field import SerializableField
+
+# formats of the same size and signedness, with different names in array.array and NumPy
+_EQUIVALENT_FORMATS = [{"l", "q"}, {"L", "Q"}]
+
+
+def _same_format(first: str, second: str) -> bool:
+    return first == second or {first, second} in _EQUIVALENT_FORMATS
+
+
+class _NumericArray(SizedCollection, SerializableField):
+    """
+    Base class for a field of numbers that are stored in an array.array
+    """
+
+    _typecodes = ""
+    _default_typecode = ""
+    _description = ""
+    _schema_type = ""
+
+    def __init__(
+        self,
+        *args,
+        typecode=None,
+        minimum=None,
+        maximum=None,
+        exclusiveMaximum=None,
+        multiplesOf=None,
+        **kwargs,
+    ):
+        self.typecode = typecode or self._default_typecode
+        if self.typecode not in self._typecodes:
+            raise TypeError(
+                f"{self.__class__.__name__}: Got {wrap_val(typecode)}; Expected a typecode in"
+                f" {wrap_val(self._typecodes)}"
+            )
+        self.minimum = minimum
+        self.maximum = maximum
+        self.exclusiveMaximum = exclusiveMaximum
+        self.multiplesOf = multiplesOf
+        super().__init__(*args, **kwargs)
+
+    def _from_buffer(self, value) -> array:
+        try:
+            view = memoryview(value)
+        except TypeError:
+            raise TypeError(
+                f"{self._name}: Got {wrap_val(value)}; Expected a list of {self._description}"
+            ) from None
+        view_format = view.format.lstrip("@")
+        if view_format not in self._typecodes:
+            raise TypeError(
+                f"{self._name}: Expected {self._description}; Got a buffer of format"
+                f" {wrap_val(view.format)}"
+            )
+        if view.ndim != 1:
+            raise ValueError(f"{self._name}: Expected a 1-dimensional buffer")
+        result = array(self.typecode)
+        if (
+            view.itemsize == result.itemsize
+            and view.c_contiguous
+            and _same_format(view_format, self.typecode)
+        ):
+            result.frombytes(view.cast("B"))
+            return result
+        return array(self.typecode, view.tolist())
+
+    def _to_array(self, value) -> array:
+        if isinstance(value, array) and value.typecode not in self._typecodes:
+            raise TypeError(
+                f"{self._name}: Expected {self._description}; Got an array of"
+                f" typecode {wrap_val(value.typecode)}"
+            )
+        try:
+            if isinstance(value, array):
+                if value.typecode == self.typecode:
+                    return value[:]
+                return array(self.typecode, value)
+            if isinstance(value, (list, tuple)):
+                return array(self.typecode, value)
+        except TypeError as ex:
+            raise TypeError(f"{self._name}: Expected {self._description}; {ex}") from ex
+        except OverflowError as ex:
+            raise ValueError(f"{self._name}: {ex}") from ex
+        return self._from_buffer(value)
+
+    def validate_size(self, items, name):
+        if self.minItems is not None and len(items) < self.minItems:
+            raise ValueError(
+                f"{name}: Expected length of at least {self.minItems}; Got {len(items)}"
+            )
+        if self.maxItems is not None and len(items) > self.maxItems:
+            raise ValueError(
+                f"{name}: Expected length of at most {self.maxItems}; Got {len(items)}"
+            )
+
+    def _is_multiple(self, value) -> bool:
+        quotient = value / self.multiplesOf
+        return int(quotient) == quotient
+
+    def _extreme_index(self, values: array, extreme, is_invalid):
+        """
+        Returns the index of a value that is invalid, if any. The extreme value (min/max) is found
+        in a single pass of the builtin, which is correct since integers are totally ordered.
+        """
+        index = values.index(extreme(values))
+        return index if is_invalid(values[index]) else None
+
+    def _validate_values(self, values: array):
+        """
+        The minimum and maximum are checked with a single pass over the array, rather than
+        validating every element as a separate field
+        """
+        if not values:
+            return
+        name = self._name
+        if self.minimum is not None:
+            index = self._extreme_index(values, min, lambda v: v < self.minimum)
+            if index is not None:
+                raise ValueError(
+                    f"{name}_{index}: Got {values[index]}; Expected a minimum of {self.minimum}"
+                )
+        if self.maximum is not None:
+            index = self._extreme_index(
+                values,
+                max,
+                lambda v: v > self.maximum
+                or (self.exclusiveMaximum and v == self.maximum),
+            )
+            if index is not None:
+                qualifier = "less than " if self.exclusiveMaximum else ""
+                raise ValueError(
+                    f"{name}_{index}: Got {values[index]}; Expected a maximum of"
+                    f" {qualifier}{self.maximum}"
+                )
+        if self.multiplesOf is not None:
+            is_multiple = self._is_multiple
+            for index, value in enumerate(values):
+                if not is_multiple(value):
+                    raise ValueError(
+                        f"{name}_{index}: Got {value}; Expected a multiple of {self.multiplesOf}"
+                    )
+
+    def __set__(self, instance, value):
+        if getattr(instance, "_trust_supplied_values", False):
+            super().__set__(instance, value)
+            return
+        values = self._to_array(value)
+        self.validate_size(values, self._name)
+        self._validate_values(values)
+        super().__set__(instance, values)
+
+    @property
+    def get_type(self):
+        return array
+
+    def serialize(self, value):
+        return value.tolist()
+
+    def deserialize(self, value):
+        return self._to_array(value)
+
+    def to_json_schema(self) -> dict:
+        items = {"type": self._schema_type}
+        for key, schema_key in [
+            ("minimum", "minimum"),
+            ("maximum", "maximum"),
+            ("exclusiveMaximum", "exclusiveMaximum"),
+            ("multiplesOf", "multipleOf"),
+        ]:
+            if getattr(self, key) is not None:
+                items[schema_key] = getattr(self, key)
+        schema = {"type": "array", "items": items}
+        if self.minItems is not None:
+            schema["minItems"] = self.minItems
+        if self.maxItems is not None:
+            schema["maxItems"] = self.maxItems
+        return schema
+
+
+class IntArray(_NumericArray):
+    """
+    An array of integers, that is stored in a compact array.array rather than in a list of
+    int objects. This is more efficient than :class:`Array` [ :class:`Integer` ] for large arrays:
+    it takes a fraction of the memory, the minimum and maximum are validated in a single pass,
+    serialization is a single call to tolist(), and the buffer protocol gives access to the data
+    without a copy (e.g. numpy.frombuffer(foo.values, dtype=numpy.int64)).
+
+    Accepts a list or tuple of integers, an array.array, or any 1-dimensional buffer of
+    integers, such as a NumPy array. The value is always copied to a new array.array.
+    Note that unlike :class:`Array`, the constraints are validated only when the field is assigned,
+    and not when the array is updated in place.
+
+    Arguments:
+        typecode(str): optional
+            The typecode of the array.array. Default is "q" (64-bit signed integers).
+        minimum(int): optional
+            Every value cannot be lower than this number
+        maximum(int): optional
+            Every value cannot be higher than this number
+        exclusiveMaximum(bool): optional
+            marks the maximum threshold above as exclusive
+        multiplesOf(int): optional
+            Every value must be a multiple of this number
+        minItems(int): optional
+            minimal size
+        maxItems(int): optional
+            maximal size
+
+    Example:
+
+    .. code-block:: python
+
+        class Histogram(Structure):
+            counts: IntArray(minimum=0)
+
+        histogram = Histogram(counts=[1, 5, 2])
+        assert histogram.counts == array("q", [1, 5, 2])
+        assert serialize(histogram) == {"counts": [1, 5, 2]}
+
+    """
+
+    _typecodes = "bBhHiIlLqQ"
+    _default_typecode = "q"
+    _description = "integers"
+    _schema_type = "integer"
+
+    def _is_multiple(self, value) -> bool:
+        return not value % self.multiplesOf
+
+
+class FloatArray(_NumericArray):
+    """
+    An array of floats, that is stored in a compact array.array rather than in a list of
+    float objects. See :class:`IntArray`. Integers are converted to floats.
+
+    Arguments:
+        typecode(str): optional
+            The typecode of the array.array: "d" (default) for 64-bit floats, or "f" for 32-bit floats.
+        minimum(int or float): optional
+            Every value cannot be lower than this number
+        maximum(int or float): optional
+            Every value cannot be higher than this number
+        exclusiveMaximum(bool): optional
+            marks the maximum threshold above as exclusive
+        multiplesOf(int or float): optional
+            Every value must be a multiple of this number
+        minItems(int): optional
+            minimal size
+        maxItems(int): optional
+            maximal size
+
+    Example:
+
+    .. code-block:: python
+
+        class Reading(Structure):
+            samples: FloatArray(minimum=-40, maximum=85)
+
+        reading = Reading(samples=numpy.array([20.5, 21.0]))
+        samples = numpy.frombuffer(reading.samples)
+
+    """
+
+    _typecodes = "fd"
+    _default_typecode = "d"
+    _description = "numbers"
+    _schema_type = "number"
+
+    def _extreme_index(self, values: array, extreme, is_invalid):
+        # min/max depend on the order of the values when there is a NaN, so every value is checked.
+        # Like in Float, a NaN itself does not violate the minimum or the maximum.
+        for index, value in enumerate(values):
+            if is_invalid(value):
+                return index
+        return None
@@ -15,3 +15,10 @@ class SerializableField(Field):
 
     def deserialize(self, value):
         return value
+
+    def deserialize_trusted(self, value):
+        """
+        Used instead of deserialize, when deserializing with direct_trusted_mapping.
+        Override it if the field deserializes structures, so that they are not validated either.
+        """
+        return self.deserialize(value)
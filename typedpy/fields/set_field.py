@@ -2,9 +2,17 @@ from typing import Callable
 
 from typedpy.structures import Structure, ImmutableField, Field, ClassReference
 from typedpy.commons import wrap_val
+from typedpy.structures.consts import IS_IMMUTABLE
+from typedpy.structures.structures import changed_fields
 from .array import has_multiple_items
 
-from .collections_impl import SizedCollection, ContainNestedFieldMixin, _CollectionMeta
+from .collections_impl import (
+    SizedCollection,
+    ContainNestedFieldMixin,
+    _CollectionMeta,
+    _SetStruct,
+    _wrap_unpickled,
+)
 from .fields import TypedField, _map_to_field
 
 
@@ -83,8 +91,30 @@ class Set(
                 self.items.__set__(temp_st, val)
                 res.append(getattr(temp_st, getattr(self.items, "_name")))
             value = cls(res)
+        if self._is_tracked(value, instance):
+            value = _SetStruct(self, instance, value, self._name)
         super().__set__(instance, value)
 
+    def _is_tracked(self, value, instance) -> bool:
+        # only a structure that tracks its changes (see Structure.mark_clean) wraps the set, so
+        # that updates in place are validated and recorded. Otherwise, a plain set is kept.
+        return (
+            changed_fields in instance.__dict__
+            and not isinstance(value, frozenset)
+            and not getattr(self, "_immutable", False)
+            and not getattr(instance, IS_IMMUTABLE, False)
+        )
+
+    def _start_tracking(self, value, instance):
+        if isinstance(value, _SetStruct) or not self._is_tracked(value, instance):
+            return value
+        return _SetStruct(self, instance, value, self._name)
+
+    def _from_pickled_value(self, value, instance):
+        if not self._is_tracked(value, instance):
+            return value
+        return _wrap_unpickled(_SetStruct, self, instance, value, self._name)
+
     def serialize(self, value):
         cached: Callable = getattr(self, "_serialize", None)
         if cached is not None:
@@ -0,0 +1,643 @@
+import json
+from array import array
+from copy import deepcopy
+from typing import Callable, Iterable, Type
+
+from typedpy.commons import python_ver_atleast_39, wrap_val
+from typedpy.structures import ClassReference, ImmutableMixin, Structure
+from typedpy.structures.consts import IS_IMMUTABLE, REQUIRED_FIELDS
+from typedpy.structures.structures import lazy_fields
+from .boolean import Boolean
+from .collections_impl import _CollectionMeta
+from .fields import _map_to_field
+from .floats import Float
+from .integers import Integer
+from .numbers import Number
+from .serializable_field import SerializableField
+from .strings import String
+
+
+def _typecode(field, required: bool):
+    """
+    Required integers and floats are stored in a compact array.array rather than in a list
+    """
+    if not required or isinstance(field, SerializableField):
+        return None
+    if isinstance(field, Integer):
+        return "q"
+    if isinstance(field, Float):
+        return "d"
+    return None
+
+
+# typedpy.serialization depends on this module, so it provides the serialization of a single value
+_value_serialization = {}
+
+
+def set_value_serialization(
+    serialize_val: Callable, deserialize_single_field: Callable
+):
+    _value_serialization["serialize_val"] = serialize_val
+    _value_serialization["deserialize_single_field"] = deserialize_single_field
+
+
+def _is_primitive(field) -> bool:
+    return isinstance(field, (Number, String, Boolean)) and not isinstance(
+        field, SerializableField
+    )
+
+
+class _ColumnsLayout:
+    def __init__(self, cls):
+        required = getattr(cls, REQUIRED_FIELDS, [])
+        self.cls = cls
+        self.field_by_name = cls.get_all_fields_by_name()
+        self.names = list(self.field_by_name)
+        self.required = [name for name in self.names if name in required]
+        self.typecodes = [
+            _typecode(self.field_by_name[name], name in required) for name in self.names
+        ]
+        self.defaults = {
+            name: field._default
+            for name, field in self.field_by_name.items()
+            if getattr(field, "_default", None) is not None
+        }
+        self.has_validate = cls.__validate__ is not Structure.__validate__
+        self._serializers = None
+        self._deserializers = None
+
+    def validate(self, name: str, value, scratch: Structure = None):
+        """
+        Validates a single value by assigning it to a scratch structure, so that the
+        error messages are the same as in the structure itself. Returns the value as
+        it is stored by the field (e.g. an int that is converted to a float).
+        A scratch structure that is used by a single thread can be reused for many values.
+        """
+        if value is None:
+            if name in self.required:
+                raise ValueError(f"{self.cls.__name__}.{name}: Expected a value")
+            return None
+        if scratch is None:
+            scratch = Structure()
+        self.field_by_name[name].__set__(scratch, value)
+        return scratch.__dict__.pop(name)
+
+    def default_of(self, name: str):
+        default = self.defaults.get(name)
+        return default() if callable(default) else default
+
+    def structure_of(self, values: list) -> Structure:
+        kwargs = {
+            name: value for name, value in zip(self.names, values) if value is not None
+        }
+        return self.cls.from_trusted_data(None, **kwargs)
+
+    def validate_row(self, values: list) -> list:
+        """
+        Validates the row as a whole, using the __validate__ method of the class, if it has one
+        """
+        if self.has_validate:
+            self.structure_of(values).__validate__()
+        return values
+
+    def check_keys(self, row: dict):
+        for key in row:
+            if key not in self.field_by_name:
+                raise ValueError(f"{self.cls.__name__}: {wrap_val(key)} is not a field")
+
+    def values_of_dict(self, row: dict, scratch: Structure) -> list:
+        self.check_keys(row)
+        validate = self.validate
+        return self.validate_row(
+            [
+                validate(
+                    name, row[name] if name in row else self.default_of(name), scratch
+                )
+                for name in self.names
+            ]
+        )
+
+    def values_of(self, row, scratch: Structure = None) -> list:
+        if isinstance(row, Structure):
+            if row.__class__ is not self.cls:
+                raise TypeError(
+                    f"Expected an instance of {self.cls.__name__}; Got {wrap_val(row)}"
+                )
+            the_dict = row.__dict__
+            if the_dict.get(lazy_fields):
+                the_dict = row.materialize().__dict__
+            return [the_dict.get(name) for name in self.names]
+        if isinstance(row, dict):
+            return self.values_of_dict(row, Structure() if scratch is None else scratch)
+        raise TypeError(
+            f"Expected an instance of {self.cls.__name__} or a dict;"
+            f" Got {wrap_val(row)}"
+        )
+
+    @property
+    def serializers(self) -> list:
+        if self._serializers is None:
+            serialize_val = _value_serialization["serialize_val"]
+
+            def serializer(field, name) -> Callable:
+                if _is_primitive(field):
+                    return lambda value: value
+                return lambda value: serialize_val(field, name, value)
+
+            self._serializers = [
+                serializer(self.field_by_name[name], name) for name in self.names
+            ]
+        return self._serializers
+
+    @property
+    def deserializers(self) -> list:
+        if self._deserializers is None:
+            deserialize_single_field = _value_serialization["deserialize_single_field"]
+
+            def deserializer(field, name) -> Callable:
+                if _is_primitive(field):
+                    return lambda value: value
+                return lambda value: deserialize_single_field(field, value, name)
+
+            self._deserializers = [
+                deserializer(self.field_by_name[name], name) for name in self.names
+            ]
+        return self._deserializers
+
+
+_layout_by_class = {}
+
+
+def _get_layout(cls) -> _ColumnsLayout:
+    layout = _layout_by_class.get(cls)
+    if layout is None:
+        layout = _layout_by_class[cls] = _ColumnsLayout(cls)
+    return layout
+
+
+def _new_column(typecode, values=()):
+    if typecode is None:
+        return list(values)
+    try:
+        return array(typecode, values)
+    except (OverflowError, TypeError):
+        # e.g. an integer that does not fit in 64 bits
+        return list(values)
+
+
+class _RowView:
+    """
+    A lightweight view of a single row in a :class:`StructureColumns`. The values are read from,
+    and validated and written to, the columns.
+    """
+
+    __slots__ = ("_records", "_index")
+
+    def __init__(self, records: "StructureColumns", index: int):
+        object.__setattr__(self, "_records", records)
+        object.__setattr__(self, "_index", index)
+
+    def __getattr__(self, name):
+        try:
+            return self._records.get(self._index, name)
+        except KeyError as ex:
+            raise AttributeError(str(ex)) from None
+
+    def __setattr__(self, name, value):
+        self._records.set(self._index, name, value)
+
+    def to_structure(self) -> Structure:
+        """
+        Returns an instance of the Structure class, with the values of the row
+        """
+        return self._records.structure_at(self._index)
+
+    def _values(self) -> list:
+        return self._records.row_values(self._index)
+
+    def __eq__(self, other):
+        records = self._records
+        if isinstance(other, _RowView):
+            return (
+                other._records.structure_class is records.structure_class
+                and other._values() == self._values()
+            )
+        if isinstance(other, records.structure_class):
+            return records._layout.values_of(other) == self._values()
+        return False
+
+    def __repr__(self):
+        return repr(self.to_structure())
+
+
+class StructureColumns(ImmutableMixin):
+    """
+    A collection of structures of the same class that is stored as a column per field, rather than
+    as a Structure instance per record. This takes a fraction of the memory of a list of structures.
+    Required :class:`Integer` and :class:`Float` fields are stored in a compact array.array, so that
+    they can also be handed to NumPy without a copy (e.g. numpy.frombuffer(records.column("salary"))).
+
+    Indexing and iteration return lightweight views of the rows, that support reading and
+    validated assignment of the fields, like a structure. A view refers to a position in the
+    collection. Use `to_structure()` of a view to get a structure instance.
+
+    Values of dicts are validated field by field, and missing fields get their defaults. If the
+    class has a __validate__ method, it validates every row as a whole, including updates of a
+    single field. A Structure instance is already valid, so its values are copied as they are.
+
+    In an :class:`ImmutableStructure`, the collection is immutable: it is returned without a
+    defensive copy, and any attempt to update it raises a ValueError.
+
+    Arguments:
+        cls(type):
+            The Structure class of the records
+        rows(Iterable): optional
+            The initial rows: structures of the class, or dicts of their values
+
+    Example:
+
+    .. code-block:: python
+
+        class Employee(Structure):
+            name: String
+            salary: Integer
+
+        employees = StructureColumns(Employee, [Employee(name="john", salary=100), {"name": "jane", "salary": 200}])
+        assert employees[1].name == "jane"
+        employees[1].salary = 300
+        high = employees.filter("salary", lambda salary: salary > 150)
+        employees.sort("salary", reverse=True)
+        assert employees.to_dicts() == [{"name": "jane", "salary": 300}, {"name": "john", "salary": 100}]
+
+    """
+
+    def __init__(self, cls: Type[Structure], rows: Iterable = None):
+        self._layout = _get_layout(cls)
+        self._columns = [_new_column(typecode) for typecode in self._layout.typecodes]
+        self._size = 0
+        if rows is not None:
+            self.extend(rows)
+
+    @property
+    def structure_class(self) -> Type[Structure]:
+        return self._layout.cls
+
+    def __len__(self):
+        return self._size
+
+    def _index(self, index: int) -> int:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError(f"{self._layout.cls.__name__}: index out of range")
+        return index
+
+    def _position(self, name: str) -> int:
+        try:
+            return self._layout.names.index(name)
+        except ValueError:
+            raise KeyError(
+                f"{wrap_val(name)} is not a field of {self._layout.cls.__name__}"
+            ) from None
+
+    def _add_columns(self, new_columns: list, size: int):
+        for position, values in enumerate(new_columns):
+            column = self._columns[position]
+            chunk = _new_column(self._layout.typecodes[position], values)
+            if isinstance(column, array) and not isinstance(chunk, array):
+                column = self._columns[position] = list(column)
+            column.extend(chunk)
+        self._size += size
+
+    def _add_rows(self, rows: list):
+        self._add_columns(
+            [list(column) for column in zip(*rows)] or [[] for _ in self._columns],
+            len(rows),
+        )
+
+    def append(self, row):
+        """
+        Append a row: a structure of the class, or a dict of its values
+        """
+        self._raise_if_immutable()
+        self._add_columns([[v] for v in self._layout.values_of(row)], 1)
+
+    def extend(self, rows: Iterable):
+        """
+        Append rows: structures of the class, or dicts of their values. Either all the rows
+        are added, or none of them.
+        """
+        self._raise_if_immutable()
+        values_of = self._layout.values_of
+        scratch = Structure()
+        self._add_rows([values_of(row, scratch) for row in rows])
+
+    def extend_columns(self, columns: dict):
+        """
+        Append rows from a dict of columns by the field names, validating every column as a whole.
+        Missing columns get the default of the field, or None.
+        """
+        self._raise_if_immutable()
+        lengths = {len(column) for column in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(
+                f"{self._layout.cls.__name__}: Expected all the columns to have"
+                " the same length"
+            )
+        size = lengths.pop() if lengths else 0
+        for name in columns:
+            self._position(name)
+        layout = self._layout
+        validate = layout.validate
+        scratch = Structure()
+        new_columns = []
+        for name in layout.names:
+            column = columns.get(name)
+            if column is None:
+                column = [layout.default_of(name) for _ in range(size)]
+            new_columns.append([validate(name, value, scratch) for value in column])
+        if layout.has_validate:
+            for values in zip(*new_columns):
+                layout.validate_row(list(values))
+        self._add_columns(new_columns, size)
+
+    def get(self, index: int, name: str):
+        """
+        Returns the value of a single field of a row
+        """
+        return self._columns[self._position(name)][self._index(index)]
+
+    def set(self, index: int, name: str, value):
+        """
+        Validate and set the value of a single field of a row
+        """
+        self._raise_if_immutable()
+        position = self._position(name)
+        index = self._index(index)
+        layout = self._layout
+        value = layout.validate(name, value)
+        if layout.has_validate:
+            values = self.row_values(index)
+            values[position] = value
+            layout.validate_row(values)
+        column = self._columns[position]
+        try:
+            column[index] = value
+        except (TypeError, OverflowError):
+            column = self._columns[position] = list(column)
+            column[index] = value
+
+    def column(self, name: str):
+        """
+        Returns the column of a field: an array.array for required integers and floats, otherwise
+        a list. The column is not copied, and should not be modified.
+        """
+        return self._columns[self._position(name)]
+
+    def row_values(self, index: int) -> list:
+        index = self._index(index)
+        return [column[index] for column in self._columns]
+
+    def structure_at(self, index: int) -> Structure:
+        """
+        Returns a structure instance with the values of a row
+        """
+        return self._layout.structure_of(self.row_values(index))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._take(range(*index.indices(self._size)))
+        return _RowView(self, self._index(index))
+
+    def __setitem__(self, index: int, row):
+        self._raise_if_immutable()
+        index = self._index(index)
+        for position, value in enumerate(self._layout.values_of(row)):
+            column = self._columns[position]
+            try:
+                column[index] = value
+            except (TypeError, OverflowError):
+                column = self._columns[position] = list(column)
+                column[index] = value
+
+    def __iter__(self):
+        for index in range(self._size):
+            yield _RowView(self, index)
+
+    def to_structures(self) -> list:
+        """
+        Returns a list of structure instances of all the rows
+        """
+        return [self.structure_at(index) for index in range(self._size)]
+
+    def _take(self, indices) -> "StructureColumns":
+        result = StructureColumns(self._layout.cls)
+        indices = list(indices)
+        result._columns = [
+            _new_column(typecode, [column[i] for i in indices])
+            for typecode, column in zip(self._layout.typecodes, self._columns)
+        ]
+        result._size = len(indices)
+        return result
+
+    def filter(self, name: str, predicate: Callable) -> "StructureColumns":
+        """
+        Returns a new collection of the rows in which the value of the given field satisfies
+        the predicate. Only the column of that field is scanned.
+        """
+        column = self.column(name)
+        return self._take(i for i, value in enumerate(column) if predicate(value))
+
+    def sort(self, *names: str, reverse: bool = False):
+        """
+        Sort the rows in place, by the values of the given fields. None values come first.
+        """
+        self._raise_if_immutable()
+        columns = [self.column(name) for name in names]
+        if len(columns) == 1 and None not in columns[0]:
+            key = columns[0].__getitem__
+        else:
+
+            def key(index):
+                return tuple(
+                    (column[index] is not None, column[index]) for column in columns
+                )
+
+        order = sorted(range(self._size), key=key, reverse=reverse)
+        self._columns = self._take(order)._columns
+
+    def copy(self) -> "StructureColumns":
+        """
+        Returns a mutable copy
+        """
+        return self._take(range(self._size))
+
+    def __deepcopy__(self, memo):
+        result = self.copy()
+        result._columns = [
+            column if isinstance(column, array) else deepcopy(column, memo)
+            for column in result._columns
+        ]
+        if self._instance is not None:
+            result._bind(self._field_definition, memo.get(id(self._instance)))
+        return result
+
+    def _bind(self, field, instance):
+        self._field_definition = field
+        self._instance = instance
+        self._name = getattr(field, "_name", None)
+
+    def to_dicts(self) -> list:
+        """
+        Serialize all the rows to a list of dicts, like :func:`serialize` of every structure.
+        None values are omitted.
+        """
+        names = self._layout.names
+        serialized_columns = [
+            [None if v is None else serialize(v) for v in column]
+            for serialize, column in zip(self._layout.serializers, self._columns)
+        ]
+        return [
+            {name: v for name, v in zip(names, values) if v is not None}
+            for values in zip(*serialized_columns)
+        ]
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dicts())
+
+    @classmethod
+    def from_dicts(cls, structure_class: Type[Structure], rows: list):
+        """
+        The inverse of :func:`to_dicts`: deserialize and validate a list of serialized rows
+        """
+        layout = _get_layout(structure_class)
+        deserializers = list(zip(layout.names, layout.deserializers))
+        scratch = Structure()
+        values = []
+        for row in rows:
+            if not isinstance(row, dict):
+                raise TypeError(
+                    f"{structure_class.__name__}: Expected a dict; Got {wrap_val(row)}"
+                )
+            layout.check_keys(row)
+            deserialized = {
+                name: None if row[name] is None else deserialize(row[name])
+                for name, deserialize in deserializers
+                if name in row
+            }
+            values.append(layout.values_of_dict(deserialized, scratch))
+        result = cls(structure_class)
+        result._add_rows(values)
+        return result
+
+    def __eq__(self, other):
+        if isinstance(other, StructureColumns):
+            return (
+                other.structure_class is self.structure_class
+                and len(other) == self._size
+                and all(
+                    list(a) == list(b) for a, b in zip(self._columns, other._columns)
+                )
+            )
+        if isinstance(other, (list, tuple)):
+            return len(other) == self._size and all(
+                view == row for view, row in zip(self, other)
+            )
+        return False
+
+    def __getstate__(self):
+        return {
+            "cls": self._layout.cls,
+            "columns": self._columns,
+            "size": self._size,
+        }
+
+    def __setstate__(self, state):
+        self._layout = _get_layout(state["cls"])
+        self._columns = state["columns"]
+        self._size = state["size"]
+
+    def __repr__(self):
+        return f"<StructureColumns of {self._layout.cls.__name__}, {self._size} rows>"
+
+
+class StructureArray(SerializableField, metaclass=_CollectionMeta):
+    """
+    A field of many structures of the same class, that are stored as columns in a
+    :class:`StructureColumns`, rather than as a list of Structure instances. It can replace
+    `Array[Employee]` when the number of employees is very large.
+    Accepts a list of structures or dicts, or a :class:`StructureColumns` of the same class.
+    A StructureColumns is assigned as is, without copying it, unless the structure is immutable.
+
+    Example:
+
+    .. code-block:: python
+
+        class Company(Structure):
+            employees: StructureArray[Employee]
+
+        company = Company(employees=[Employee(name="john", salary=100)])
+        assert company.employees[0].name == "john"
+        assert Deserializer(Company).deserialize(Serializer(company).serialize()) == company
+
+    """
+
+    def __init__(self, *args, items=None, **kwargs):
+        self.items = _map_to_field(items)
+        if not isinstance(self.items, ClassReference):
+            raise TypeError("StructureArray: Expected a Structure class")
+        super().__init__(*args, **kwargs)
+
+    @property
+    def structure_class(self) -> Type[Structure]:
+        return self.items.get_type
+
+    @property
+    def get_type(self):
+        if python_ver_atleast_39:
+            return list[self.structure_class]
+        return list
+
+    def _is_immutable_in(self, instance) -> bool:
+        return getattr(self, "_immutable", False) or getattr(
+            instance, IS_IMMUTABLE, False
+        )
+
+    def __set__(self, instance, value):
+        cls = self.structure_class
+        is_immutable = self._is_immutable_in(instance)
+        if isinstance(value, StructureColumns) and value.structure_class is cls:
+            if is_immutable and value._instance is not instance:
+                value = value.copy()
+        else:
+            if not isinstance(value, (list, tuple)):
+                raise TypeError(
+                    f"{self._name}: Got {wrap_val(value)};"
+                    f" Expected a list of {cls.__name__}"
+                )
+            try:
+                value = StructureColumns(cls, value)
+            except (TypeError, ValueError) as ex:
+                err_class = TypeError if isinstance(ex, TypeError) else ValueError
+                raise err_class(f"{self._name}: {ex}") from ex
+        if is_immutable:
+            value._bind(self, instance)
+        super().__set__(instance, value)
+
+    def _from_pickled_value(self, value, instance):
+        if self._is_immutable_in(instance):
+            value._bind(self, instance)
+        return value
+
+    # This is needed to hack the type check of typing.Optional, to allow the following syntax:
+    #   x: Optional[StructureArray[Employee]]
+    def __call__(self, *args, **kwargs):
+        return self
+
+    def serialize(self, value):
+        return value.to_dicts()
+
+    def deserialize(self, value):
+        if not isinstance(value, list):
+            raise TypeError(f"{self._name}: Got {wrap_val(value)}; Expected a list")
+        return StructureColumns.from_dicts(self.structure_class, value)
@@ -16,3 +16,32 @@ from .serialization import (
 )
 
 from .fast_serialization import create_serializer, FastSerializable
+
+from .discriminated import Discriminated
+
+from .streaming import iter_json_array
+
+from .jsonl import read_jsonl, write_jsonl
+
+from .parallel import serialize_many
+
+from .async_serialization import serialize_async
+
+from .field_mask import get_masked_serializer
+
+from .changes import serialize_changes
+
+from .patch import apply_patch
+
+from .type_encoders import (
+    register_type_encoder,
+    unregister_type_encoder,
+    register_standard_type_encoders,
+)
+
+from .binary import serialize_binary, deserialize_binary, binary_schema_fingerprint
+
+from .positional import serialize_positional, deserialize_positional
+
+from .record_array import RecordArray, record_format
+from .columns import to_columns, from_columns
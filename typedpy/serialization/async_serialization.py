@@ -0,0 +1,276 @@
+"""
+Asyncio-friendly deserialization and serialization. Large collections are processed in chunks,
+yielding control to the event loop between chunks, so that a big payload does not block other tasks.
+"""
+import asyncio
+from functools import partial
+
+from typedpy.structures import ClassReference, Structure, TypedPyDefaults
+from typedpy.fields import Array, Map
+from .mappers import aggregate_deserialization_mappers, aggregate_serialization_mappers
+from .serialization import (
+    _adjust_keep_undefined_to_mapper,
+    deserialize_single_field,
+    serialize,
+    serialize_internal,
+    serialize_val,
+)
+from .versioned_mapping import Versioned
+
+DEFAULT_CHUNK_SIZE = 500
+
+
+def _collections_size(values) -> int:
+    return sum(len(v) for v in values if isinstance(v, (list, tuple, set, dict)))
+
+
+async def _run_in_executor(executor, func, *args, **kwargs):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, partial(func, *args, **kwargs))
+
+
+def _structure_field_of_collection(field):
+    if isinstance(field, Array) and isinstance(field.items, ClassReference):
+        return field.items
+    if (
+        isinstance(field, Map)
+        and isinstance(field.items, list)
+        and isinstance(field.items[1], ClassReference)
+    ):
+        return field.items[1]
+    return None
+
+
+async def _deserialize_in_chunks(items_field, values, name, chunk_size, **kwargs):
+    result = []
+    for i, v in enumerate(values):
+        if isinstance(v, Structure):
+            result.append(v)
+            continue
+        item_name = f"{name}_{i}"
+        try:
+            result.append(deserialize_single_field(items_field, v, item_name, **kwargs))
+        except (ValueError, TypeError) as e:
+            if str(e).startswith(item_name):
+                raise
+            error_class = TypeError if isinstance(e, TypeError) else ValueError
+            raise error_class(f"{item_name}: {str(e)}") from e
+        if (i + 1) % chunk_size == 0:
+            await asyncio.sleep(0)
+    return result
+
+
+async def _deserialize_map_in_chunks(field, value: dict, name, chunk_size, **kwargs):
+    """
+    Deserialize a big Map a chunk at a time, using the same path as the synchronous deserialization.
+    The original keys are kept, since the keys are deserialized again with the whole structure.
+    Returns None if several keys are deserialized to the same one, so the Map is left as it is.
+    """
+    items = list(value.items())
+    result = {}
+    for start in range(0, len(items), chunk_size):
+        chunk = dict(items[start : start + chunk_size])
+        deserialized = deserialize_single_field(field, chunk, name, **kwargs)
+        if len(deserialized) != len(chunk):
+            return None
+        result.update(zip(chunk, deserialized.values()))
+        await asyncio.sleep(0)
+    return result
+
+
+async def deserialize_async(
+    deserializer,
+    input_data,
+    *,
+    keep_undefined=None,
+    direct_trusted_mapping=False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    executor_threshold: int = None,
+    executor=None,
+):
+    """
+    The implementation of :meth:`Deserializer.deserialize_async`
+    """
+    cls = deserializer.target_class
+    size = _collections_size(input_data.values()) if isinstance(input_data, dict) else 0
+    if executor_threshold is not None and size >= executor_threshold:
+        return await _run_in_executor(
+            executor,
+            deserializer.deserialize,
+            input_data,
+            keep_undefined=keep_undefined,
+            direct_trusted_mapping=direct_trusted_mapping,
+        )
+    if (
+        size < chunk_size
+        or direct_trusted_mapping
+        or deserializer.fields
+        or issubclass(cls, Versioned)
+    ):
+        return deserializer.deserialize(
+            input_data,
+            keep_undefined=keep_undefined,
+            direct_trusted_mapping=direct_trusted_mapping,
+        )
+
+    camel_case_convert = deserializer.camel_case_convert
+    mapper = aggregate_deserialization_mappers(
+        cls, deserializer.mapper, camel_case_convert
+    )
+    nested_keep_undefined = _adjust_keep_undefined_to_mapper(
+        cls,
+        mapper,
+        deserializer._adjusted_keep_undefined(keep_undefined),
+        camel_case_convert,
+    )
+    processed_input = dict(input_data)
+    for field_name, field in cls.get_all_fields_by_name().items():
+        items_field = _structure_field_of_collection(field)
+        key = mapper.get(field_name, field_name)
+        if items_field is None or not isinstance(key, str):
+            continue
+        value = input_data.get(key)
+        if not isinstance(value, (list, dict)) or len(value) < chunk_size:
+            continue
+        nested_mapper = mapper.get(
+            f"{key}._mapper", mapper.get(f"{field_name}._mapper")
+        )
+        if isinstance(field, Array) and isinstance(value, list):
+            processed_input[key] = await _deserialize_in_chunks(
+                items_field,
+                value,
+                field_name,
+                chunk_size,
+                mapper=nested_mapper,
+                keep_undefined=nested_keep_undefined,
+                camel_case_convert=camel_case_convert,
+            )
+        elif isinstance(field, Map) and isinstance(value, dict):
+            deserialized = await _deserialize_map_in_chunks(
+                field,
+                value,
+                field_name,
+                chunk_size,
+                mapper=nested_mapper,
+                keep_undefined=nested_keep_undefined,
+                camel_case_convert=camel_case_convert,
+            )
+            if deserialized is not None:
+                processed_input[key] = deserialized
+
+    return deserializer.deserialize(
+        processed_input,
+        keep_undefined=keep_undefined,
+        direct_trusted_mapping=direct_trusted_mapping,
+    )
+
+
+async def _serialize_big_collections(
+    structure: Structure, mapper: dict, chunk_size: int, camel_case_convert: bool
+) -> dict:
+    precomputed = {}
+    for field_name, field in structure.get_all_fields_by_name().items():
+        value = structure.__dict__.get(field_name)
+        if (
+            _structure_field_of_collection(field) is None
+            or not isinstance(mapper.get(field_name), str)
+            or value is None
+            or len(value) < chunk_size
+        ):
+            continue
+        if isinstance(field, Array):
+            sub_mapper = mapper.get(f"{field_name}._mapper", {})
+            result = []
+            for i, v in enumerate(value):
+                result.append(
+                    serialize_val(
+                        field.items,
+                        field_name,
+                        v,
+                        mapper=sub_mapper,
+                        camel_case_convert=camel_case_convert,
+                    )
+                )
+                if (i + 1) % chunk_size == 0:
+                    await asyncio.sleep(0)
+        else:
+            key_field, value_field = field.items
+            result = {}
+            for i, (k, v) in enumerate(value.items()):
+                result[
+                    serialize_val(
+                        key_field, field_name, k, camel_case_convert=camel_case_convert
+                    )
+                ] = serialize_val(
+                    value_field, field_name, v, camel_case_convert=camel_case_convert
+                )
+                if (i + 1) % chunk_size == 0:
+                    await asyncio.sleep(0)
+        precomputed[field_name] = result
+    return precomputed
+
+
+async def serialize_async(
+    value,
+    *,
+    compact=None,
+    camel_case_convert=False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    executor_threshold: int = None,
+    executor=None,
+):
+    """
+    An asyncio-friendly version of :func:`serialize`. Large Arrays/Maps of structures are serialized in chunks,
+    and control is yielded to the event loop between chunks.
+
+    Arguments:
+        value(:class:`Structure`):
+            The structure to serialize
+        compact(bool): optional
+            Like in :func:`serialize`
+        camel_case_convert(bool): optional
+            Like in :func:`serialize`
+        chunk_size(int): optional
+            The number of elements to serialize before yielding to the event loop. Collections that are smaller
+            than it are serialized without yielding.
+        executor_threshold(int): optional
+            If provided, and the total number of elements in the collections of the structure is at least this
+            number, the serialization is offloaded to the executor instead.
+        executor(concurrent.futures.Executor): optional
+            The executor to use when the executor_threshold is exceeded. Default is the loop's default executor.
+
+    Returns:
+        The same result as :func:`serialize`
+    """
+    compact = (
+        TypedPyDefaults.compact_serialization_default if compact is None else compact
+    )
+    if not isinstance(value, Structure):
+        return serialize(value, compact=compact, camel_case_convert=camel_case_convert)
+    size = _collections_size(value.materialize().__dict__.values())
+    if executor_threshold is not None and size >= executor_threshold:
+        return await _run_in_executor(
+            executor,
+            serialize,
+            value,
+            compact=compact,
+            camel_case_convert=camel_case_convert,
+        )
+    precomputed = (
+        await _serialize_big_collections(
+            value,
+            aggregate_serialization_mappers(
+                value.__class__, camel_case_convert=camel_case_convert
+            ),
+            chunk_size,
+            camel_case_convert,
+        )
+        if size >= chunk_size
+        else {}
+    )
+    return serialize_internal(
+        value,
+        compact=compact,
+        camel_case_convert=camel_case_convert,
+        precomputed=precomputed,
+    )
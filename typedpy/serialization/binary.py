@@ -0,0 +1,415 @@
+"""
+A compact binary serialization of Structures, derived from their definitions. Fields are encoded by
+their index rather than by key, integers as varints, strings with a length prefix, and nested
+structures inline, after a bitmap of the fields that are present.
+"""
+import hashlib
+import json
+import struct
+from collections import deque
+from typing import Type
+
+from typedpy.commons import wrap_val
+from typedpy.structures import ClassReference, Structure
+from typedpy.fields import (
+    Array,
+    Boolean,
+    Categorical,
+    Deque,
+    Float,
+    Integer,
+    Map,
+    SerializableField,
+    Set,
+    String,
+)
+from .serialization import deserialize_single_field, serialize_val
+
+FORMAT_VERSION = 1
+
+_double = struct.Struct("<d")
+
+# tags of the self-describing encoding of JSON-compatible values
+_NULL, _FALSE, _TRUE, _INT, _FLOAT, _STR, _LIST, _DICT = range(8)
+
+
+def _write_varint(out: bytearray, value: int):
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(buf, pos: int):
+    result = 0
+    shift = 0
+    while True:
+        byte = buf[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def _encode_int(out: bytearray, value: int):
+    _write_varint(out, value << 1 if value >= 0 else ((-value) << 1) - 1)
+
+
+def _decode_int(buf, pos: int):
+    value, pos = _read_varint(buf, pos)
+    return (value >> 1) if not value & 1 else -((value + 1) >> 1), pos
+
+
+def _encode_float(out: bytearray, value):
+    out += _double.pack(value)
+
+
+def _decode_float(buf, pos: int):
+    return _double.unpack_from(buf, pos)[0], pos + 8
+
+
+def _encode_bool(out: bytearray, value):
+    out.append(1 if value else 0)
+
+
+def _decode_bool(buf, pos: int):
+    return buf[pos] == 1, pos + 1
+
+
+def _encode_str(out: bytearray, value: str):
+    encoded = value.encode("utf-8")
+    _write_varint(out, len(encoded))
+    out += encoded
+
+
+def _decode_str(buf, pos: int):
+    size, pos = _read_varint(buf, pos)
+    end = pos + size
+    return str(buf[pos:end], "utf-8"), end
+
+
+def _encode_json_value(out: bytearray, value):
+    cls = value.__class__
+    if value is None:
+        out.append(_NULL)
+    elif cls is bool:
+        out.append(_TRUE if value else _FALSE)
+    elif isinstance(value, int):
+        out.append(_INT)
+        _encode_int(out, value)
+    elif isinstance(value, float):
+        out.append(_FLOAT)
+        _encode_float(out, value)
+    elif isinstance(value, str):
+        out.append(_STR)
+        _encode_str(out, value)
+    elif isinstance(value, (list, tuple)):
+        out.append(_LIST)
+        _write_varint(out, len(value))
+        for item in value:
+            _encode_json_value(out, item)
+    elif isinstance(value, dict):
+        out.append(_DICT)
+        _write_varint(out, len(value))
+        for k, v in value.items():
+            _encode_str(out, str(k))
+            _encode_json_value(out, v)
+    else:
+        raise TypeError(f"Cannot encode {wrap_val(value)}")
+
+
+def _decode_json_value(buf, pos: int):
+    tag = buf[pos]
+    pos += 1
+    if tag == _NULL:
+        return None, pos
+    if tag in (_FALSE, _TRUE):
+        return tag == _TRUE, pos
+    if tag == _INT:
+        return _decode_int(buf, pos)
+    if tag == _FLOAT:
+        return _decode_float(buf, pos)
+    if tag == _STR:
+        return _decode_str(buf, pos)
+    if tag == _LIST:
+        size, pos = _read_varint(buf, pos)
+        result = []
+        for _ in range(size):
+            item, pos = _decode_json_value(buf, pos)
+            result.append(item)
+        return result, pos
+    if tag == _DICT:
+        size, pos = _read_varint(buf, pos)
+        result = {}
+        for _ in range(size):
+            key, pos = _decode_str(buf, pos)
+            result[key], pos = _decode_json_value(buf, pos)
+        return result, pos
+    raise ValueError(f"Invalid binary data: unknown tag {tag} at position {pos - 1}")
+
+
+def _collection_codec(encode_item, decode_item, container):
+    def encode(out: bytearray, value):
+        _write_varint(out, len(value))
+        for item in value:
+            encode_item(out, item)
+
+    def decode(buf, pos: int):
+        size, pos = _read_varint(buf, pos)
+        result = []
+        for _ in range(size):
+            item, pos = decode_item(buf, pos)
+            result.append(item)
+        return (result if container is list else container(result)), pos
+
+    return encode, decode
+
+
+def _map_codec(key_codec, value_codec):
+    encode_key, decode_key = key_codec
+    encode_value, decode_value = value_codec
+
+    def encode(out: bytearray, value):
+        _write_varint(out, len(value))
+        for k, v in value.items():
+            encode_key(out, k)
+            encode_value(out, v)
+
+    def decode(buf, pos: int):
+        size, pos = _read_varint(buf, pos)
+        result = {}
+        for _ in range(size):
+            key, pos = decode_key(buf, pos)
+            result[key], pos = decode_value(buf, pos)
+        return result, pos
+
+    return encode, decode
+
+
+def _structure_codec(cls, trusted: bool):
+    def encode(out: bytearray, value):
+        _get_codec(cls).encode(out, value)
+
+    def decode(buf, pos: int):
+        return _get_codec(cls, trusted).decode(buf, pos)
+
+    return encode, decode
+
+
+def _categorical_codec(field: Categorical):
+    """
+    A predefined category is encoded as its code + 1, and any other value as 0 followed by
+    the string. Only the codes of the predefined categories are stable across processes.
+    """
+
+    def encode(out: bytearray, value):
+        code = field.find_code(value)
+        if code is not None and code < field.predefined_size:
+            _write_varint(out, code + 1)
+        else:
+            out.append(0)
+            _encode_str(out, value)
+
+    def decode(buf, pos: int):
+        code, pos = _read_varint(buf, pos)
+        if code:
+            return field.category(code - 1), pos
+        return _decode_str(buf, pos)
+
+    return encode, decode
+
+
+def _generic_codec(field, name):
+    """
+    Encodes the value like in JSON serialization, in a self-describing form
+    """
+
+    def encode(out: bytearray, value):
+        _encode_json_value(out, serialize_val(field, name, value))
+
+    def decode(buf, pos: int):
+        value, pos = _decode_json_value(buf, pos)
+        return deserialize_single_field(field, value, name), pos
+
+    return encode, decode
+
+
+def _field_codec(field, name, trusted: bool):
+    if isinstance(field, SerializableField) or field is None:
+        return _generic_codec(field, name)
+    if isinstance(field, Integer):
+        return _encode_int, _decode_int
+    if isinstance(field, Float):
+        return _encode_float, _decode_float
+    if isinstance(field, Boolean):
+        return _encode_bool, _decode_bool
+    if isinstance(field, Categorical):
+        return _categorical_codec(field)
+    if isinstance(field, String):
+        return _encode_str, _decode_str
+    if isinstance(field, ClassReference):
+        return _structure_codec(field.get_type, trusted)
+    for collection_field, container in ((Array, list), (Set, set), (Deque, deque)):
+        if isinstance(field, collection_field) and not isinstance(field.items, list):
+            return _collection_codec(
+                *_field_codec(field.items, name, trusted), container=container
+            )
+    if isinstance(field, Map) and isinstance(field.items, list):
+        return _map_codec(
+            _field_codec(field.items[0], name, trusted),
+            _field_codec(field.items[1], name, trusted),
+        )
+    return _generic_codec(field, name)
+
+
+def _field_description(field, in_progress: set) -> str:
+    if field is None:
+        return "None"
+    if isinstance(field, ClassReference):
+        return _schema_description(field.get_type, in_progress)
+    if isinstance(field, Categorical):
+        predefined = field.categories[: field.predefined_size]
+        return f"Categorical{json.dumps(predefined)}"
+    items = getattr(field, "items", None)
+    if isinstance(items, list):
+        nested = ",".join(_field_description(f, in_progress) for f in items)
+        return f"{field.__class__.__name__}[{nested}]"
+    if items is not None:
+        return f"{field.__class__.__name__}[{_field_description(items, in_progress)}]"
+    return field.__class__.__name__
+
+
+def _schema_description(cls, in_progress: set) -> str:
+    if cls in in_progress:
+        return cls.__name__
+    in_progress = in_progress | {cls}
+    fields = ",".join(
+        f"{name}:{_field_description(field, in_progress)}"
+        for name, field in cls.get_all_fields_by_name().items()
+    )
+    return f"{cls.__name__}({fields})"
+
+
+class _StructureCodec:
+    def __init__(self, cls, trusted: bool):
+        self.cls = cls
+        self.fields = list(cls.get_all_fields_by_name().items())
+        self.bitmap_size = (len(self.fields) + 7) // 8
+        self.codecs = [
+            _field_codec(field, name, trusted) for name, field in self.fields
+        ]
+        description = _schema_description(cls, set())
+        self.fingerprint = hashlib.sha256(description.encode("utf-8")).digest()[:8]
+        self.trusted = trusted
+
+    def encode(self, out: bytearray, structure):
+        if not isinstance(structure, self.cls):
+            raise TypeError(
+                f"Expected an instance of {self.cls.__name__}; Got {wrap_val(structure)}"
+            )
+        the_dict = structure.materialize().__dict__
+        bitmap_position = len(out)
+        bitmap = bytearray(self.bitmap_size)
+        out += bitmap
+        for index, (name, _) in enumerate(self.fields):
+            value = the_dict.get(name)
+            if value is None:
+                continue
+            bitmap[index >> 3] |= 1 << (index & 7)
+            self.codecs[index][0](out, value)
+        out[bitmap_position : bitmap_position + self.bitmap_size] = bitmap
+
+    def decode(self, buf, pos: int):
+        bitmap = buf[pos : pos + self.bitmap_size]
+        pos += self.bitmap_size
+        kwargs = {}
+        for index, (name, _) in enumerate(self.fields):
+            if bitmap[index >> 3] & (1 << (index & 7)):
+                kwargs[name], pos = self.codecs[index][1](buf, pos)
+        if self.trusted:
+            return self.cls.from_trusted_data(None, **kwargs), pos
+        return self.cls(**kwargs), pos
+
+
+_codec_by_class = {}
+
+
+def _get_codec(cls, trusted: bool = False) -> _StructureCodec:
+    key = (cls, trusted)
+    codec = _codec_by_class.get(key)
+    if codec is None:
+        codec = _codec_by_class[key] = _StructureCodec(cls, trusted)
+    return codec
+
+
+def binary_schema_fingerprint(cls: Type[Structure]) -> bytes:
+    """
+    Returns the fingerprint of the binary schema of a Structure class. It changes whenever
+    the fields of the class, or of any of the structures nested in it, change.
+    """
+    return _get_codec(cls).fingerprint
+
+
+def serialize_binary(structure: Structure) -> bytes:
+    """
+    Serialize a structure to a compact binary form, that is derived from the definition of its class,
+    without any key names. Integers are encoded as varints, strings are prefixed by their length, and
+    nested structures are encoded inline. Fields that do not have a specialized encoding, such as
+    :class:`SerializableField` or :class:`Anything`, are encoded like in :func:`serialize`.
+    The result starts with the fingerprint of the schema, so that
+    :func:`deserialize_binary` can verify it was created for the same definition.
+
+    Note that only the fields of the structure are serialized, and mappers are ignored.
+
+    Arguments:
+        structure(:class:`Structure`):
+            The structure to serialize
+
+    Returns:
+        The serialized bytes
+    """
+    codec = _get_codec(structure.__class__)
+    out = bytearray([FORMAT_VERSION])
+    out += codec.fingerprint
+    codec.encode(out, structure)
+    return bytes(out)
+
+
+def deserialize_binary(
+    cls: Type[Structure], data, *, direct_trusted_mapping: bool = False
+) -> Structure:
+    """
+    Deserialize the output of :func:`serialize_binary` to an instance of the given class.
+
+    Arguments:
+        cls(type):
+            The Structure class
+        data(bytes, bytearray or memoryview):
+            The serialized data
+        direct_trusted_mapping(bool): optional
+            Skip validation of the decoded values. Use it only for trusted data. Default is False.
+
+    Returns:
+        The deserialized instance
+
+    Raises:
+        ValueError: If the data was created for a different definition of the class, or is invalid
+    """
+    codec = _get_codec(cls, direct_trusted_mapping)
+    buf = memoryview(data)
+    if len(buf) < 9 or buf[0] != FORMAT_VERSION:
+        raise ValueError(f"{cls.__name__}: Invalid binary data")
+    if buf[1:9] != codec.fingerprint:
+        raise ValueError(
+            f"{cls.__name__}: Binary data was serialized with an incompatible schema"
+        )
+    try:
+        structure, pos = codec.decode(buf, 9)
+    except (IndexError, struct.error, UnicodeDecodeError) as ex:
+        raise ValueError(f"{cls.__name__}: Invalid binary data") from ex
+    if pos != len(buf):
+        raise ValueError(
+            f"{cls.__name__}: Invalid binary data: unexpected trailing bytes"
+        )
+    return structure
@@ -0,0 +1,140 @@
+"""
+Serialization of the changes in a Structure since :meth:`Structure.mark_clean` was called
+"""
+from collections.abc import Mapping
+
+from typedpy.structures import Structure
+from typedpy.structures.structures import changed_fields, changed_keys
+from .field_mask import get_masked_serializer
+from .mappers import DoNotSerialize, aggregate_serialization_mappers
+from .serialization import _convert_to_camel_case_if_required, serialize_val
+
+
+def _has_changes(value) -> bool:
+    if isinstance(value, Structure):
+        changed = value.__dict__.get(changed_fields)
+        return (
+            changed is None
+            or bool(changed)
+            or any(
+                _has_changes(value.__dict__.get(name))
+                for name in value.get_all_fields_by_name()
+            )
+        )
+    if isinstance(value, Mapping):
+        return any(_has_changes(v) for v in value.values())
+    if isinstance(value, (list, tuple, set)):
+        return any(_has_changes(v) for v in value)
+    return False
+
+
+def _serialize_item(field, name, value, camel_case_convert):
+    if field is None:
+        return value
+    return serialize_val(field, name, value, camel_case_convert=camel_case_convert)
+
+
+def _serialize_nested_changes(field, name, value, changed_map_keys, camel_case_convert):
+    """
+    The changes in a nested structure, or in a map. In a map, the keys that were set in place are
+    serialized in full, and the keys that were deleted are serialized as None.
+    """
+    if isinstance(value, Structure):
+        return serialize_changes(value, camel_case_convert=camel_case_convert)
+    items = getattr(field, "items", None)
+    key_field, value_field = items if isinstance(items, list) else (None, None)
+    result = {}
+    for k, v in value.items():
+        if k in changed_map_keys:
+            result[
+                _serialize_item(key_field, name, k, camel_case_convert)
+            ] = _serialize_item(value_field, name, v, camel_case_convert)
+        elif _has_changes(v):
+            result[
+                _serialize_item(key_field, name, k, camel_case_convert)
+            ] = serialize_changes(v, camel_case_convert=camel_case_convert)
+    for k in changed_map_keys:
+        if k not in value:
+            result[_serialize_item(key_field, name, k, camel_case_convert)] = None
+    return result
+
+
+def serialize_changes(structure: Structure, *, camel_case_convert=False) -> dict:
+    """
+    Serialize only the changes in a structure since :meth:`Structure.mark_clean` was called on it, in the
+    form of a JSON merge patch (RFC 7396):
+
+    * A field that was set is serialized as in :func:`serialize`, or as None if it was deleted.
+      If it replaced a map, the keys that are missing from the new value are serialized as None.
+    * For a nested structure that was changed in place, only its changes are serialized.
+    * For a Map that was changed in place, only the keys that were set or deleted, and the changes in its
+      nested structures, are serialized. Deleted keys are serialized as None.
+    * Any other collection (e.g. Array or Set) that was changed, or in which a structure was changed,
+      is serialized in full.
+
+    Changes in fields that are mapped with a :class:`FunctionCall` are serialized as the new value of the
+    function.
+
+    Arguments:
+        structure(:class:`Structure`):
+            The structure. mark_clean() must have been called on it.
+        camel_case_convert(bool): optional
+            Like in :func:`serialize`
+
+    Returns:
+        A dict with the changes
+    """
+    cls = structure.__class__
+    the_dict = structure.__dict__
+    changed = the_dict.get(changed_fields)
+    keys_by_name = the_dict.get(changed_keys, {})
+    if changed is None:
+        raise ValueError(
+            f"{cls.__name__}: changes are not tracked. Call mark_clean() first"
+        )
+    fields_by_name = cls.get_all_fields_by_name()
+    changed_names = [name for name in fields_by_name if name in changed]
+    result = (
+        get_masked_serializer(
+            cls, changed_names, camel_case_convert=camel_case_convert
+        )(structure)
+        if changed_names
+        else {}
+    )
+    mapper = aggregate_serialization_mappers(cls, camel_case_convert=camel_case_convert)
+    for name, field in fields_by_name.items():
+        key_mapper = mapper.get(name)
+        if key_mapper is DoNotSerialize:
+            continue
+        key = (
+            key_mapper
+            if isinstance(key_mapper, str)
+            else _convert_to_camel_case_if_required(name, camel_case_convert)
+        )
+        value = the_dict.get(name)
+        if name in changed:
+            if value is None:
+                result[key] = None
+            elif isinstance(value, Mapping) and isinstance(result.get(key), dict):
+                # a replaced map: delete the keys that were removed
+                result[key].update(
+                    _serialize_nested_changes(
+                        field,
+                        name,
+                        {},
+                        keys_by_name.get(name, set()) - set(value),
+                        camel_case_convert,
+                    )
+                )
+        elif name in keys_by_name or _has_changes(value):
+            if isinstance(value, (Structure, Mapping)):
+                result[key] = _serialize_nested_changes(
+                    field, name, value, keys_by_name.get(name, ()), camel_case_convert
+                )
+            else:
+                result.update(
+                    get_masked_serializer(
+                        cls, [name], camel_case_convert=camel_case_convert
+                    )(structure)
+                )
+    return result
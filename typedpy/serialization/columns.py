@@ -0,0 +1,344 @@
+"""
+Conversion between a list of Structures and a columnar form: a dict of the values of every field, by its name.
+Fields of nested structures are flattened, using their dotted names (e.g. "address.city").
+"""
+from typing import Callable, Iterable, Type
+
+from typedpy.commons import wrap_val
+from typedpy.structures import ClassReference, ImmutableMixin, Structure
+from typedpy.structures.consts import IS_IMMUTABLE, MUST_BE_UNIQUE, REQUIRED_FIELDS
+from typedpy.structures.structures import lazy_fields
+from typedpy.fields import Categorical, Enum
+
+
+def _leaf_names(cls, prefix: str, in_progress: frozenset) -> list:
+    names = []
+    for name, field in cls.get_all_fields_by_name().items():
+        full_name = f"{prefix}{name}"
+        if isinstance(field, ClassReference) and field.get_type not in in_progress:
+            names.extend(
+                _leaf_names(field.get_type, f"{full_name}.", in_progress | {cls})
+            )
+        else:
+            names.append(full_name)
+    return names
+
+
+def _resolve_field(cls, dotted_name: str):
+    """
+    Returns the field of a dotted name, and the path of field names to it
+    """
+    path = dotted_name.split(".")
+    field = None
+    current = cls
+    for index, name in enumerate(path):
+        if current is None:
+            raise ValueError(f"{dotted_name}: {path[index - 1]} is not a Structure")
+        field = current.get_all_fields_by_name().get(name)
+        if field is None:
+            raise ValueError(
+                f"{dotted_name}: {wrap_val(name)} is not a field of {current.__name__}"
+            )
+        current = field.get_type if isinstance(field, ClassReference) else None
+    return field, path
+
+
+def _get_dict(structure):
+    the_dict = structure.__dict__
+    if the_dict.get(lazy_fields):
+        the_dict = structure.materialize().__dict__
+    return the_dict
+
+
+def _getter(path: list):
+    if len(path) == 1:
+        name = path[0]
+        return lambda structure: _get_dict(structure).get(name)
+
+    def get(structure):
+        value = structure
+        for name in path:
+            value = _get_dict(value).get(name)
+            if value is None:
+                return None
+        return value
+
+    return get
+
+
+def _code_encoder(field):
+    if isinstance(field, Enum):
+        code_by_value = {v: i for i, v in enumerate(field.values)}
+        return lambda value: None if value is None else code_by_value[value]
+    if isinstance(field, Categorical):
+        return lambda value: None if value is None else field.code_of(value)
+    return None
+
+
+def to_columns(
+    structures: Iterable[Structure],
+    fields: Iterable[str] = None,
+    *,
+    enum_codes: bool = False,
+    column_factory: Callable = None,
+) -> dict:
+    """
+    Convert structures of the same class to a columnar form: a dict of the list of the values of every field.
+    The values are not serialized, and missing values are None. By default, all the fields are included, and
+    fields of nested structures are flattened to their dotted names (e.g. "address.city").
+
+    Arguments:
+        structures(Iterable[Structure]):
+            The structures. All of them must be of the same class.
+        fields(Iterable[str]): optional
+            The (dotted) names of the fields to include
+        enum_codes(bool): optional
+            If True, the values of :class:`Enum` fields are replaced by their index in the values of the Enum
+            (i.e. their code), and the values of :class:`Categorical` fields by their codes. Default is False.
+            The codes of Categorical values that are not predefined are valid only within the same process.
+        column_factory(Callable): optional
+            A function that is applied to every column. For example, use numpy.asarray to create NumPy arrays.
+
+    Returns:
+        A dict of columns by the field names
+
+    Example:
+
+    .. code-block:: python
+
+        class Address(Structure):
+            city: str
+            zip_code: int
+
+        class Person(Structure):
+            name: str
+            address: Address
+
+        people = [Person(name="john", address=Address(city="Paris", zip_code=1))]
+        assert to_columns(people) == {"name": ["john"], "address.city": ["Paris"], "address.zip_code": [1]}
+        assert from_columns(Person, to_columns(people)) == people
+    """
+    structures = structures if isinstance(structures, list) else list(structures)
+    if not structures:
+        return {
+            name: column_factory([]) if column_factory else [] for name in fields or []
+        }
+    cls = structures[0].__class__
+    for structure in structures:
+        if structure.__class__ is not cls:
+            raise TypeError(
+                f"Expected all the structures to be of class {cls.__name__};"
+                f" Got {wrap_val(structure)}"
+            )
+    names = list(fields) if fields is not None else _leaf_names(cls, "", frozenset())
+    columns = {}
+    for name in names:
+        field, path = _resolve_field(cls, name)
+        get = _getter(path)
+        column = [get(s) for s in structures]
+        encode = _code_encoder(field) if enum_codes else None
+        if encode is not None:
+            column = [encode(v) for v in column]
+        columns[name] = column_factory(column) if column_factory else column
+    return columns
+
+
+def _row_error(index: int, ex: Exception, prefix: str = "") -> Exception:
+    err_class = TypeError if isinstance(ex, TypeError) else ValueError
+    return err_class(f"row {index}: {prefix}{ex}")
+
+
+def _validates_by_column(cls) -> bool:
+    """
+    Whether the columns of the class can be validated as a whole, and the instances created without
+    validating them again. Immutable classes, constants and unique fields depend on the instance itself.
+    """
+    return (
+        Structure.failing_fast()
+        and not getattr(cls, IS_IMMUTABLE, False)
+        and not getattr(cls, MUST_BE_UNIQUE, False)
+        and not getattr(cls, "_constants", None)
+        and not any(
+            getattr(field, MUST_BE_UNIQUE, False)
+            for field in cls.get_all_fields_by_name().values()
+        )
+    )
+
+
+class _ColumnsPlan:
+    """
+    Assembles the columns that belong to a single (possibly nested) structure class.
+    If possible, every column is validated as a whole, using a scratch structure, and the instances are
+    created from the validated values. Otherwise, every instance is created and validated as usual.
+    """
+
+    def __init__(self, cls, columns: dict, enum_codes: bool, trusted: bool):
+        self.cls = cls
+        self.trusted = trusted
+        self.by_column = not trusted and _validates_by_column(cls)
+        self.required = getattr(cls, REQUIRED_FIELDS, [])
+        self.has_validate = cls.__validate__ is not Structure.__validate__
+        self.scratch = Structure()
+        self.simple_columns = []
+        field_by_name = cls.get_all_fields_by_name()
+        nested = {}
+        for name, column in columns.items():
+            field_name, _, rest = name.partition(".")
+            field = field_by_name.get(field_name)
+            if field is None:
+                raise ValueError(
+                    f"{wrap_val(field_name)} is not a field of {cls.__name__}"
+                )
+            if rest:
+                if not isinstance(field, ClassReference):
+                    raise ValueError(f"{name}: {field_name} is not a Structure")
+                nested.setdefault(field_name, {})[rest] = column
+            else:
+                if enum_codes and isinstance(field, (Enum, Categorical)):
+                    column = _decode_codes_column(field, name, column)
+                self.simple_columns.append((field_name, column))
+        self.nested = [
+            (
+                name,
+                _ColumnsPlan(
+                    field_by_name[name].get_type, sub_columns, enum_codes, trusted
+                ),
+            )
+            for name, sub_columns in nested.items()
+        ]
+        if self.by_column:
+            self.simple_columns = [
+                (name, self._validate_column(field_by_name[name], name, column))
+                for name, column in self.simple_columns
+            ]
+
+    def _validate_column(self, field, name: str, column) -> list:
+        default = getattr(field, "_default", None)
+        scratch = self.scratch
+        result = []
+        for index, value in enumerate(column):
+            if value is None and default is not None:
+                value = default() if callable(default) else default
+            if value is not None:
+                try:
+                    field.__set__(scratch, value)
+                except (TypeError, ValueError) as ex:
+                    raise _row_error(index, ex, f"{self.cls.__name__}.") from ex
+                value = scratch.__dict__.pop(name)
+            result.append(value)
+        return result
+
+    def required_missing(self) -> list:
+        names = {name for name, _ in self.simple_columns}
+        names.update(name for name, _ in self.nested)
+        return [name for name in self.required if name not in names]
+
+    def _kwargs(self, index: int) -> dict:
+        kwargs = {}
+        for name, column in self.simple_columns:
+            value = column[index]
+            if value is not None:
+                kwargs[name] = value
+        for name, plan in self.nested:
+            nested_kwargs = plan._kwargs(index)
+            if nested_kwargs:
+                kwargs[name] = plan._create(nested_kwargs)
+        return kwargs
+
+    def _create(self, kwargs: dict):
+        if self.trusted:
+            return self.cls.from_trusted_data(None, **kwargs)
+        if not self.by_column:
+            return self.cls(**kwargs)
+        for name in self.required:
+            if name not in kwargs:
+                raise TypeError(
+                    f"{self.cls.__name__}: missing a required argument: {wrap_val(name)}"
+                )
+        instance = self.cls.__new__(self.cls)
+        the_dict = instance.__dict__
+        for name, value in kwargs.items():
+            # the collections were validated in the scratch structure, and update their owner
+            if isinstance(value, ImmutableMixin) and (
+                getattr(value, "_instance", None) is self.scratch
+            ):
+                value._instance = instance
+            the_dict[name] = value
+        the_dict["_none_fields"] = set()
+        the_dict["_instantiated"] = True
+        if self.has_validate:
+            instance.__validate__()
+        return instance
+
+    def build(self, index: int):
+        return self._create(self._kwargs(index))
+
+
+def _decode_codes_column(field, name: str, column) -> list:
+    if isinstance(field, Enum):
+        values, kind = field.values, "an Enum"
+    else:
+        values, kind = field.categories, "a Categorical"
+    result = []
+    for code in column:
+        if code is None:
+            result.append(None)
+            continue
+        if not isinstance(code, int) or not 0 <= code < len(values):
+            raise ValueError(f"{name}: Got {wrap_val(code)}; Expected {kind} code")
+        result.append(values[code])
+    return result
+
+
+def from_columns(
+    cls: Type[Structure],
+    columns: dict,
+    *,
+    enum_codes: bool = False,
+    direct_trusted_mapping: bool = False,
+) -> list:
+    """
+    The inverse of :func:`to_columns`: create a list of structures from a dict of columns by the (dotted)
+    names of the fields. The columns can be lists, tuples, or any other sequence, such as NumPy arrays.
+    The columns are checked as a whole before any instance is created: all of them must have the same length,
+    refer to existing fields, and include the required fields. Then, every column is validated at once,
+    and the instances are created from the validated values, without validating them again, except for
+    the __validate__ method of the class, if it has one. Immutable classes, and classes with constants or
+    unique fields, are validated instance by instance. A nested structure whose values are all None in a row
+    is left out.
+
+    Arguments:
+        cls(type):
+            The Structure class
+        columns(dict):
+            The columns by the field names
+        enum_codes(bool): optional
+            If True, the values of :class:`Enum` and :class:`Categorical` fields are expected to be their codes,
+            like in :func:`to_columns`
+        direct_trusted_mapping(bool): optional
+            Create the instances without validating them. Use it only for trusted data. Default is False.
+
+    Returns:
+        A list of the structures
+    """
+    lengths = {len(column) for column in columns.values()}
+    if len(lengths) > 1:
+        raise ValueError(
+            f"{cls.__name__}: Expected all the columns to have the same length"
+        )
+    columns = {
+        name: column.tolist() if hasattr(column, "tolist") else column
+        for name, column in columns.items()
+    }
+    plan = _ColumnsPlan(cls, columns, enum_codes, direct_trusted_mapping)
+    missing = plan.required_missing()
+    if missing and not direct_trusted_mapping:
+        raise ValueError(f"{cls.__name__}: missing required columns: {missing}")
+    size = lengths.pop() if lengths else 0
+    result = []
+    for index in range(size):
+        try:
+            result.append(plan.build(index))
+        except (TypeError, ValueError) as ex:
+            raise _row_error(index, ex) from ex
+    return result
@@ -0,0 +1,204 @@
+from typedpy.commons import wrap_val
+from typedpy.fields import SerializableField
+from typedpy.structures import FieldMeta, Structure
+from .mappers import aggregate_deserialization_mappers
+from .serialization import HasTypes, deserialize_structure, serialize
+
+
+class _DiscriminatedMeta(FieldMeta):
+    def __getitem__(cls, values):
+        if isinstance(values, tuple):
+            discriminator, class_by_discriminator_value = values
+            return cls(  # pylint: disable=E1120, E1123
+                discriminator=discriminator,
+                class_by_discriminator_value=class_by_discriminator_value,
+            )
+        return cls(base=values)  # pylint: disable=E1120, E1123
+
+
+def _all_subclasses(cls) -> list:
+    result = [cls]
+    for subclass in cls.__subclasses__():
+        result.extend(_all_subclasses(subclass))
+    return result
+
+
+class Discriminated(SerializableField, metaclass=_DiscriminatedMeta):
+    """
+    A Structure of one of several classes, where the class is determined by the value of a discriminator
+    key in the serialized form (i.e. a discriminated union). Deserialization selects the class with a single
+    lookup of the discriminator value, and serialization adds the discriminator value of the class of the
+    instance. Since it is a :class:`SerializableField`, a Structure that uses it can still be deserialized
+    with direct_trusted_mapping, and serialized with :class:`FastSerializable`.
+
+    Arguments:
+        discriminator(str): optional
+            The key of the discriminator in the serialized form. Default is "type".
+        class_by_discriminator_value(dict): optional
+            The Structure class by the discriminator value.
+        base(type): optional
+            Alternatively, a Structure class that inherits from :class:`HasTypes`. The classes are
+            this class and all its subclasses, and the discriminator value of each class is its name in
+            lower case, like in the serialization of :class:`HasTypes`.
+        keep_undefined(bool): optional
+            Keep attributes in the input that are not fields of the class. Default is False.
+
+    Examples:
+
+    .. code-block:: python
+
+        class Created(Structure):
+            id: str
+
+        class Deleted(Structure):
+            id: str
+            reason: str
+
+        class Message(Structure):
+            events: Array[Discriminated["kind", {"created": Created, "deleted": Deleted}]]
+
+        message = Deserializer(Message).deserialize(
+            {"events": [{"kind": "created", "id": "1"}, {"kind": "deleted", "id": "1", "reason": "spam"}]}
+        )
+        assert message.events[1] == Deleted(id="1", reason="spam")
+        assert serialize(message)["events"][0] == {"kind": "created", "id": "1"}
+
+        # alternatively, using HasTypes:
+        class Employee(Structure, HasTypes):
+            name: str
+
+        class Engineer(Employee):
+            pass
+
+        class Firm(Structure):
+            employees: Array[Discriminated[Employee]]
+
+        firm = Deserializer(Firm).deserialize({"employees": [{"type": "engineer", "name": "john"}]})
+        assert firm.employees[0] == Engineer(name="john")
+
+    """
+
+    def __init__(
+        self,
+        *args,
+        discriminator: str = "type",
+        class_by_discriminator_value: dict = None,
+        base: type = None,
+        keep_undefined: bool = False,
+        **kwargs,
+    ):
+        if (class_by_discriminator_value is None) == (base is None):
+            raise TypeError(
+                "Discriminated requires either class_by_discriminator_value or base"
+            )
+        if base is not None:
+            if not (
+                isinstance(base, type)
+                and issubclass(base, Structure)
+                and issubclass(base, HasTypes)
+            ):
+                raise TypeError(
+                    f"Discriminated: Expected a Structure class that inherits from HasTypes; Got {wrap_val(base)}"
+                )
+        else:
+            for cls in class_by_discriminator_value.values():
+                if not (isinstance(cls, type) and issubclass(cls, Structure)):
+                    raise TypeError(
+                        f"Discriminated: Expected a Structure class; Got {wrap_val(cls)}"
+                    )
+        self.discriminator = discriminator
+        self.base = base
+        self.keep_undefined = keep_undefined
+        self._class_by_value = dict(class_by_discriminator_value or {})
+        self._value_by_class = {v: k for k, v in self._class_by_value.items()}
+        self._keeps_discriminator = {}
+        self._classes_version = None
+        if base is not None:
+            self._update_classes_of_base()
+        super().__init__(*args, **kwargs)
+
+    def _update_classes_of_base(self):
+        # unless a subclass was defined since the last update, a miss is a miss
+        if self._classes_version == HasTypes._subclasses_version:
+            return
+        self._classes_version = HasTypes._subclasses_version
+        self._class_by_value = {
+            cls.__name__.lower(): cls for cls in _all_subclasses(self.base)
+        }
+        self._value_by_class = {v: k for k, v in self._class_by_value.items()}
+
+    def _get_class(self, discriminator_value):
+        cls = self._class_by_value.get(discriminator_value)
+        if cls is None and self.base is not None:
+            # a subclass might have been defined after the field
+            self._update_classes_of_base()
+            cls = self._class_by_value.get(discriminator_value)
+        return cls
+
+    def _get_discriminator_value(self, cls):
+        if cls not in self._value_by_class and self.base is not None:
+            self._update_classes_of_base()
+        for c in cls.__mro__:
+            if c in self._value_by_class:
+                return self._value_by_class[c]
+        raise TypeError(
+            f"{self._name}: Expected an instance of one of {sorted(c.__name__ for c in self._value_by_class)};"
+            f" Got {cls.__name__}"
+        )
+
+    def _keeps_discriminator_key(self, cls) -> bool:
+        keeps = self._keeps_discriminator.get(cls)
+        if keeps is None:
+            mapper = aggregate_deserialization_mappers(cls)
+            keeps = any(
+                mapper.get(name, name) == self.discriminator
+                for name in cls.get_all_fields_by_name()
+            )
+            self._keeps_discriminator[cls] = keeps
+        return keeps
+
+    def __set__(self, instance, value):
+        if not getattr(instance, "_trust_supplied_values", False):
+            if not isinstance(value, Structure):
+                raise TypeError(
+                    f"{self._name}: Expected a Structure; Got {wrap_val(value)}"
+                )
+            self._get_discriminator_value(value.__class__)
+        super().__set__(instance, value)
+
+    def deserialize(self, value):
+        return self._deserialize(value, direct_trusted_mapping=False)
+
+    def deserialize_trusted(self, value):
+        return self._deserialize(value, direct_trusted_mapping=True)
+
+    def _deserialize(self, value, direct_trusted_mapping: bool):
+        if isinstance(value, Structure):
+            return value
+        if not isinstance(value, dict):
+            raise TypeError(f"{self._name}: Expected a dict; Got {wrap_val(value)}")
+        discriminator_value = value.get(self.discriminator)
+        cls = self._get_class(discriminator_value)
+        if cls is None:
+            raise ValueError(
+                f"{self._name}: {self.discriminator}: Got {wrap_val(discriminator_value)};"
+                f" Expected one of {list(self._class_by_value)}"
+            )
+        if not self._keeps_discriminator_key(cls):
+            value = {k: v for k, v in value.items() if k != self.discriminator}
+
+        return deserialize_structure(
+            cls,
+            value,
+            keep_undefined=self.keep_undefined,
+            direct_trusted_mapping=direct_trusted_mapping,
+        )
+
+    def serialize(self, value):
+        discriminator_value = self._get_discriminator_value(value.__class__)
+        serialized = serialize(value, compact=False)
+        if not isinstance(serialized, dict):
+            raise TypeError(
+                f"{self._name}: Expected {value.__class__.__name__} to be serialized to a dict"
+            )
+        return {self.discriminator: discriminator_value, **serialized}
@@ -1,9 +1,23 @@
+from decimal import Decimal
 from functools import wraps
 from typing import Type
 
-from typedpy.commons import Constant, first_in, Undefined, UndefinedMeta
-from typedpy.fields import Boolean, FunctionCall, Number, String, Array, AnyOf, OneOf
-from typedpy.structures import ClassReference, Field, NoneField, Structure
+from typedpy.commons import Constant, deep_get, first_in, Undefined
+from typedpy.fields import (
+    Anything,
+    Array,
+    Boolean,
+    Deque,
+    FunctionCall,
+    Map,
+    MultiFieldWrapper,
+    Number,
+    SerializableField,
+    Set,
+    String,
+    Tuple,
+)
+from typedpy.structures import ClassReference, Field, Structure
 from typedpy.structures.structures import (
     created_fast_serializer,
     failed_to_create_fast_serializer,
@@ -12,7 +26,8 @@ from typedpy.structures.structures import (
 from .mappers import (
     aggregate_serialization_mappers,
 )
-from ..structures.consts import ENABLE_UNDEFINED
+
+_serializers_in_progress = set()
 
 
 class FastSerializable:
@@ -40,35 +55,48 @@ def _get_value(field, cls):
     return wrapped
 
 
+def _get_number_value(field, cls):
+    owner = cls
+
+    def wrapped(self):
+        val = field.__get__(self, owner)  # pylint: disable=unnecessary-dunder-call
+        return str(val) if val.__class__ is Decimal else val
+
+    return wrapped
+
+
+def _nested_fields(field) -> list:
+    if isinstance(field, MultiFieldWrapper):
+        return field.get_fields()
+    items = getattr(field, "items", None)
+    if isinstance(field, (Array, Deque, Map, Set, Tuple)) and items is not None:
+        return items if isinstance(items, (list, tuple)) else [items]
+    return []
+
+
 def _verify_is_fast_serializable(field):
     obj = field._ty if isinstance(field, ClassReference) else field
-    if isinstance(field, Array) and isinstance(field.items, (Field, ClassReference)):
-        _verify_is_fast_serializable(field.items)
+    for nested in _nested_fields(field):
+        if isinstance(nested, (Field, ClassReference)):
+            _verify_is_fast_serializable(nested)
 
     if isinstance(field, ClassReference):
         if not issubclass(obj, FastSerializable):
             raise TypeError(
                 f"{obj.__name__} is not FastSerializable or does not implement 'serialize(self, value)'"
             )
-        if getattr(
-            obj, "serialize", None
-        ) is FastSerializable.serialize and not getattr(
-            obj, failed_to_create_fast_serializer, False
+        if (
+            getattr(obj, "serialize", None) is FastSerializable.serialize
+            and obj not in _serializers_in_progress
         ):
+            if getattr(obj, failed_to_create_fast_serializer, False):
+                raise TypeError(f"{obj.__name__}: failed to create a fast serializer")
             create_serializer(obj)
 
 
 def _get_serialize(field, cls):
     _verify_is_fast_serializable(field)
     obj = field._ty if isinstance(field, ClassReference) else field
-    if isinstance(obj, OneOf):
-        raise TypeError(f"{obj} Field is not FastSerializable")
-    if isinstance(obj, AnyOf):
-        non_null = [f for f in getattr(obj, "_fields") if not isinstance(f, NoneField)]
-        if len(non_null) > 1:
-            raise TypeError(
-                f"AnyOf(i.e. Union) is not FastSerializable when it can be multiple types: {obj}"
-            )
     owner = cls
 
     def wrapped(self):
@@ -85,6 +113,55 @@ def _get_constant(constant: Constant):
     return wrapped
 
 
+def _get_mapped_value(field_name: str, key_mapper):
+    """
+    The value of a field with a FunctionCall or a Constant in the mapper. It is serialized like
+    in :func:`serialize`, as an :class:`Anything` value.
+    """
+    from .serialization import serialize_val  # pylint: disable=import-outside-toplevel
+
+    if isinstance(key_mapper, Constant):
+
+        def get_mapped(_the_dict):
+            return key_mapper()
+
+    else:
+        func = key_mapper.func
+        arg_keys = key_mapper.args
+
+        def get_mapped(the_dict):
+            args = (
+                [deep_get(the_dict, k) for k in arg_keys]
+                if arg_keys
+                else [the_dict.get(field_name)]
+            )
+            return func(*args)
+
+    def wrapped(self):
+        the_dict = self.__dict__
+        val = the_dict.get(field_name)
+        if val is None:
+            return None
+        return serialize_val(Anything, field_name, get_mapped(the_dict) or val)
+
+    return wrapped
+
+
+def get_field_accessor(field, cls):
+    """
+    Returns the function that the fast serializer uses to get the serialized value of the field
+    from an instance of the class, if the field is serialized directly (a SerializableField, a
+    Number, a String, or a Boolean). Otherwise, returns None.
+    """
+    if isinstance(field, SerializableField):
+        return _get_serialize(field, cls)
+    if isinstance(field, Number):
+        return _get_number_value(field, cls)
+    if isinstance(field, (String, Boolean)):
+        return _get_value(field, cls)
+    return None
+
+
 def create_serializer(
     cls: Type[Structure],
     compact: bool = False,
@@ -94,40 +171,64 @@ def create_serializer(
     mapper = mapper or aggregate_serialization_mappers(cls)
     field_by_name = cls.get_all_fields_by_name()
     processed_mapper = {}
-    for field_name, field in field_by_name.items():
-        mapped_key = mapper[field_name]
-        if mapped_key.__class__ is str:
-            if isinstance(field, (Number, String, Boolean)):
-                processed_mapper[mapped_key] = _get_value(field, cls)
-            else:
-                processed_mapper[mapped_key] = (
-                    _get_constant(field)
-                    if isinstance(field, Constant)
-                    else _get_serialize(field, cls)
-                )
-        elif isinstance(mapped_key, (FunctionCall,)):
-            raise ValueError("Function mappers are not supported in fast serialization")
-
-    items = processed_mapper.items()
-
-    with_undefined = getattr(cls, ENABLE_UNDEFINED, False)
+    _serializers_in_progress.add(cls)
+    try:
+        for field_name, field in field_by_name.items():
+            mapped_key = mapper[field_name]
+            if mapped_key.__class__ is str:
+                accessor = get_field_accessor(field, cls)
+                if accessor is None:
+                    accessor = (
+                        _get_constant(field)
+                        if isinstance(field, Constant)
+                        else _get_serialize(field, cls)
+                    )
+                processed_mapper[mapped_key] = accessor
+            elif isinstance(mapped_key, (FunctionCall, Constant)):
+                processed_mapper[field_name] = _get_mapped_value(field_name, mapped_key)
+    finally:
+        _serializers_in_progress.discard(cls)
+
+    items = list(processed_mapper.items())
+
     has_additional_properties = hasattr(cls, "_additional_serialization")
+    from .serialization import (  # pylint: disable=import-outside-toplevel
+        get_cached_serialization,
+        is_serialization_cached,
+        set_cached_serialization,
+    )
+
+    cache_serialization = is_serialization_cached(cls)
+
+    def serializer(self, fields=None):
+        if fields is not None:
+            from .field_mask import (  # pylint: disable=import-outside-toplevel
+                get_masked_serializer,
+            )
 
-    def serializer(self):
-        res = {name: value(self) for name, value in items}
-        filtered_res = (
-            {name: value for name, value in res.items() if value is not Undefined}
-            if with_undefined
-            else res
-        )
-        res = (
-            filtered_res
-            if serialize_none
-            else {k: v for (k, v) in filtered_res.items() if v is not None}
-        )
+            return get_masked_serializer(self.__class__, fields)(self)
+        if cache_serialization:
+            cached = get_cached_serialization(self, "fast")
+            if cached is not None:
+                return cached
+        self.materialize()
+        res = {}
+        for name, get_value in items:
+            value = get_value(self)
+            if value is None:
+                if serialize_none:
+                    res[name] = None
+            elif value is not Undefined:
+                res[name] = value
         if has_additional_properties:
-            res.update(self._additional_serialization())
-
+            additional_props = self._additional_serialization()
+            if not isinstance(additional_props, dict):
+                raise TypeError("_additional_serialization must return a dict")
+            for key, value in additional_props.items():
+                res[key] = value() if callable(value) else value
+
+        if cache_serialization:
+            return set_cached_serialization(self, "fast", res)
         return res
 
     cls.serialize = serializer
@@ -142,7 +243,9 @@ def set_compact_wrapper(cls):
     func = cls.serialize
 
     @wraps(func)
-    def wrapper(self: Structure):
+    def wrapper(self: Structure, fields=None):
+        if fields is not None:
+            return func(self, fields=fields)
         res = func(self)
         if len(self.__class__.get_all_fields_by_name()) == 1 and len(res) == 1:
             return first_in(res.values())
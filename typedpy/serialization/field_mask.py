@@ -0,0 +1,221 @@
+"""
+Serialization of a subset of the fields of a Structure (a "field mask"), using serializers that are
+compiled once per class and mask
+"""
+from functools import lru_cache
+from typing import Iterable
+
+from typedpy.commons import wrap_val
+from typedpy.structures import ClassReference, Structure
+from typedpy.structures.consts import ENABLE_UNDEFINED
+from typedpy.structures.structures import lazy_fields
+from typedpy.fields import Anything, Array, Deque, Map, Set, Tuple
+from .mappers import DoNotSerialize, aggregate_serialization_mappers
+from .serialization import (
+    _convert_to_camel_case_if_required,
+    _get_mapped_value,
+    serialize_val,
+)
+
+
+def _mask_tree(paths: Iterable[str]) -> dict:
+    tree = {}
+    for path in paths:
+        name, _, rest = path.partition(".")
+        if not rest:
+            tree[name] = None
+        elif tree.get(name, {}) is not None:
+            tree.setdefault(name, []).append(rest)
+    return {k: v if v is None else _mask_tree(v) for k, v in tree.items()}
+
+
+def _get_field_value(structure, name):
+    the_dict = structure.__dict__
+    if name in the_dict.get(lazy_fields, ()):
+        return getattr(structure, name)
+    return the_dict.get(name)
+
+
+def _nested_structure_class(cls, name, field):
+    if isinstance(field, ClassReference):
+        return field.get_type
+    if isinstance(field, (Array, Set, Deque)) and isinstance(
+        field.items, ClassReference
+    ):
+        return field.items.get_type
+    if isinstance(field, Tuple) and isinstance(field.items, ClassReference):
+        return field.items.get_type
+    if (
+        isinstance(field, Map)
+        and isinstance(field.items, list)
+        and isinstance(field.items[1], ClassReference)
+    ):
+        return field.items[1].get_type
+    raise TypeError(
+        f"Field mask: {wrap_val(name)} of {cls.__name__} is not a Structure or a collection of Structures"
+    )
+
+
+def _compile_nested(cls, name, field, tree, sub_mapper, camel_case_convert):
+    nested_cls = _nested_structure_class(cls, name, field)
+    serialize_nested = _compile_mask(
+        nested_cls,
+        tree,
+        sub_mapper
+        or aggregate_serialization_mappers(
+            nested_cls, camel_case_convert=camel_case_convert
+        ),
+        camel_case_convert,
+    )
+    if isinstance(field, ClassReference):
+        return serialize_nested
+    if isinstance(field, Map):
+        key_field = field.items[0]
+
+        def serialize_map(value):
+            return {
+                serialize_val(
+                    key_field, name, k, camel_case_convert=camel_case_convert
+                ): None
+                if v is None
+                else serialize_nested(v)
+                for k, v in value.items()
+            }
+
+        return serialize_map
+
+    def serialize_collection(value):
+        return [None if v is None else serialize_nested(v) for v in value]
+
+    return serialize_collection
+
+
+def _compile_mask(cls, tree: dict, mapper: dict, camel_case_convert: bool):
+    fields_by_name = cls.get_all_fields_by_name()
+    for name in tree:
+        if name not in fields_by_name:
+            raise TypeError(
+                f"Field mask: {wrap_val(name)} is not a field of {cls.__name__}"
+            )
+    enable_undefined = getattr(cls, ENABLE_UNDEFINED, False)
+    uses_functions = False
+    steps = []
+    for name, field in fields_by_name.items():
+        if name not in tree:
+            continue
+        key_mapper = mapper.get(name)
+        if key_mapper is DoNotSerialize:
+            continue
+        if isinstance(key_mapper, str):
+            key = key_mapper
+        else:
+            key = _convert_to_camel_case_if_required(name, camel_case_convert)
+            uses_functions = uses_functions or key_mapper is not None
+        sub_mapper = mapper.get(f"{name}._mapper", {})
+        serialize_nested = (
+            _compile_nested(
+                cls, name, field, tree[name], sub_mapper, camel_case_convert
+            )
+            if tree[name] is not None
+            else None
+        )
+        steps.append((name, key, field, sub_mapper, serialize_nested))
+    additional_keys = set(tree)
+
+    def serializer(structure):
+        if uses_functions:
+            structure.materialize()
+        the_dict = structure.__dict__
+        none_fields = the_dict.get("_none_fields", ())
+        result = {}
+        for name, key, field, sub_mapper, serialize_nested in steps:
+            val = _get_field_value(structure, name)
+            if val is None:
+                if enable_undefined and (name in the_dict or name in none_fields):
+                    result[key] = None
+                continue
+            mapped_value = _get_mapped_value(mapper, name, the_dict)
+            if mapped_value is not None:
+                result[key] = serialize_val(
+                    Anything,
+                    name,
+                    mapped_value,
+                    camel_case_convert=camel_case_convert,
+                )
+            elif serialize_nested is not None:
+                result[key] = serialize_nested(val)
+            else:
+                result[key] = serialize_val(
+                    field,
+                    name,
+                    val,
+                    mapper=sub_mapper,
+                    camel_case_convert=camel_case_convert,
+                )
+        if getattr(structure, "_additional_serialization", None):
+            additional_props = structure._additional_serialization()
+            if not isinstance(additional_props, dict):
+                raise TypeError("_additional_serialization must return a dict")
+            for key, value in additional_props.items():
+                if key in additional_keys:
+                    result[key] = value() if callable(value) else value
+        return result
+
+    return serializer
+
+
+@lru_cache(maxsize=512)
+def _get_cached_masked_serializer(cls, paths: tuple, camel_case_convert: bool):
+    return _compile_mask(
+        cls,
+        _mask_tree(paths),
+        aggregate_serialization_mappers(cls, camel_case_convert=camel_case_convert),
+        camel_case_convert,
+    )
+
+
+def get_masked_serializer(
+    cls, fields: Iterable[str], *, mapper=None, camel_case_convert=False
+):
+    """
+    Compile a serializer of instances of the given class, that serializes only the given fields.
+    A field of a nested structure, or of the structures in a collection, can be selected using dot
+    notation, for example: "employees.first_name". Other fields are never read.
+    Serializers without an explicit mapper are cached, so the same mask is compiled only once.
+
+    Arguments:
+        cls(type):
+            The Structure class
+        fields(list[str]):
+            The paths of the fields to serialize
+        mapper(dict): optional
+            Like in :func:`serialize`
+        camel_case_convert(bool): optional
+            Like in :func:`serialize`
+
+    Returns:
+        A function that accepts an instance of the class, and returns the serialized dict
+    """
+    paths = tuple(sorted(set(fields)))
+    if mapper:
+        return _compile_mask(
+            cls,
+            _mask_tree(paths),
+            aggregate_serialization_mappers(cls, mapper, camel_case_convert),
+            camel_case_convert,
+        )
+    return _get_cached_masked_serializer(cls, paths, camel_case_convert)
+
+
+def serialize_with_mask(
+    structure: Structure, fields, *, mapper=None, camel_case_convert=False
+):
+    """
+    The implementation of :func:`serialize` with "fields"
+    """
+    return get_masked_serializer(
+        structure.__class__,
+        fields,
+        mapper=mapper,
+        camel_case_convert=camel_case_convert,
+    )(structure)
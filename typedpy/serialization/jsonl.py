@@ -0,0 +1,212 @@
+"""
+Reading and writing of JSON Lines (a.k.a NDJSON) files of Structures
+"""
+import gzip
+import io
+import json
+from contextlib import contextmanager
+from typing import Callable, Iterable, Type
+
+from typedpy.structures import Structure, TypedPyDefaults
+from .mappers import aggregate_deserialization_mappers
+from .serialization import deserialize_structure_internal, serialize_internal
+from .serialization_wrappers import Deserializer
+from .type_encoders import json_default
+
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+DEFAULT_LINES_PER_WRITE = 1000
+
+
+def _is_gzip(path_or_file, compression):
+    if compression not in (None, "gzip"):
+        raise ValueError(f"Unsupported compression: {compression}. Expected 'gzip'")
+    if compression == "gzip":
+        return True
+    return isinstance(path_or_file, str) and path_or_file.endswith(".gz")
+
+
+def _open_file(path_or_file, mode, compression, buffer_size):
+    """
+    Returns the file object to use, and whether it was opened here, and should be closed after use
+    """
+    use_gzip = _is_gzip(path_or_file, compression)
+    if isinstance(path_or_file, str):
+        if use_gzip:
+            return gzip.open(path_or_file, mode + "b"), True
+        return open(path_or_file, mode + "b", buffering=buffer_size), True
+    if use_gzip:
+        return gzip.GzipFile(fileobj=path_or_file, mode=mode + "b"), True
+    return path_or_file, False
+
+
+@contextmanager
+def _open(path_or_file, mode, compression, buffer_size):
+    f, is_owned = _open_file(path_or_file, mode, compression, buffer_size)
+    try:
+        yield f
+    finally:
+        if is_owned:
+            f.close()
+
+
+def read_jsonl(
+    path_or_file,
+    cls: Type[Structure],
+    *,
+    mapper: dict = None,
+    camel_case_convert: bool = False,
+    keep_undefined: bool = None,
+    direct_trusted_mapping: bool = False,
+    use_strict_mapping: bool = False,
+    reject: Callable = None,
+    compression: str = None,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+):
+    """
+    Read a JSON Lines file, and deserialize every line to an instance of the given class.
+    The mappers are resolved once for the whole file. Empty lines are ignored.
+
+    Arguments:
+        path_or_file:
+            A file path, or a file object opened for reading (text or binary).
+        cls(type):
+            The target :class:`Structure` class
+        mapper(dict): optional
+            A deserialization mapper, like in :class:`Deserializer`
+        camel_case_convert(bool): optional
+            Like in :class:`Deserializer`
+        keep_undefined(bool): optional
+            Like in :meth:`Deserializer.deserialize`
+        direct_trusted_mapping(bool): optional
+            Like in :meth:`Deserializer.deserialize`
+        use_strict_mapping(bool): optional
+            Like in :class:`Deserializer`
+        reject(Callable): optional
+            If provided, invalid lines do not abort the reading. Instead, the function is called with
+            the line number (starting at 1), the content of the line, and the exception, and the line is skipped.
+        compression(str): optional
+            "gzip" for a gzip compressed file. If the path ends with ".gz", it is assumed to be gzip compressed.
+        buffer_size(int): optional
+            The size of the read buffer
+
+    Returns:
+        A generator of the deserialized instances
+
+    Example:
+
+    .. code-block:: python
+
+        rejected = []
+        for event in read_jsonl("events.jsonl.gz", Event, reject=lambda *args: rejected.append(args)):
+            process(event)
+
+    """
+    deserializer = Deserializer(
+        target_class=cls,
+        camel_case_convert=camel_case_convert,
+        use_strict_mapping=use_strict_mapping,
+        **({"mapper": mapper} if mapper else {}),
+    )
+    adjusted_keep_undefined = deserializer._adjusted_keep_undefined(keep_undefined)
+    resolved_mapper = (
+        None
+        if direct_trusted_mapping
+        else aggregate_deserialization_mappers(cls, mapper, camel_case_convert)
+    )
+    # an explicit try/finally, since a context manager cannot reliably clean up inside a generator
+    f, is_owned = _open_file(path_or_file, "r", compression, buffer_size)
+    try:
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield deserialize_structure_internal(
+                    cls,
+                    json.loads(line),
+                    mapper=mapper,
+                    keep_undefined=adjusted_keep_undefined,
+                    camel_case_convert=camel_case_convert,
+                    direct_trusted_mapping=direct_trusted_mapping,
+                    use_strict_mapping=use_strict_mapping,
+                    resolved_mapper=resolved_mapper,
+                )
+            except (TypeError, ValueError) as ex:
+                if reject is None:
+                    # not ex.__class__, since the constructor of a subclass (e.g.
+                    # UnicodeDecodeError) can require other arguments
+                    err_class = TypeError if isinstance(ex, TypeError) else ValueError
+                    raise err_class(f"line {line_number}: {ex}") from ex
+                reject(line_number, _as_str(line).rstrip("\r\n"), ex)
+    finally:
+        if is_owned:
+            f.close()
+
+
+def _as_str(line):
+    return line.decode("utf-8", errors="replace") if isinstance(line, bytes) else line
+
+
+def write_jsonl(
+    path_or_file,
+    structures: Iterable[Structure],
+    *,
+    compact: bool = None,
+    camel_case_convert: bool = False,
+    compression: str = None,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+    lines_per_write: int = DEFAULT_LINES_PER_WRITE,
+) -> int:
+    """
+    Serialize structures to a JSON Lines file, one line per structure.
+
+    Arguments:
+        path_or_file:
+            A file path, or a file object opened for writing (text or binary).
+        structures:
+            An iterable of :class:`Structure` instances. Can be a generator.
+        compact(bool): optional
+            Like in :func:`serialize`
+        camel_case_convert(bool): optional
+            Like in :func:`serialize`
+        compression(str): optional
+            "gzip" for a gzip compressed file. If the path ends with ".gz", it is gzip compressed.
+        buffer_size(int): optional
+            The size of the write buffer
+        lines_per_write(int): optional
+            The number of lines that are joined together in every write to the file
+
+    Returns:
+        The number of lines written
+    """
+    compact = (
+        TypedPyDefaults.compact_serialization_default if compact is None else compact
+    )
+    count = 0
+    with _open(path_or_file, "w", compression, buffer_size) as f:
+        is_binary = isinstance(f, (io.RawIOBase, io.BufferedIOBase)) or "b" in str(
+            getattr(f, "mode", "")
+        )
+        lines = []
+        for structure in structures:
+            lines.append(
+                json.dumps(
+                    serialize_internal(
+                        structure,
+                        compact=compact,
+                        camel_case_convert=camel_case_convert,
+                    ),
+                    default=json_default,
+                )
+            )
+            count += 1
+            if len(lines) >= lines_per_write:
+                _write_lines(f, lines, is_binary)
+                lines = []
+        if lines:
+            _write_lines(f, lines, is_binary)
+    return count
+
+
+def _write_lines(f, lines: list, is_binary: bool):
+    content = "\n".join(lines) + "\n"
+    f.write(content.encode("utf-8") if is_binary else content)
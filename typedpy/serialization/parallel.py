@@ -0,0 +1,196 @@
+"""
+Deserialization and serialization of large batches using a pool of processes
+"""
+import importlib
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Type
+
+from typedpy.structures import Structure, TypedPyDefaults
+from .serialization import serialize_internal
+
+DEFAULT_CHUNK_SIZE = 1000
+
+_worker_deserializer = None
+
+
+def _importable_name(cls: Type[Structure]):
+    qualname = cls.__qualname__
+    if "<locals>" in qualname or cls.__module__ == "__main__":
+        raise TypeError(
+            f"{cls.__name__} must be importable from a module to be used in parallel processing"
+        )
+    return cls.__module__, qualname
+
+
+def _import_class(module_name: str, qualname: str):
+    obj = importlib.import_module(module_name)
+    for part in qualname.split("."):
+        obj = getattr(obj, part)
+    return obj
+
+
+def _chunks(records, chunk_size):
+    chunk = []
+    start = 0
+    for record in records:
+        chunk.append(record)
+        if len(chunk) >= chunk_size:
+            yield start, chunk
+            start += len(chunk)
+            chunk = []
+    if chunk:
+        yield start, chunk
+
+
+def _ordered_results(executor, func, tasks: Iterable[tuple], window: int):
+    """
+    Submit func(*args) for all the args in tasks, keeping at most window of them pending, so that
+    the input is consumed only as fast as the workers process it. Yields the results in order.
+    """
+    pending = deque()
+    for args in tasks:
+        if len(pending) >= window:
+            yield pending.popleft().result()
+        pending.append(executor.submit(func, *args))
+    while pending:
+        yield pending.popleft().result()
+
+
+def _init_deserialization_worker(module_name, qualname, deserializer_args: dict):
+    from .serialization_wrappers import Deserializer
+
+    global _worker_deserializer  # pylint: disable=global-statement
+    _worker_deserializer = Deserializer(
+        target_class=_import_class(module_name, qualname), **deserializer_args
+    )
+
+
+def _deserialize_chunk(
+    deserializer, start, chunk, keep_undefined, direct_trusted_mapping, validate_only
+):
+    deserializer = deserializer or _worker_deserializer
+    results = []
+    for i, record in enumerate(chunk, start=start):
+        try:
+            res = deserializer.deserialize(
+                record,
+                keep_undefined=keep_undefined,
+                direct_trusted_mapping=direct_trusted_mapping,
+            )
+            results.append(None if validate_only else res)
+        except (TypeError, ValueError) as ex:
+            if not validate_only:
+                err_class = TypeError if isinstance(ex, TypeError) else ValueError
+                raise err_class(f"record {i}: {ex}") from ex
+            results.append(str(ex))
+    return results
+
+
+def deserialize_many(
+    deserializer,
+    records: Iterable,
+    *,
+    workers: int = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    keep_undefined=None,
+    direct_trusted_mapping=False,
+    validate_only=False,
+) -> list:
+    """
+    The implementation of :meth:`Deserializer.deserialize_many`
+    """
+    workers = os.cpu_count() if workers is None else workers
+    chunks = _chunks(records, chunk_size)
+    if workers <= 1:
+        results_by_chunk = (
+            _deserialize_chunk(
+                deserializer,
+                start,
+                chunk,
+                keep_undefined,
+                direct_trusted_mapping,
+                validate_only,
+            )
+            for start, chunk in chunks
+        )
+        return [res for results in results_by_chunk for res in results]
+
+    module_name, qualname = _importable_name(deserializer.target_class)
+    deserializer_args = {
+        "use_strict_mapping": deserializer.use_strict_mapping,
+        "camel_case_convert": deserializer.camel_case_convert,
+    }
+    if deserializer.mapper:
+        deserializer_args["mapper"] = dict(deserializer.mapper)
+    if deserializer.fields:
+        deserializer_args["fields"] = list(deserializer.fields)
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_deserialization_worker,
+        initargs=(module_name, qualname, deserializer_args),
+    ) as executor:
+        tasks = (
+            (None, start, chunk, keep_undefined, direct_trusted_mapping, validate_only)
+            for start, chunk in chunks
+        )
+        results_by_chunk = _ordered_results(
+            executor, _deserialize_chunk, tasks, 2 * workers
+        )
+        return [res for results in results_by_chunk for res in results]
+
+
+def _serialize_chunk(chunk, compact, camel_case_convert):
+    return [
+        serialize_internal(s, compact=compact, camel_case_convert=camel_case_convert)
+        for s in chunk
+    ]
+
+
+def serialize_many(
+    structures: Iterable[Structure],
+    *,
+    workers: int = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    compact: bool = None,
+    camel_case_convert: bool = False,
+) -> list:
+    """
+    Serialize a batch of :class:`Structure` instances using a pool of processes. The result is
+    identical to calling :func:`serialize` for every instance, in the same order.
+
+    Arguments:
+        structures:
+            The instances to serialize. Their classes must be importable from a module, since
+            the instances are pickled to the worker processes.
+        workers(int): optional
+            The number of worker processes. Default is the number of CPUs. If it is 1, serialization
+            is done in the current process.
+        chunk_size(int): optional
+            The number of instances that are sent to a worker process in every task
+        compact(bool): optional
+            Like in :func:`serialize`
+        camel_case_convert(bool): optional
+            Like in :func:`serialize`
+
+    Returns:
+        A list of the serialized instances
+    """
+    compact = (
+        TypedPyDefaults.compact_serialization_default if compact is None else compact
+    )
+    workers = os.cpu_count() if workers is None else workers
+    chunks = (chunk for _, chunk in _chunks(structures, chunk_size))
+    if workers <= 1:
+        return [
+            res
+            for chunk in chunks
+            for res in _serialize_chunk(chunk, compact, camel_case_convert)
+        ]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        tasks = ((chunk, compact, camel_case_convert) for chunk in chunks)
+        results_by_chunk = _ordered_results(
+            executor, _serialize_chunk, tasks, 2 * workers
+        )
+        return [res for results in results_by_chunk for res in results]
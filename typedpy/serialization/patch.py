@@ -0,0 +1,386 @@
+"""
+Application of a JSON Patch (RFC 6902) to a Structure, without serializing and deserializing it again
+"""
+from collections import deque
+from collections.abc import Mapping
+from copy import copy, deepcopy
+
+from typedpy.commons import wrap_val
+from typedpy.structures import Field, Structure
+from typedpy.structures.consts import IS_IMMUTABLE
+from typedpy.structures.structures import (
+    changed_fields,
+    changed_keys,
+    serialization_cache,
+)
+from typedpy.fields import Array, Deque, Map, Tuple
+from .mappers import aggregate_deserialization_mappers
+from .serialization import deserialize_single_field
+
+_OPERATIONS = {"add", "remove", "replace", "move", "copy", "test"}
+
+
+def _parse_pointer(pointer) -> list:
+    if not isinstance(pointer, str) or (pointer and not pointer.startswith("/")):
+        raise ValueError(f"Invalid JSON pointer: {wrap_val(pointer)}")
+    return [s.replace("~1", "/").replace("~0", "~") for s in pointer.split("/")[1:]]
+
+
+def _get_operation_value(operation: dict, key: str):
+    if key not in operation:
+        raise ValueError(f"{wrap_val(operation)}: missing {wrap_val(key)}")
+    return operation[key]
+
+
+def _field_name(cls, mapper: dict, key: str, pointer: str) -> str:
+    for name in cls.get_all_fields_by_name():
+        if mapper.get(name, name) == key:
+            return name
+    raise ValueError(f"{pointer}: {wrap_val(key)} is not a field of {cls.__name__}")
+
+
+def _index(segment: str, size: int, pointer: str, allow_end=False) -> int:
+    if allow_end and segment == "-":
+        return size
+    if not segment.isdigit() or (len(segment) > 1 and segment[0] == "0"):
+        raise ValueError(f"{pointer}: invalid array index {wrap_val(segment)}")
+    index = int(segment)
+    if index > size or (index == size and not allow_end):
+        raise ValueError(f"{pointer}: index {index} is out of range")
+    return index
+
+
+def _item_field(field, index: int):
+    if not isinstance(field, (Array, Deque, Tuple)):
+        return None
+    items = field.items
+    if isinstance(items, list):
+        return items[index] if index < len(items) else None
+    return items if isinstance(items, Field) else None
+
+
+def _map_key(value: Mapping, field, segment: str):
+    for key in value:
+        if str(key) == segment:
+            return key
+    if isinstance(field, Map) and isinstance(field.items, list):
+        return deserialize_single_field(field.items[0], segment, segment)
+    return segment
+
+
+def _map_value_field(field):
+    if isinstance(field, Map) and isinstance(field.items, list):
+        return field.items[1]
+    return None
+
+
+def _rebuild_sequence(original, items: list):
+    if isinstance(original, tuple):
+        return tuple(items)
+    if isinstance(original, deque):
+        return deque(items)
+    return items
+
+
+def _snapshot_value(name: str, value):
+    if name == changed_keys:
+        return {k: set(v) for k, v in value.items()}
+    if name in ("_none_fields", changed_fields):
+        return set(value)
+    return value
+
+
+class _Patcher:
+    """
+    Applies the operations of a single patch. Structures along the patched paths are revalidated
+    once, after all the operations were applied. Immutable structures, and anything nested in them,
+    are copied on write, so that untouched sub-trees are shared with the original.
+    Mutable structures are updated in place, and are restored if the patch fails.
+    """
+
+    def __init__(self, camel_case_convert):
+        self.camel_case_convert = camel_case_convert
+        self.touched = {}
+        self.snapshots = []
+
+    def _deserialize(self, field, value, name, mapper):
+        if field is None:
+            return value
+        return deserialize_single_field(
+            field,
+            value,
+            name,
+            mapper=mapper,
+            camel_case_convert=self.camel_case_convert,
+        )
+
+    def _writable(self, structure: Structure, copy_on_write: bool) -> Structure:
+        if id(structure) in self.touched:
+            return structure
+        structure.materialize()
+        if copy_on_write:
+            structure = copy(structure)
+            the_dict = structure.__dict__
+            the_dict["_none_fields"] = set(the_dict.get("_none_fields", ()))
+            the_dict.pop(serialization_cache, None)
+            the_dict.pop(changed_fields, None)
+            the_dict.pop(changed_keys, None)
+        else:
+            self.snapshots.append(
+                (
+                    structure,
+                    {k: _snapshot_value(k, v) for k, v in structure.__dict__.items()},
+                )
+            )
+        structure.__dict__["_instantiated"] = False
+        self.touched[id(structure)] = structure
+        return structure
+
+    @staticmethod
+    def _set_field(structure: Structure, name: str, value):
+        if getattr(structure, IS_IMMUTABLE, False):
+            structure.__dict__.pop(name, None)
+        setattr(structure, name, value)
+
+    def complete(self):
+        for structure in reversed(list(self.touched.values())):
+            structure._complete_instantiation()
+
+    def rollback(self):
+        for structure, the_dict in self.snapshots:
+            structure.__dict__.clear()
+            structure.__dict__.update(the_dict)
+
+    def get(self, value, segments: list, pointer: str):
+        field, mapper = None, None
+        for segment in segments:
+            if isinstance(value, Structure):
+                cls = value.__class__
+                resolved_mapper = aggregate_deserialization_mappers(
+                    cls, mapper, self.camel_case_convert
+                )
+                name = _field_name(cls, resolved_mapper, segment, pointer)
+                the_dict = value.materialize().__dict__
+                if name not in the_dict:
+                    raise ValueError(f"{pointer}: {wrap_val(segment)} does not exist")
+                field = cls.get_all_fields_by_name()[name]
+                mapper = resolved_mapper.get(
+                    f"{segment}._mapper", resolved_mapper.get(f"{name}._mapper")
+                )
+                value = the_dict[name]
+            elif isinstance(value, Mapping):
+                key = _map_key(value, field, segment)
+                if key not in value:
+                    raise ValueError(f"{pointer}: {wrap_val(segment)} does not exist")
+                field, mapper = _map_value_field(field), None
+                value = value[key]
+            elif isinstance(value, (list, tuple, deque)):
+                index = _index(segment, len(value), pointer)
+                field = _item_field(field, index)
+                value = value[index]
+            else:
+                raise ValueError(f"{pointer}: {wrap_val(segment)} does not exist")
+        return value, field, mapper
+
+    def modify(
+        self,
+        value,
+        field,
+        segments: list,
+        action: tuple,
+        mapper,
+        pointer: str,
+        copy_on_write: bool,
+    ):
+        """
+        Apply the action to the value at the given path within value.
+
+        Returns:
+            The updated value. It is the same object, unless it had to be copied.
+        """
+        segment, rest = segments[0], segments[1:]
+        if isinstance(value, Structure):
+            return self._modify_structure(
+                value, segment, rest, action, mapper, pointer, copy_on_write
+            )
+        if isinstance(value, Mapping):
+            key = _map_key(value, field, segment)
+            value_field = _map_value_field(field)
+            if rest:
+                if key not in value:
+                    raise ValueError(f"{pointer}: {wrap_val(segment)} does not exist")
+                child = value[key]
+                updated = self.modify(
+                    child, value_field, rest, action, None, pointer, copy_on_write
+                )
+                if updated is child:
+                    return value
+                return {**value, key: updated}
+            op, new_value, typed = action
+            if op != "add" and key not in value:
+                raise ValueError(f"{pointer}: {wrap_val(segment)} does not exist")
+            result = dict(value)
+            if op == "remove":
+                del result[key]
+            else:
+                result[key] = (
+                    new_value
+                    if typed
+                    else self._deserialize(value_field, new_value, segment, None)
+                )
+            return result
+        if isinstance(value, (list, tuple, deque)):
+            op, new_value, typed = action
+            index = _index(
+                segment, len(value), pointer, allow_end=not rest and op == "add"
+            )
+            item_field = _item_field(field, index)
+            items = list(value)
+            if rest:
+                child = items[index]
+                updated = self.modify(
+                    child, item_field, rest, action, mapper, pointer, copy_on_write
+                )
+                if updated is child:
+                    return value
+                items[index] = updated
+            elif op == "remove":
+                del items[index]
+            else:
+                item = (
+                    new_value
+                    if typed
+                    else self._deserialize(
+                        item_field,
+                        new_value,
+                        f"{getattr(field, '_name', 'value')}_{index}",
+                        mapper,
+                    )
+                )
+                if op == "add":
+                    items.insert(index, item)
+                else:
+                    items[index] = item
+            return _rebuild_sequence(value, items)
+        raise ValueError(f"{pointer}: {wrap_val(segment)} does not exist")
+
+    def _modify_structure(
+        self, structure, segment, rest, action, mapper, pointer, copy_on_write
+    ):
+        cls = structure.__class__
+        resolved_mapper = aggregate_deserialization_mappers(
+            cls, mapper, self.camel_case_convert
+        )
+        name = _field_name(cls, resolved_mapper, segment, pointer)
+        field = cls.get_all_fields_by_name()[name]
+        sub_mapper = resolved_mapper.get(
+            f"{segment}._mapper", resolved_mapper.get(f"{name}._mapper")
+        )
+        copy_on_write = copy_on_write or getattr(structure, IS_IMMUTABLE, False)
+        structure = self._writable(structure, copy_on_write)
+        the_dict = structure.__dict__
+        op, new_value, typed = action
+        if rest:
+            if name not in the_dict:
+                raise ValueError(f"{pointer}: {wrap_val(segment)} does not exist")
+            child = the_dict[name]
+            updated = self.modify(
+                child, field, rest, action, sub_mapper, pointer, copy_on_write
+            )
+            if updated is not child:
+                self._set_field(structure, name, updated)
+        elif op == "remove":
+            if name not in the_dict:
+                raise ValueError(f"{pointer}: {wrap_val(segment)} does not exist")
+            del structure[name]
+            the_dict.get("_none_fields", set()).discard(name)
+        else:
+            if op == "replace" and name not in the_dict:
+                raise ValueError(f"{pointer}: {wrap_val(segment)} does not exist")
+            self._set_field(
+                structure,
+                name,
+                new_value
+                if typed
+                else self._deserialize(field, new_value, name, sub_mapper),
+            )
+        return structure
+
+    def apply(self, root: Structure, operation) -> Structure:
+        if not isinstance(operation, dict) or operation.get("op") not in _OPERATIONS:
+            raise ValueError(f"Invalid patch operation: {wrap_val(operation)}")
+        op = operation["op"]
+        pointer = _get_operation_value(operation, "path")
+        path = _parse_pointer(pointer)
+        if not path:
+            raise ValueError("Patching the whole document is not supported")
+        if op == "test":
+            current, field, mapper = self.get(root, path, pointer)
+            expected = self._deserialize(
+                field, _get_operation_value(operation, "value"), path[-1], mapper
+            )
+            if current != expected:
+                raise ValueError(
+                    f"{pointer}: test failed. Expected {wrap_val(expected)}; Got {wrap_val(current)}"
+                )
+            return root
+        if op in {"move", "copy"}:
+            from_pointer = _get_operation_value(operation, "from")
+            from_path = _parse_pointer(from_pointer)
+            value = self.get(root, from_path, from_pointer)[0]
+            if op == "move":
+                if path[: len(from_path)] == from_path and path != from_path:
+                    raise ValueError(
+                        f"{pointer}: cannot move {from_pointer} into one of its children"
+                    )
+                root = self.modify(
+                    root,
+                    None,
+                    from_path,
+                    ("remove", None, False),
+                    None,
+                    from_pointer,
+                    False,
+                )
+            else:
+                value = deepcopy(value)
+            action = ("add", value, True)
+        elif op == "remove":
+            action = ("remove", None, False)
+        else:
+            action = (op, _get_operation_value(operation, "value"), False)
+        return self.modify(root, None, path, action, None, pointer, False)
+
+
+def apply_patch(structure: Structure, patch: list, *, camel_case_convert=False):
+    """
+    Apply a JSON Patch (RFC 6902) directly to a structure, without serializing it and deserializing it again.
+    The paths in the patch refer to the serialized form of the structure, as resolved by the deserialization
+    mappers, and the values are deserialized using the definitions of the fields they are set to.
+    Only the structures along the patched paths are revalidated, once all the operations were applied.
+
+    If the structure is immutable, a new instance is returned, and untouched nested values are shared
+    with the original. Otherwise, the structure is updated in place, and returned. If any of the
+    operations fails, the structure is not changed.
+
+    Arguments:
+        structure(:class:`Structure`):
+            The structure to patch
+        patch(list[dict]):
+            The patch operations, e.g. [{"op": "replace", "path": "/customer/name", "value": "john"}]
+        camel_case_convert(bool): optional
+            Like in :func:`deserialize_structure`
+
+    Returns:
+        The patched structure
+    """
+    patcher = _Patcher(camel_case_convert)
+    result = structure
+    try:
+        for operation in patch:
+            result = patcher.apply(result, operation)
+        patcher.complete()
+    except BaseException:
+        patcher.rollback()
+        raise
+    return result
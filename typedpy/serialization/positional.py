@@ -0,0 +1,296 @@
+"""
+Positional ("tuple JSON") serialization: every structure is serialized to a JSON array of the values of its fields,
+in the order of their declaration, rather than to a dict
+"""
+from collections import deque
+from typing import Type
+
+from typedpy.commons import wrap_val
+from typedpy.structures import ClassReference, Field, NoneField, Structure
+from typedpy.structures.structures import lazy_fields
+from typedpy.fields import (
+    AnyOf,
+    Array,
+    Boolean,
+    Deque,
+    Map,
+    Number,
+    SerializableField,
+    Set,
+    String,
+)
+from .binary import binary_schema_fingerprint
+from .fast_serialization import get_field_accessor
+from .serialization import deserialize_single_field, serialize_val
+from .versioned_mapping import Versioned
+
+
+def _identity(value):
+    return value
+
+
+def _structure_class(field):
+    return field.get_type if isinstance(field, ClassReference) else None
+
+
+def _optional_inner(field):
+    """
+    Returns X of AnyOf[X, NoneField] (e.g. Optional[X]), or None if it is not such a field
+    """
+    if not isinstance(field, AnyOf):
+        return None
+    fields = [f for f in field.get_fields() if not isinstance(f, NoneField)]
+    return fields[0] if len(fields) == 1 else None
+
+
+def _item_field(field):
+    """
+    Returns the field of the values of a collection field, or None if it is not a collection of a single
+    field type
+    """
+    if isinstance(field, (Array, Set, Deque)):
+        items = field.items
+        return items if isinstance(items, Field) else None
+    if isinstance(field, Map) and isinstance(field.items, list):
+        return field.items[1]
+    return None
+
+
+def _has_nested_structure(field) -> bool:
+    if field is None:
+        return False
+    if _structure_class(field) is not None:
+        return True
+    return _has_nested_structure(_optional_inner(field)) or _has_nested_structure(
+        _item_field(field)
+    )
+
+
+def _field_converters(field, name: str, trusted: bool):
+    """
+    Returns the functions that serialize and deserialize a value of the field.
+    Structures are converted positionally wherever they are nested in collections and Optionals, such
+    as in Array[Array[Point]] or Map[str, Optional[Point]].
+    """
+    nested_cls = _structure_class(field)
+    if nested_cls is not None:
+        return (
+            lambda value: _get_plan(nested_cls).serialize(value),
+            lambda value: _get_plan(nested_cls, trusted).deserialize(value, name),
+        )
+    inner = _optional_inner(field)
+    if _has_nested_structure(inner):
+        serialize_inner, deserialize_inner = _field_converters(inner, name, trusted)
+        return (
+            lambda value: None if value is None else serialize_inner(value),
+            lambda value: None if value is None else deserialize_inner(value),
+        )
+    if isinstance(field, (Array, Set, Deque)) and _has_nested_structure(
+        _item_field(field)
+    ):
+        serialize_item, deserialize_item = _field_converters(field.items, name, trusted)
+        container = list
+        if isinstance(field, (Set, Deque)):
+            container = set if isinstance(field, Set) else deque
+        return (
+            lambda value: [serialize_item(v) for v in value],
+            lambda value: container(deserialize_item(v) for v in value),
+        )
+    if isinstance(field, Map) and _has_nested_structure(_item_field(field)):
+        key_field = field.items[0]
+        serialize_item, deserialize_item = _field_converters(
+            field.items[1], name, trusted
+        )
+        return (
+            lambda value: {
+                serialize_val(key_field, name, k): serialize_item(v)
+                for k, v in value.items()
+            },
+            lambda value: {
+                deserialize_single_field(key_field, k, name): deserialize_item(v)
+                for k, v in value.items()
+            },
+        )
+    if isinstance(field, (String, Boolean, Number)) and not isinstance(
+        field, SerializableField
+    ):
+        # the values are validated when the structure is instantiated
+        return _identity, _identity
+    return (
+        lambda value: serialize_val(field, name, value),
+        lambda value: deserialize_single_field(field, value, name),
+    )
+
+
+def _value_getter(name: str, serializer):
+    def get_value(structure):
+        return serializer(structure.__dict__[name])
+
+    return get_value
+
+
+class _PositionalPlan:
+    def __init__(self, cls, trusted: bool):
+        self.cls = cls
+        self.trusted = trusted
+        fields_by_name = cls.get_all_fields_by_name()
+        self.names = list(fields_by_name)
+        self.getters = []
+        self.deserializers = []
+        for name, field in fields_by_name.items():
+            serializer, deserializer = _field_converters(field, name, trusted)
+            accessor = (
+                None if _has_nested_structure(field) else get_field_accessor(field, cls)
+            )
+            self.getters.append(accessor or _value_getter(name, serializer))
+            self.deserializers.append(deserializer)
+        self.schema_hash = (
+            binary_schema_fingerprint(cls).hex() if issubclass(cls, Versioned) else None
+        )
+
+    def serialize(self, structure) -> list:
+        if structure.__dict__.get(lazy_fields):
+            structure = structure.materialize()
+        the_dict = structure.__dict__
+        none_fields = the_dict.get("_none_fields", ())
+        result = []
+        none_mask = 0
+        for i, (name, get_value) in enumerate(zip(self.names, self.getters)):
+            if name not in the_dict:
+                result.append(None)
+                if name in none_fields:
+                    none_mask |= 1 << i
+            elif the_dict[name] is None:
+                result.append(None)
+                none_mask |= 1 << i
+            else:
+                result.append(get_value(structure))
+        if none_mask:
+            result.append(none_mask)
+        else:
+            while result and result[-1] is None:
+                result.pop()
+        return result if self.schema_hash is None else [self.schema_hash] + result
+
+    def _split_none_mask(self, values, name: str):
+        """
+        Returns the values and the bitmask of the fields that are explicitly None, that follows the
+        values of all the fields, if there is one
+        """
+        field_count = len(self.names)
+        if len(values) <= field_count:
+            return values, 0
+        if len(values) > field_count + 1:
+            raise ValueError(
+                f"{name}: Expected at most {field_count} values; Got {len(values)}"
+            )
+        values, none_mask = values[:-1], values[-1]
+        if (
+            none_mask.__class__ is not int
+            or none_mask <= 0
+            or none_mask >> field_count
+            or any(
+                values[i] is not None for i in range(field_count) if none_mask >> i & 1
+            )
+        ):
+            raise ValueError(
+                f"{name}: Expected a bitmask of the fields that are None after the"
+                f" {field_count} values; Got {wrap_val(none_mask)}"
+            )
+        return values, none_mask
+
+    def deserialize(self, values, name: str):
+        if isinstance(values, self.cls):
+            return values
+        if not isinstance(values, list):
+            raise TypeError(f"{name}: Expected a list; Got {wrap_val(values)}")
+        if self.schema_hash is not None:
+            if not values or values[0] != self.schema_hash:
+                raise ValueError(
+                    f"{name}: Expected schema hash {self.schema_hash} of {self.cls.__name__};"
+                    f" Got {wrap_val(values[0] if values else None)}"
+                )
+            values = values[1:]
+        values, none_mask = self._split_none_mask(values, name)
+        kwargs = {}
+        for i, (field_name, deserializer, value) in enumerate(
+            zip(self.names, self.deserializers, values)
+        ):
+            if value is not None:
+                kwargs[field_name] = deserializer(value)
+            elif none_mask >> i & 1:
+                kwargs[field_name] = None
+        if self.trusted:
+            return self.cls.from_trusted_data(None, **kwargs)
+        return self.cls(**kwargs)
+
+
+_plan_by_class = {}
+
+
+def _get_plan(cls, trusted: bool = False) -> _PositionalPlan:
+    key = (cls, trusted)
+    plan = _plan_by_class.get(key)
+    if plan is None:
+        plan = _plan_by_class[key] = _PositionalPlan(cls, trusted)
+    return plan
+
+
+def serialize_positional(structure: Structure) -> list:
+    """
+    Serialize a structure to a "tuple JSON": a list of the values of its fields, in the order of their
+    declaration, instead of a dict. Nested structures are serialized the same way, recursively.
+    Missing values are serialized as None, and trailing Nones are omitted. If some fields are
+    explicitly set to None, the values of all the fields are kept, followed by a bitmask of these
+    fields, so that they are not confused with missing values, which get their defaults.
+    If the class is :class:`Versioned`, the first element is a hash of its schema, which is verified
+    by :func:`deserialize_positional`.
+    Structures are serialized positionally also inside collections and Optionals, e.g. in Array[Array[Point]].
+    The values of other fields, including a union of several structures such as AnyOf[Point, Line], are
+    serialized like in :func:`serialize`. Note that mappers are ignored.
+
+    Arguments:
+        structure(:class:`Structure`):
+            The structure to serialize
+
+    Returns:
+        A list that can be converted to JSON
+
+    Example:
+
+    .. code-block:: python
+
+        class Point(Structure):
+            x: int
+            y: int
+
+        class Line(Structure):
+            start: Point
+            end: Point
+            name: str
+
+        line = Line(start=Point(x=1, y=2), end=Point(x=3, y=4), name="l")
+        assert serialize_positional(line) == [[1, 2], [3, 4], "l"]
+        assert deserialize_positional(Line, [[1, 2], [3, 4], "l"]) == line
+    """
+    return _get_plan(structure.__class__).serialize(structure)
+
+
+def deserialize_positional(
+    cls: Type[Structure], values: list, *, direct_trusted_mapping: bool = False
+) -> Structure:
+    """
+    Deserialize the output of :func:`serialize_positional` to an instance of the given class.
+
+    Arguments:
+        cls(type):
+            The Structure class
+        values(list):
+            The serialized values
+        direct_trusted_mapping(bool): optional
+            Skip the validation of the structures. Use it only for trusted data. Default is False.
+
+    Returns:
+        The deserialized instance
+    """
+    return _get_plan(cls, direct_trusted_mapping).deserialize(values, cls.__name__)
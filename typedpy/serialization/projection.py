@@ -0,0 +1,103 @@
+"""
+Deserialization of a subset of the fields of a Structure, into a generated projection class
+"""
+from functools import lru_cache
+from typing import Iterable, Type
+
+from typedpy.commons import wrap_val
+from typedpy.structures import ClassReference, Structure
+from typedpy.structures.consts import (
+    ENABLE_UNDEFINED,
+    IGNORE_NONE_VALUES,
+    REQUIRED_FIELDS,
+)
+from .mappers import aggregate_deserialization_mappers
+from .serialization import deserialize_structure_internal
+from .versioned_mapping import VERSIONS_MAPPING, Versioned, get_versions_converter
+
+
+def _sub_paths_by_field(paths: Iterable[str]) -> dict:
+    sub_paths_by_field = {}
+    for path in paths:
+        name, _, rest = path.partition(".")
+        if not rest:
+            sub_paths_by_field[name] = None
+        elif sub_paths_by_field.get(name, ()) is not None:
+            sub_paths_by_field.setdefault(name, []).append(rest)
+    return sub_paths_by_field
+
+
+@lru_cache(maxsize=256)
+def get_projection_class(cls: Type[Structure], paths: tuple) -> Type[Structure]:
+    """
+    Define a Structure class with only the given fields of cls, similar to :meth:`Structure.pick`.
+    A path can refer to a field of a nested structure, using dot notation, for example: "owner.name".
+    In this case, the nested field is a projection of the nested structure.
+
+    Arguments:
+        cls(type):
+            The original Structure class
+        paths(tuple[str]):
+            The paths of the fields to include
+
+    Returns:
+        The projection class
+    """
+    fields_by_name = cls.get_all_fields_by_name()
+    cls_dict = {
+        k: getattr(cls, k)
+        for k in [IGNORE_NONE_VALUES, ENABLE_UNDEFINED]
+        if hasattr(cls, k)
+    }
+    for name, sub_paths in _sub_paths_by_field(paths).items():
+        if name not in fields_by_name:
+            raise TypeError(
+                f"Projection: {wrap_val(name)} is not a field of {cls.__name__}"
+            )
+        field = fields_by_name[name]
+        if sub_paths is None:
+            cls_dict[name] = field
+        elif isinstance(field, ClassReference):
+            cls_dict[name] = ClassReference(
+                get_projection_class(field.get_type, tuple(sorted(set(sub_paths))))
+            )
+        else:
+            raise TypeError(
+                f"Projection: {wrap_val(name)} of {cls.__name__} is not a Structure"
+            )
+    cls_dict[REQUIRED_FIELDS] = [
+        x for x in getattr(cls, REQUIRED_FIELDS) if x in cls_dict
+    ]
+    return type(f"Projected{cls.__name__}", (Structure,), cls_dict)
+
+
+def deserialize_projection(
+    cls,
+    input_data,
+    paths: Iterable[str],
+    *,
+    mapper=None,
+    use_strict_mapping=False,
+    camel_case_convert=False,
+    lazy=False,
+):
+    """
+    The implementation of deserialization using the "fields" or "only" arguments of :class:`Deserializer`.
+    The input is deserialized using the mappers of the original class, but only the keys of the
+    requested fields are read.
+    """
+    projection = get_projection_class(cls, tuple(sorted(set(paths))))
+    if issubclass(cls, Versioned) and getattr(cls, VERSIONS_MAPPING):
+        if not isinstance(input_data, dict) or "version" not in input_data:
+            raise TypeError("Expected a dictionary with a 'version' value")
+        input_data = get_versions_converter(cls, input_data["version"])(input_data)
+    return deserialize_structure_internal(
+        projection,
+        input_data,
+        use_strict_mapping=use_strict_mapping,
+        camel_case_convert=camel_case_convert,
+        resolved_mapper=aggregate_deserialization_mappers(
+            cls, mapper, camel_case_convert
+        ),
+        lazy=lazy,
+    )
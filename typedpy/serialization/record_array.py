@@ -0,0 +1,397 @@
+"""
+Fixed-layout records of Structures, packed with the struct module into a single buffer
+"""
+import struct
+from typing import Dict, Iterable, Optional, Type
+
+from typedpy.commons import wrap_val
+from typedpy.structures import NoneField, Structure
+from typedpy.structures.consts import REQUIRED_FIELDS
+from typedpy.fields import AnyOf, Boolean, Enum, Float, Integer, String
+
+# the maximal number of bytes of a single character in UTF-8
+_MAX_UTF8_CHAR_SIZE = 4
+
+
+def _unwrap_optional(field):
+    """
+    Returns the inner field of AnyOf[X, NoneField] (e.g. Optional[int]), or None if it is not such a field
+    """
+    if not isinstance(field, AnyOf):
+        return None
+    fields = [f for f in field.get_fields() if not isinstance(f, NoneField)]
+    if len(fields) == 1 and len(field.get_fields()) == 2:
+        return fields[0]
+    return None
+
+
+class _FieldLayout:
+    """
+    The packing of a single field in a record. Optional fields are preceded by a presence flag.
+    """
+
+    def __init__(self, name: str, field, optional: bool, max_bytes: Optional[int]):
+        inner = _unwrap_optional(field)
+        if inner is not None:
+            field = inner
+            optional = True
+        self.name = name
+        self.optional = optional
+        self.encode = None
+        self.decode = None
+        if isinstance(field, Enum):
+            values = list(field.values)
+            index_by_value = {v: i for i, v in enumerate(values)}
+            self.format = "H" if len(values) <= 0xFFFF else "I"
+            self.encode = index_by_value.__getitem__
+            self.decode = values.__getitem__
+        elif isinstance(field, Boolean):
+            self.format = "?"
+        elif isinstance(field, Integer):
+            self.format = "q"
+        elif isinstance(field, Float):
+            self.format = "d"
+        elif isinstance(field, String) and (
+            max_bytes is not None or field.maxLength is not None
+        ):
+            # maxLength is in characters, and every one of them can take up to 4 bytes
+            size = (
+                max_bytes
+                if max_bytes is not None
+                else _MAX_UTF8_CHAR_SIZE * field.maxLength
+            )
+            # the actual length is stored first, so the string can end with any character
+            prefix_size = 1 if size <= 0xFF else 2 if size <= 0xFFFF else 4
+            self.format = f"{prefix_size + size}s"
+
+            def encode(value: str):
+                encoded = value.encode("utf-8")
+                if len(encoded) > size:
+                    raise ValueError(
+                        f"{name}: Got {wrap_val(value)}; Expected at most {size} bytes in UTF-8"
+                    )
+                return len(encoded).to_bytes(prefix_size, "little") + encoded
+
+            def decode(value: bytes):
+                length = int.from_bytes(value[:prefix_size], "little")
+                return value[prefix_size : prefix_size + length].decode("utf-8")
+
+            self.encode = encode
+            self.decode = decode
+        else:
+            raise TypeError(
+                f"{name}: Expected an Integer, Float, Boolean, Enum, or String with maxLength"
+                f" or max_bytes; Got {field.__class__.__name__}"
+            )
+        self.struct_format = ("?" if optional else "") + self.format
+
+
+class _RecordLayout:
+    def __init__(self, cls, max_bytes: Dict[str, int]):
+        required = getattr(cls, REQUIRED_FIELDS, [])
+        fields_by_name = cls.get_all_fields_by_name()
+        for name, size in max_bytes.items():
+            if name not in fields_by_name:
+                raise ValueError(
+                    f"max_bytes: {wrap_val(name)} is not a field of {cls.__name__}"
+                )
+            field = fields_by_name[name]
+            if not isinstance(_unwrap_optional(field) or field, String):
+                raise TypeError(f"max_bytes: {name}: Expected a String field")
+            if not isinstance(size, int) or size < 1:
+                raise ValueError(
+                    f"max_bytes: {name}: Expected a positive int; Got {wrap_val(size)}"
+                )
+        self.cls = cls
+        self.max_bytes = max_bytes
+        self.fields = [
+            _FieldLayout(
+                name,
+                field,
+                optional=name not in required,
+                max_bytes=max_bytes.get(name),
+            )
+            for name, field in fields_by_name.items()
+        ]
+        self.format = "<" + "".join(f.struct_format for f in self.fields)
+        self.struct = struct.Struct(self.format)
+        self.size = self.struct.size
+        self.field_struct_by_name = {}
+        offset = 0
+        for f in self.fields:
+            if f.optional:
+                offset += 1
+            field_struct = struct.Struct("<" + f.format)
+            self.field_struct_by_name[f.name] = (f, field_struct, offset)
+            offset += field_struct.size
+
+    def pack_values(self, structure) -> list:
+        if not isinstance(structure, self.cls):
+            raise TypeError(
+                f"Expected an instance of {self.cls.__name__}; Got {wrap_val(structure)}"
+            )
+        the_dict = structure.materialize().__dict__
+        values = []
+        for f in self.fields:
+            value = the_dict.get(f.name)
+            if f.optional:
+                values.append(value is not None)
+                if value is None:
+                    values.append(_empty_value(f.format))
+                    continue
+            values.append(f.encode(value) if f.encode is not None else value)
+        return values
+
+    def pack(self, structure) -> bytes:
+        try:
+            return self.struct.pack(*self.pack_values(structure))
+        except struct.error as ex:
+            raise ValueError(f"{self.cls.__name__}: {ex}") from ex
+
+    def unpack_values(self, values) -> dict:
+        kwargs = {}
+        it = iter(values)
+        for f in self.fields:
+            if f.optional and not next(it):
+                next(it)
+                continue
+            value = next(it)
+            kwargs[f.name] = value if f.decode is None else f.decode(value)
+        return kwargs
+
+
+def _empty_value(fmt: str):
+    if fmt.endswith("s"):
+        return b""
+    return False if fmt == "?" else 0
+
+
+_layout_by_class = {}
+
+
+def _get_layout(cls, max_bytes: Optional[Dict[str, int]] = None) -> _RecordLayout:
+    key = (cls, tuple(sorted(max_bytes.items())) if max_bytes else ())
+    layout = _layout_by_class.get(key)
+    if layout is None:
+        layout = _layout_by_class[key] = _RecordLayout(cls, dict(max_bytes or {}))
+    return layout
+
+
+def record_format(
+    cls: Type[Structure], max_bytes: Optional[Dict[str, int]] = None
+) -> str:
+    """
+    Returns the struct format of a record of the given Structure class, as used by :class:`RecordArray`.
+    Raises TypeError if the class does not have a fixed layout.
+    """
+    return _get_layout(cls, max_bytes).format
+
+
+class RecordArray:
+    """
+    An array of Structures of a fixed layout, packed in a single buffer rather than kept as Python objects.
+    It is useful for very large numbers of small records, in which the overhead of Python objects is much
+    larger than the data itself.
+    All the fields of the structure must be Integer (packed as 8 bytes), Float (8 bytes), Boolean, Enum (packed
+    as the index of the value) or String. A String is packed as its length in bytes, followed by a slot of
+    4 * maxLength bytes of UTF-8, which is enough for any character. If the strings are mostly ASCII, you can use
+    max_bytes to set a smaller slot, or a slot for a String without a maxLength.
+    Optional fields, including Optional[X], take an additional byte for their presence.
+
+    A Structure instance is created only when a record is accessed, and the value of a single field can be read
+    without creating it at all, directly from the buffer. Slicing returns a view of the same buffer.
+
+    Arguments:
+        cls(type):
+            The Structure class of the records
+        buffer(bytes, bytearray, memoryview or mmap): optional
+            The buffer of packed records. Default is a new empty bytearray. New records can be appended only
+            if it is a bytearray.
+        direct_trusted_mapping(bool): optional
+            Create the instances without validating them. Use it only if the buffer is trusted. Default is False.
+        max_bytes(dict): optional
+            The number of bytes of UTF-8 to reserve for a String field, by field name. It overrides the default
+            of 4 * maxLength. A string that does not fit in it cannot be packed. A buffer must be read with
+            the same max_bytes it was written with.
+
+    Example:
+
+    .. code-block:: python
+
+        class Tick(Structure):
+            symbol: String(maxLength=8)
+            price: Float
+            volume: Integer
+
+        ticks = RecordArray.from_structures(Tick, [Tick(symbol="ABC", price=1.5, volume=100), ...])
+        assert ticks[0] == Tick(symbol="ABC", price=1.5, volume=100)
+        assert ticks.get(0, "price") == 1.5
+
+        with open("ticks.bin", "wb") as f:
+            f.write(ticks.buffer)
+
+        with open("ticks.bin", "rb") as f:
+            ticks = RecordArray(Tick, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    """
+
+    def __init__(
+        self,
+        cls: Type[Structure],
+        buffer=None,
+        *,
+        direct_trusted_mapping: bool = False,
+        max_bytes: Optional[Dict[str, int]] = None,
+    ):
+        self._layout = _get_layout(cls, max_bytes)
+        self._buffer = bytearray() if buffer is None else buffer
+        if memoryview(self._buffer).nbytes % self._layout.size:
+            raise ValueError(
+                f"{cls.__name__}: Expected a buffer size that is a multiple of {self._layout.size}"
+            )
+        self._trusted = direct_trusted_mapping
+
+    @classmethod
+    def from_structures(
+        cls,
+        structure_class: Type[Structure],
+        structures: Iterable[Structure],
+        *,
+        direct_trusted_mapping: bool = False,
+        max_bytes: Optional[Dict[str, int]] = None,
+    ) -> "RecordArray":
+        """
+        Pack the given structures to a new RecordArray
+        """
+        pack = _get_layout(structure_class, max_bytes).pack
+        buffer = bytearray(b"".join(pack(s) for s in structures))
+        return cls(
+            structure_class,
+            buffer,
+            direct_trusted_mapping=direct_trusted_mapping,
+            max_bytes=max_bytes,
+        )
+
+    @property
+    def structure_class(self) -> Type[Structure]:
+        return self._layout.cls
+
+    @property
+    def buffer(self):
+        """
+        The underlying buffer
+        """
+        return self._buffer
+
+    @property
+    def record_size(self) -> int:
+        return self._layout.size
+
+    def __len__(self):
+        return memoryview(self._buffer).nbytes // self._layout.size
+
+    def _offset(self, index: int) -> int:
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError(f"{self._layout.cls.__name__}: index out of range")
+        return index * self._layout.size
+
+    def _create(self, values):
+        kwargs = self._layout.unpack_values(values)
+        cls = self._layout.cls
+        if self._trusted:
+            return cls.from_trusted_data(None, **kwargs)
+        return cls(**kwargs)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                raise ValueError("Slicing a RecordArray with a step is not supported")
+            size = self._layout.size
+            view = memoryview(self._buffer).cast("B")[
+                start * size : max(start, stop) * size
+            ]
+            return RecordArray(
+                self._layout.cls,
+                view,
+                direct_trusted_mapping=self._trusted,
+                max_bytes=self._layout.max_bytes,
+            )
+        return self._create(
+            self._layout.struct.unpack_from(self._buffer, self._offset(index))
+        )
+
+    def __iter__(self):
+        for values in self._layout.struct.iter_unpack(self._buffer):
+            yield self._create(values)
+
+    def get(self, index: int, field_name: str):
+        """
+        Returns the value of a single field of a record, directly from the buffer, without creating
+        the Structure instance.
+        """
+        entry = self._layout.field_struct_by_name.get(field_name)
+        if entry is None:
+            raise KeyError(
+                f"{wrap_val(field_name)} is not a field of {self._layout.cls.__name__}"
+            )
+        field_layout, field_struct, field_offset = entry
+        offset = self._offset(index) + field_offset
+        if field_layout.optional and not self._buffer[offset - 1]:
+            return None
+        value = field_struct.unpack_from(self._buffer, offset)[0]
+        return value if field_layout.decode is None else field_layout.decode(value)
+
+    def column(self, field_name: str) -> list:
+        """
+        Returns the values of a single field in all the records
+        """
+        return [self.get(i, field_name) for i in range(len(self))]
+
+    def record_view(self, index: int) -> memoryview:
+        """
+        Returns a memoryview of the packed bytes of a record, without copying it
+        """
+        offset = self._offset(index)
+        return memoryview(self._buffer).cast("B")[offset : offset + self._layout.size]
+
+    def __setitem__(self, index: int, structure: Structure):
+        offset = self._offset(index)
+        packed = self._layout.pack(structure)
+        memoryview(self._buffer).cast("B")[offset : offset + len(packed)] = packed
+
+    def _verify_can_grow(self):
+        if not isinstance(self._buffer, bytearray):
+            raise TypeError(
+                f"Cannot add records to a buffer of type {self._buffer.__class__.__name__}"
+            )
+
+    def append(self, structure: Structure):
+        self._verify_can_grow()
+        self._buffer += self._layout.pack(structure)
+
+    def extend(self, structures: Iterable[Structure]):
+        self._verify_can_grow()
+        pack = self._layout.pack
+        self._buffer += b"".join(pack(s) for s in structures)
+
+    def to_structures(self) -> list:
+        """
+        Returns a list of all the records, as Structure instances
+        """
+        return list(self)
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, RecordArray)
+            and other.structure_class is self.structure_class
+            and other.record_size == self.record_size
+            and bytes(memoryview(self._buffer).cast("B"))
+            == bytes(memoryview(other.buffer).cast("B"))
+        )
+
+    def __repr__(self):
+        return f"<RecordArray of {self._layout.cls.__name__}, {len(self)} records>"
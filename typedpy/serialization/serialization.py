@@ -1,8 +1,7 @@
 import collections
 import enum
-import json
 import uuid
-from functools import lru_cache
+from functools import lru_cache, partial
 from typing import Dict
 from decimal import Decimal
 
@@ -16,10 +15,11 @@ from typedpy.commons import (
 from typedpy.serialization.versioned_mapping import (
     VERSIONS_MAPPING,
     Versioned,
-    convert_dict,
+    get_versions_converter,
 )
 from typedpy.serialization.mappers import (
     DoNotSerialize,
+    _set_base_mapper_no_op,
     aggregate_deserialization_mappers,
     aggregate_serialization_mappers,
     get_flat_resolved_mapper,
@@ -37,8 +37,10 @@ from typedpy.structures import (
     ClassReference,
 )
 from typedpy.structures.consts import (
+    CACHE_SERIALIZATION,
     DESERIALIZATION_MAPPER,
     ENABLE_UNDEFINED,
+    IS_IMMUTABLE,
     SERIALIZATION_MAPPER,
 )
 from typedpy.fields import (
@@ -67,10 +69,16 @@ from typedpy.fields import (
     _DictStruct,
     _ListStruct,
 )
+from typedpy.fields.structure_array import set_value_serialization
 from .fast_serialization import FastSerializable, create_serializer
+from .type_encoders import encode_value, get_type_decoder, get_type_encoder
 from ..structures.structures import (
+    LazyFieldValue,
+    _internal_props,
     created_fast_serializer,
     failed_to_create_fast_serializer,
+    serialization_cache,
+    set_type_encoder_lookup,
 )
 
 
@@ -243,7 +251,15 @@ def deserialize_multifield_wrapper(
     return deserialized
 
 
-def deserialize_map(map_field, source_val, name, camel_case_convert=False):
+def deserialize_map(
+    map_field,
+    source_val,
+    name,
+    camel_case_convert=False,
+    *,
+    keep_undefined=True,
+    mapper=None,
+):
     if not isinstance(source_val, dict):
         raise TypeError(f"{name}: Got {wrap_val(source_val)}; Expected a dictionary")
     if map_field.items:
@@ -262,12 +278,23 @@ def deserialize_map(map_field, source_val, name, camel_case_convert=False):
             value_field,
             val,
             name,
+            keep_undefined=keep_undefined,
+            mapper=mapper,
             camel_case_convert=camel_case_convert,
             ignore_none=ignore_none,
         )
     return res
 
 
+def _get_typed_field_decoder(field, source_val):
+    if not isinstance(field, TypedField):
+        return None
+    ty = field._ty
+    if not isinstance(ty, type) or isinstance(source_val, ty):
+        return None
+    return get_type_decoder(ty)
+
+
 def deserialize_single_field(  # pylint: disable=too-many-branches
     field,
     source_val,
@@ -381,28 +408,40 @@ def deserialize_single_field(  # pylint: disable=too-many-branches
             raise ValueError(f"{name}: Got {wrap_val(source_val)}; {str(e)}") from e
     elif isinstance(field, Map):
         value = deserialize_map(
-            field, source_val, name, camel_case_convert=camel_case_convert
+            field,
+            source_val,
+            name,
+            camel_case_convert=camel_case_convert,
+            keep_undefined=keep_undefined,
+            mapper=mapper,
         )
     elif isinstance(field, SerializableField):
         value = field.deserialize(source_val)
     elif isinstance(field, Anything) or field is None:
         value = source_val
-    elif isinstance(field, TypedField) and isinstance(source_val, (list, dict)):
-        ty = getattr(field, "_ty")
-        if isinstance(source_val, list):
-            value = ty(*source_val)
-        elif isinstance(source_val, dict):
-            value = ty(**source_val)
-    elif isinstance(field, NoneField):
-        raise ValueError(f"{name}: Got {wrap_val(source_val)}; Expected None")
     else:
-        raise NotImplementedError(
-            f"{name}: Got {wrap_val(source_val)}; Cannot deserialize value of type {field.__class__.__name__}. Are "
-            "you using non-Typepy class? "
-        )
+        value = _deserialize_typed_field(field, source_val, name)
     return value
 
 
+def _deserialize_typed_field(field, source_val, name):
+    decoder = _get_typed_field_decoder(field, source_val)
+    if decoder is not None:
+        try:
+            return decoder(source_val)
+        except (TypeError, ValueError) as ex:
+            raise ValueError(f"{name}: Got {wrap_val(source_val)}; {str(ex)}") from ex
+    if isinstance(field, TypedField) and isinstance(source_val, (list, dict)):
+        ty = getattr(field, "_ty")
+        return ty(*source_val) if isinstance(source_val, list) else ty(**source_val)
+    if isinstance(field, NoneField):
+        raise ValueError(f"{name}: Got {wrap_val(source_val)}; Expected None")
+    raise NotImplementedError(
+        f"{name}: Got {wrap_val(source_val)}; Cannot deserialize value of type {field.__class__.__name__}. Are "
+        "you using non-Typepy class? "
+    )
+
+
 def deserialize_structure_reference(
     cls, the_dict: dict, *, keep_undefined, mapper, camel_case_convert=False
 ):
@@ -425,6 +464,17 @@ def deserialize_structure_reference(
     return kwargs
 
 
+_lazily_deserialized_fields = (
+    ClassReference,
+    StructureReference,
+    Array,
+    Map,
+    Set,
+    Tuple,
+    Deque,
+)
+
+
 def construct_fields_map(
     field_by_name,
     keep_undefined,
@@ -435,6 +485,7 @@ def construct_fields_map(
     camel_case_convert=False,
     ignore_none=False,
     enable_undefined=False,
+    lazy=False,
 ):
     result = {}
     errors = []
@@ -464,7 +515,24 @@ def construct_fields_map(
                 f"{mapped_key}._mapper", mapper.get(f"{key}._mapper")
             )
             if processed_input is not Undefined:
-                if Structure.failing_fast() and processed_input:
+                if (
+                    lazy
+                    and processed_input is not None
+                    and isinstance(field, _lazily_deserialized_fields)
+                ):
+                    result[key] = LazyFieldValue(
+                        partial(
+                            deserialize_single_field,
+                            field,
+                            processed_input,
+                            key,
+                            mapper=sub_mapper,
+                            keep_undefined=keep_undefined,
+                            camel_case_convert=camel_case_convert,
+                            ignore_none=ignore_none,
+                        )
+                    )
+                elif Structure.failing_fast() and processed_input:
                     result[key] = deserialize_single_field(
                         field,
                         processed_input,
@@ -539,14 +607,16 @@ def _extract_non_nonefield_from_optional(field: AnyOf) -> Field:
     return fields[0] if fields[1].__class__ is NoneField else fields[0]
 
 
+def _is_trusted_item(field) -> bool:
+    if field is None or isinstance(field, _valid_classes_for_trusted_deserialization):
+        return True
+    return isinstance(field, ClassReference) and bool(
+        _structure_simplicity_level(field.get_type)
+    )
+
+
 @lru_cache(maxsize=128)
 def _structure_simplicity_level(cls):
-    mapper_is_valid = _is_mapper_simple(cls)
-    if not mapper_is_valid:
-        raise ValueError(
-            f"class {cls.__name__} has a mapper that is unsupported for trusted deserialization"
-        )
-
     simplicity = _ClsSimplicity.not_nested
     for v in cls.get_all_fields_by_name().values():
         if isinstance(v, SerializableField):
@@ -562,7 +632,9 @@ def _structure_simplicity_level(cls):
                     return False
             continue
         if isinstance(v, Array):
-            if isinstance(v, SerializableField):
+            if isinstance(v, SerializableField) or isinstance(
+                v.items, SerializableField
+            ):
                 simplicity = _ClsSimplicity.nested
             if isinstance(v.items, _valid_classes_for_trusted_deserialization):
                 continue
@@ -582,6 +654,12 @@ def _structure_simplicity_level(cls):
                 simplicity = _ClsSimplicity.nested
                 continue
             return False
+        if isinstance(v, (Map, Tuple, Deque)):
+            items = v.items if isinstance(v.items, list) else [v.items]
+            if all(_is_trusted_item(f) for f in items):
+                simplicity = _ClsSimplicity.nested
+                continue
+            return False
         if isinstance(v, ClassReference) and _structure_simplicity_level(v.get_type):
             simplicity = _ClsSimplicity.nested
             continue
@@ -590,6 +668,46 @@ def _structure_simplicity_level(cls):
     return simplicity
 
 
+@lru_cache(maxsize=128)
+def _get_trusted_input_mapping(cls):
+    """
+    For a class with a mapper that does more than renaming keys, returns the resolved
+    deserialization mapper, and the mappers of nested fields that differ from the mappers
+    of their classes. Returns None if the mapper only renames keys.
+    """
+    if _is_mapper_simple(cls):
+        return None
+    mapper = aggregate_deserialization_mappers(cls)
+    base_mapper = _set_base_mapper_no_op(cls, for_serialization=False)
+    nested_mappers = {}
+    for key in cls.get_all_fields_by_name():
+        mapped_key = mapper.get(key, key)
+        sub_mapper = mapper.get(f"{mapped_key}._mapper", mapper.get(f"{key}._mapper"))
+        if sub_mapper and sub_mapper != base_mapper.get(f"{key}._mapper"):
+            nested_mappers[key] = sub_mapper
+    return mapper, nested_mappers
+
+
+def _map_trusted_input(cls, input_dict, mapper, *, use_strict_mapping):
+    enable_undefined = getattr(cls, ENABLE_UNDEFINED, False)
+    result = {}
+    for key in cls.get_all_fields_by_name():
+        if key in mapper:
+            value = get_processed_input(
+                key,
+                mapper,
+                input_dict,
+                enable_undefined=enable_undefined,
+                use_strict_mapping=use_strict_mapping,
+            )
+            if value is Undefined or (value is None and not enable_undefined):
+                continue
+            result[key] = value
+        elif key in input_dict:
+            result[key] = input_dict[key]
+    return result
+
+
 @lru_cache(maxsize=128)
 def _get_enum_mapping(cls):
     without_optionals = {
@@ -625,7 +743,24 @@ def _remap_input(
     simple_structure_verified,
     camel_case_convert,
     keep_undefined,
+    nested_mappers=None,
 ):
+    def deserialize_item(item_field, x):
+        if isinstance(item_field, ClassReference):
+            return deserialize_structure_internal(
+                item_field.get_type,
+                x,
+                name,
+                use_strict_mapping=use_strict_mapping,
+                camel_case_convert=camel_case_convert,
+                keep_undefined=keep_undefined,
+                simple_structure_verified=simple_structure_verified,
+                direct_trusted_mapping=True,
+            )
+        if isinstance(item_field, SerializableField):
+            return item_field.deserialize_trusted(x)
+        return x
+
     corrected_input = {}
     for k, v in input_dict.items():
         field_def = cls.get_all_fields_by_name().get(k)
@@ -635,6 +770,16 @@ def _remap_input(
             ):
                 corrected_input[k] = None
             continue
+        if nested_mappers and k in nested_mappers:
+            corrected_input[k] = deserialize_single_field(
+                field_def,
+                v,
+                k,
+                mapper=nested_mappers[k],
+                keep_undefined=keep_undefined,
+                camel_case_convert=camel_case_convert,
+            )
+            continue
         if (
             isinstance(field_def, AnyOf)
             and _is_optional_anyof(field_def)
@@ -656,7 +801,7 @@ def _remap_input(
         elif isinstance(field_def, Enum):
             corrected_input[k] = v
         elif isinstance(field_def, SerializableField):
-            corrected_input[k] = field_def.deserialize(v)
+            corrected_input[k] = field_def.deserialize_trusted(v)
         elif isinstance(field_def, Array):
             if isinstance(field_def.items, ClassReference):
                 corrected_input[k] = [
@@ -673,7 +818,7 @@ def _remap_input(
                     for x in v
                 ]
             elif isinstance(field_def.items, SerializableField):
-                corrected_input[k] = field_def.items.deserialize(v)
+                corrected_input[k] = [field_def.items.deserialize_trusted(x) for x in v]
             else:
                 corrected_input[k] = v
 
@@ -683,7 +828,7 @@ def _remap_input(
             ):
                 corrected_input[k] = set(v)
             elif isinstance(field_def.items, SerializableField):
-                corrected_input[k] = {field_def.items.deserialize(x) for x in v}
+                corrected_input[k] = {field_def.items.deserialize_trusted(x) for x in v}
             elif isinstance(field_def.items, ClassReference):
                 corrected_input[k] = {
                     deserialize_structure_internal(
@@ -698,11 +843,46 @@ def _remap_input(
                     )
                     for x in v
                 }
+        elif isinstance(field_def, Map):
+            if isinstance(field_def.items, list):
+                key_field, value_field = field_def.items
+                corrected_input[k] = {
+                    deserialize_item(key_field, key): deserialize_item(value_field, x)
+                    for key, x in v.items()
+                }
+            else:
+                corrected_input[k] = v
+        elif isinstance(field_def, Tuple):
+            if isinstance(field_def.items, list):
+                corrected_input[k] = tuple(
+                    deserialize_item(item_field, x)
+                    for item_field, x in zip(field_def.items, v)
+                )
+            else:
+                corrected_input[k] = tuple(
+                    deserialize_item(field_def.items, x) for x in v
+                )
+        elif isinstance(field_def, Deque):
+            corrected_input[k] = collections.deque(
+                deserialize_item(field_def.items, x) for x in v
+            )
         else:
             corrected_input[k] = v
     return corrected_input
 
 
+def _adjust_keep_undefined_to_mapper(cls, mapper, keep_undefined, camel_case_convert):
+    if keep_undefined:
+        for m in cls.get_aggregated_deserialization_mapper():
+            if isinstance(m, mappers) or isinstance(mapper, mappers):
+                keep_undefined = False
+        if (camel_case_convert or isinstance(mapper, mappers)) and not getattr(
+            cls, ADDITIONAL_PROPERTIES, False
+        ):
+            keep_undefined = False
+    return keep_undefined
+
+
 def deserialize_structure_internal(
     cls,
     the_dict,
@@ -714,6 +894,8 @@ def deserialize_structure_internal(
     camel_case_convert=False,
     direct_trusted_mapping=False,
     simple_structure_verified=False,
+    resolved_mapper=None,
+    lazy=False,
 ):
     """
     Deserialize a dict to a Structure instance, Jackson style.
@@ -733,6 +915,12 @@ def deserialize_structure_internal(
             class reference field. Users are not supposed to use this argument.
         keep_undefined(bool): optional
             should it create attributes for keys that don't appear in the class? default is False.
+        resolved_mapper(dict): optional
+            the result of aggregate_deserialization_mappers() for the class and mapper, in case the
+            caller already resolved it. This saves resolving it on every call.
+        lazy(bool): optional
+            defer the deserialization of nested structures and collections to their first access.
+            See :func:`deserialize_structure`.
 
     Returns:
         an instance of the provided :class:`Structure` deserialized
@@ -743,8 +931,7 @@ def deserialize_structure_internal(
         if not isinstance(the_dict, dict) or "version" not in the_dict:
             raise TypeError("Expected a dictionary with a 'version' value")
         if getattr(cls, VERSIONS_MAPPING):
-            versions_mapping = getattr(cls, VERSIONS_MAPPING)
-            input_dict = convert_dict(the_dict, versions_mapping)
+            input_dict = get_versions_converter(cls, the_dict["version"])(the_dict)
 
     if (
         direct_trusted_mapping
@@ -752,13 +939,24 @@ def deserialize_structure_internal(
         and (simple_structure_verified or _structure_simplicity_level(cls))
         and not camel_case_convert
     ):
-        deserialization_mapper = _get_class_deserialization_mapping_for_simple_class(
-            cls
-        )
-        if deserialization_mapper:
-            input_dict = {
-                deserialization_mapper.get(k, k): input_dict[k] for k in input_dict
-            }
+        trusted_input_mapping = _get_trusted_input_mapping(cls)
+        nested_mappers = None
+        if trusted_input_mapping:
+            deserialization_mapper, nested_mappers = trusted_input_mapping
+            input_dict = _map_trusted_input(
+                cls,
+                input_dict,
+                deserialization_mapper,
+                use_strict_mapping=use_strict_mapping,
+            )
+        else:
+            deserialization_mapper = (
+                _get_class_deserialization_mapping_for_simple_class(cls)
+            )
+            if deserialization_mapper:
+                input_dict = {
+                    deserialization_mapper.get(k, k): input_dict[k] for k in input_dict
+                }
 
         enum_mapping = _get_enum_mapping(cls)
         if enum_mapping:
@@ -785,6 +983,7 @@ def deserialize_structure_internal(
                 simple_structure_verified=simple_structure_type,
                 camel_case_convert=camel_case_convert,
                 keep_undefined=keep_undefined,
+                nested_mappers=nested_mappers,
             )
             if simple_structure_type is _ClsSimplicity.nested
             else updated_input
@@ -792,15 +991,14 @@ def deserialize_structure_internal(
 
         return cls.from_trusted_data(remapped_input)
 
-    mapper = aggregate_deserialization_mappers(cls, mapper, camel_case_convert)
-    if keep_undefined:
-        for m in cls.get_aggregated_deserialization_mapper():
-            if isinstance(m, mappers) or isinstance(mapper, mappers):
-                keep_undefined = False
-        if (camel_case_convert or isinstance(mapper, mappers)) and not getattr(
-            cls, ADDITIONAL_PROPERTIES, False
-        ):
-            keep_undefined = False
+    mapper = (
+        resolved_mapper
+        if resolved_mapper is not None
+        else aggregate_deserialization_mappers(cls, mapper, camel_case_convert)
+    )
+    keep_undefined = _adjust_keep_undefined_to_mapper(
+        cls, mapper, keep_undefined, camel_case_convert
+    )
 
     ignore_none = getattr(cls, IGNORE_NONE_VALUES, False)
     field_by_name = cls.get_all_fields_by_name()
@@ -849,6 +1047,7 @@ def deserialize_structure_internal(
             camel_case_convert=camel_case_convert,
             ignore_none=ignore_none,
             enable_undefined=getattr(cls, ENABLE_UNDEFINED, False),
+            lazy=lazy,
         )
     )
 
@@ -864,6 +1063,7 @@ def deserialize_structure(
     keep_undefined=True,
     camel_case_convert=False,
     direct_trusted_mapping=False,
+    lazy=False,
 ):
     """
     Deserialize a dict to a Structure instance, Jackson style.
@@ -886,6 +1086,12 @@ def deserialize_structure(
             to the provided function. See working examples in the tests link above.
         keep_undefined(bool): optional
             should it create attributes for keys that don't appear in the class? default is True.
+        lazy(bool): optional
+            If True, fields that are structures or collections are kept in their serialized form, and are
+            deserialized and validated only when they are first accessed. The rest of the fields are
+            deserialized immediately. The validation of the whole structure (i.e. __validate__) is done once
+            all the fields were deserialized. Call materialize() on the result to force it.
+            The input must not be modified while the result is not materialized. Default is False.
 
     Returns:
         an instance of the provided :class:`Structure` deserialized
@@ -898,6 +1104,7 @@ def deserialize_structure(
         keep_undefined=keep_undefined,
         camel_case_convert=camel_case_convert,
         direct_trusted_mapping=direct_trusted_mapping,
+        lazy=lazy,
     )
 
 
@@ -1022,6 +1229,9 @@ def serialize_val(
         ]
     if isinstance(field_definition, Anything) and isinstance(val, Structure):
         return serialize(val, mapper=mapper, camel_case_convert=camel_case_convert)
+    encoder = get_type_encoder(val.__class__)
+    if encoder is not None:
+        return encoder(val)
     if isinstance(val, Structure) or isinstance(field_definition, Field):
         resolved_mapper = (
             aggregate_serialization_mappers(
@@ -1044,7 +1254,7 @@ def serialize_val(
         return val.name if isinstance(val, enum.Enum) else val
     # nothing worked. Not a typedpy field. Last ditch effort.
     try:
-        return json.loads(json.dumps(val))
+        return encode_value(val)
     except Exception as ex:
         raise ValueError(f"{name}: cannot serialize value: {ex}") from ex
 
@@ -1116,15 +1326,62 @@ def _convert_to_camel_case_if_required(key, camel_case_convert):
         return key
 
 
+def is_serialization_cached(cls) -> bool:
+    return getattr(cls, CACHE_SERIALIZATION, False) and getattr(
+        cls, IS_IMMUTABLE, False
+    )
+
+
+def get_cached_serialization(structure, key, mapper=None):
+    """
+    The cached result is shared by all the serializations of the structure, and those of its parents,
+    so it is returned as is, and must not be modified
+    """
+    entry = structure.__dict__.get(serialization_cache, {}).get(key)
+    return entry[1] if entry is not None and entry[0] is mapper else None
+
+
+def set_cached_serialization(structure, key, result, mapper=None):
+    structure.__dict__.setdefault(serialization_cache, {})[key] = (mapper, result)
+    return result
+
+
 def serialize_internal(
     structure,
     mapper=None,
     resolved_mapper=None,
     compact=False,
     camel_case_convert=False,
+    precomputed=None,
+    use_cache=True,
 ):
     cls = structure.__class__
-    if issubclass(cls, FastSerializable) and not mapper:
+    if use_cache and not mapper and not precomputed and is_serialization_cached(cls):
+        if not resolved_mapper or resolved_mapper == aggregate_serialization_mappers(
+            cls, camel_case_convert=camel_case_convert
+        ):
+            # share the cache with nested structures that use the default mapper
+            resolved_mapper = None
+        key = (id(resolved_mapper), compact, camel_case_convert)
+        cached = get_cached_serialization(structure, key, resolved_mapper)
+        if cached is not None:
+            return cached
+        return set_cached_serialization(
+            structure,
+            key,
+            serialize_internal(
+                structure,
+                resolved_mapper=resolved_mapper,
+                compact=compact,
+                camel_case_convert=camel_case_convert,
+                use_cache=False,
+            ),
+            resolved_mapper,
+        )
+    if isinstance(structure, Structure):
+        structure.materialize()
+    precomputed = precomputed or {}
+    if issubclass(cls, FastSerializable) and not mapper and not precomputed:
         if (
             "serialize" not in cls.__dict__
             or structure.__class__.serialize is FastSerializable.serialize
@@ -1154,9 +1411,7 @@ def serialize_internal(
         list(structure.items())
         if isinstance(structure, dict)
         else [
-            (k, v)
-            for (k, v) in structure.__dict__.items()
-            if k not in ["_instantiated", "_none_fields", "_trust_supplied_values"]
+            (k, v) for (k, v) in structure.__dict__.items() if k not in _internal_props
         ]
     ) + nones
     props = structure.__class__.__dict__
@@ -1171,11 +1426,15 @@ def serialize_internal(
         and compact
     ):
         key = fields[0]
-        result = serialize_val(
-            field_by_name.get(key, None),
-            key,
-            getattr(structure, key),
-            camel_case_convert=camel_case_convert,
+        result = (
+            precomputed[key]
+            if key in precomputed
+            else serialize_val(
+                field_by_name.get(key, None),
+                key,
+                getattr(structure, key),
+                camel_case_convert=camel_case_convert,
+            )
         )
     else:
         mapper = mapper or {}
@@ -1190,7 +1449,9 @@ def serialize_internal(
                 else _convert_to_camel_case_if_required(key, camel_case_convert)
             )
             mapped_value = _get_mapped_value(mapper, key, items_map)
-            if mapped_value is not DoNotSerialize:
+            if key in precomputed and mapped_value is None:
+                result[mapped_key] = precomputed[key]
+            elif mapped_value is not DoNotSerialize:
                 the_field_definition = (
                     Anything if mapped_value else field_by_name.get(key, None)
                 )
@@ -1217,6 +1478,7 @@ def serialize(
     mapper: Dict = None,
     compact=None,
     camel_case_convert=False,
+    fields=None,
 ):
     """
     Serialize an instance of :class:`Structure` to a JSON-like dict.
@@ -1235,6 +1497,11 @@ def serialize(
              whether to use a compact form for Structure that is a simple wrapper of a field.
              for example: if a Structure has only one field of an int, if compact is True
              it will serialize the structure as an int instead of a dictionary
+        fields(list[str]): optional
+             serialize only these fields (a "field mask"). A field of a nested structure, or of the
+             structures in a collection, is selected using dot notation, for example: "employees.first_name".
+             The other fields are not read at all. The serializer of every mask is compiled once and reused.
+             The result is always a dict.
 
     Returns:
         a serialized Python object that can be directly converted to JSON
@@ -1246,6 +1513,16 @@ def serialize(
     compact = (
         TypedPyDefaults.compact_serialization_default if compact is None else compact
     )
+    if fields is not None:
+        if not isinstance(value, Structure):
+            raise TypeError("serialize: fields are supported only for a Structure")
+        from .field_mask import (  # pylint: disable=import-outside-toplevel
+            serialize_with_mask,
+        )
+
+        return serialize_with_mask(
+            value, fields, mapper=mapper, camel_case_convert=camel_case_convert
+        )
     if not isinstance(value, (Structure, StructureReference)):
         if value is None or isinstance(value, (int, str, bool, float)):
             return value
@@ -1275,5 +1552,16 @@ class HasTypes:
     Since version 2.12.1.
     """
 
+    # incremented whenever a subclass is defined, so that cached hierarchies are refreshed
+    _subclasses_version = 0
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        HasTypes._subclasses_version += 1
+
     def _additional_serialization(self) -> dict:
         return {"type": self.__class__.__name__.lower()}
+
+
+set_value_serialization(serialize_val, deserialize_single_field)
+set_type_encoder_lookup(get_type_encoder)
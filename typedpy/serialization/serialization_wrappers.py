@@ -1,7 +1,20 @@
 from typedpy.commons import wrap_val
 from typedpy.structures import Structure, TypedPyDefaults, ADDITIONAL_PROPERTIES
-from typedpy.fields import StructureClass, Map, String, OneOf, Boolean, FunctionCall
+from typedpy.fields import (
+    Array,
+    Boolean,
+    FunctionCall,
+    Map,
+    OneOf,
+    String,
+    StructureClass,
+)
 from .serialization import deserialize_structure, serialize
+from .projection import deserialize_projection, get_projection_class
+from .streaming import DEFAULT_CHUNK_SIZE, iter_json_array
+from . import parallel
+from .async_serialization import DEFAULT_CHUNK_SIZE as DEFAULT_ASYNC_CHUNK_SIZE
+from .async_serialization import deserialize_async
 
 
 class Deserializer(Structure):
@@ -65,12 +78,25 @@ class Deserializer(Structure):
 
                 # This raises an exception
                Deserializer(Foo, use_strict_mapping=True).deserialize({"a": 5})
+
+        fields(list[str]): Optional
+            If provided, only these fields are deserialized and validated, and the rest of the input is
+            ignored. The result is an instance of a projection class that has only these fields (similar to
+            :meth:`Structure.pick`). A field of a nested structure can be selected using dot notation. Example:
+
+            .. code-block:: python
+
+                deserializer = Deserializer(Order, fields=["id", "status", "owner.name"])
+                order = deserializer.deserialize(big_order_dict)
+                print(order.owner.name)
+
     """
 
     target_class = StructureClass
     mapper = Map[String, OneOf[String, FunctionCall, Map]]
     use_strict_mapping = Boolean(default=False)
     camel_case_convert = Boolean(default=False)
+    fields = Array[String]
 
     _required = ["target_class"]
 
@@ -83,28 +109,217 @@ class Deserializer(Structure):
                         f"Invalid key in mapper for class {self.target_class.__name__}: {key}. Keys must be one of "
                         "the class fields. "
                     )
+        if self.fields:
+            get_projection_class(self.target_class, tuple(sorted(set(self.fields))))
 
-    def deserialize(
-        self, input_data, *, keep_undefined=None, direct_trusted_mapping=False
-    ):
+    def _adjusted_keep_undefined(self, keep_undefined):
         additional_props_allowed = getattr(
             self.target_class,
             ADDITIONAL_PROPERTIES,
             TypedPyDefaults.additional_properties_default,
         )
-        adjusted_keep_undefined = (
+        return (
             keep_undefined
             if keep_undefined is not None or additional_props_allowed
             else True
         )
+
+    def deserialize(
+        self,
+        input_data,
+        *,
+        keep_undefined=None,
+        direct_trusted_mapping=False,
+        lazy=False,
+        only=None,
+    ):
+        """
+        Deserialize the input to an instance of the target class
+
+        Arguments:
+            input_data:
+                The input to deserialize
+            keep_undefined(bool): optional
+                should it create attributes for keys that don't appear in the class?
+            direct_trusted_mapping(bool): optional
+                Trust the input, and skip validations. See "Deserialization From Trusted Data" in the documentation.
+            lazy(bool): optional
+                Deserialize nested structures and collections only when they are first accessed.
+                See :func:`deserialize_structure`.
+            only(list[str]): optional
+                Deserialize only these fields, overriding the "fields" of the deserializer.
+                direct_trusted_mapping and keep_undefined are not applicable in this case.
+
+        Returns:
+            The deserialized instance
+        """
+        paths = only if only is not None else self.fields
+        if paths:
+            return deserialize_projection(
+                self.target_class,
+                input_data,
+                paths,
+                mapper=self.mapper,
+                use_strict_mapping=self.use_strict_mapping,
+                camel_case_convert=self.camel_case_convert,
+                lazy=lazy,
+            )
         return deserialize_structure(
             self.target_class,
             input_data,
             mapper=self.mapper,
             use_strict_mapping=self.use_strict_mapping,
-            keep_undefined=adjusted_keep_undefined,
+            keep_undefined=self._adjusted_keep_undefined(keep_undefined),
             camel_case_convert=self.camel_case_convert,
             direct_trusted_mapping=direct_trusted_mapping,
+            lazy=lazy,
+        )
+
+    async def deserialize_async(
+        self,
+        input_data,
+        *,
+        keep_undefined=None,
+        direct_trusted_mapping=False,
+        chunk_size: int = DEFAULT_ASYNC_CHUNK_SIZE,
+        executor_threshold: int = None,
+        executor=None,
+    ):
+        """
+        An asyncio-friendly version of deserialize(). Large Arrays/Maps of structures in the input are
+        deserialized in chunks, and control is yielded to the event loop between chunks, so that
+        a big payload does not block other tasks.
+
+        Arguments:
+            input_data:
+                The input to deserialize
+            keep_undefined(bool): optional
+                Same as in deserialize()
+            direct_trusted_mapping(bool): optional
+                Same as in deserialize(). Trusted deserialization is not split to chunks.
+            chunk_size(int): optional
+                The number of elements to deserialize before yielding to the event loop. Collections that
+                are smaller than it are deserialized without yielding.
+            executor_threshold(int): optional
+                If provided, and the total number of elements in the collections of the input is at least
+                this number, the deserialization is offloaded to the executor instead.
+            executor(concurrent.futures.Executor): optional
+                The executor to use when the executor_threshold is exceeded. Default is the loop's
+                default executor.
+
+        Example:
+
+        .. code-block:: python
+
+            order = await Deserializer(Order).deserialize_async(payload, executor_threshold=100_000)
+
+        """
+        return await deserialize_async(
+            self,
+            input_data,
+            keep_undefined=keep_undefined,
+            direct_trusted_mapping=direct_trusted_mapping,
+            chunk_size=chunk_size,
+            executor_threshold=executor_threshold,
+            executor=executor,
+        )
+
+    def iter_deserialize(
+        self,
+        fileobj,
+        *,
+        path: str = None,
+        keep_undefined=None,
+        direct_trusted_mapping=False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        """
+        Incrementally deserialize a JSON array from a file-like object, yielding a validated instance
+        of the target class for every element. Only a single element is held in memory at a time,
+        so this is suitable for inputs that are too large for json.load.
+
+        Arguments:
+            fileobj:
+                An object with a read(size) method that returns str or bytes (utf-8). For example,
+                an open file, or socket.makefile("rb").
+            path(str): optional
+                The location of the array within the document, using dot notation, for example: "data.events".
+                If not provided, the document is expected to be a top-level array.
+            keep_undefined(bool): optional
+                Same as in deserialize()
+            direct_trusted_mapping(bool): optional
+                Same as in deserialize()
+            chunk_size(int): optional
+                The number of bytes/characters read from the file in every read
+
+        Example:
+
+        .. code-block:: python
+
+            with open("events.json", "rb") as f:
+                for event in Deserializer(Event).iter_deserialize(f, path="data.events"):
+                    process(event)
+
+        """
+        for i, item in enumerate(
+            iter_json_array(fileobj, path=path, chunk_size=chunk_size)
+        ):
+            try:
+                yield self.deserialize(
+                    item,
+                    keep_undefined=keep_undefined,
+                    direct_trusted_mapping=direct_trusted_mapping,
+                )
+            except (TypeError, ValueError) as ex:
+                err_class = TypeError if isinstance(ex, TypeError) else ValueError
+                raise err_class(f"element {i}: {ex}") from ex
+
+    def deserialize_many(
+        self,
+        records,
+        *,
+        workers: int = None,
+        chunk_size: int = parallel.DEFAULT_CHUNK_SIZE,
+        keep_undefined=None,
+        direct_trusted_mapping=False,
+        validate_only=False,
+    ) -> list:
+        """
+        Deserialize a large batch of records using a pool of processes, to utilize multiple cores.
+        Every worker process rebuilds this deserializer once, from the target class, and then
+        deserializes chunks of records.
+
+        Arguments:
+            records:
+                An iterable of the inputs to deserialize
+            workers(int): optional
+                The number of worker processes. Default is the number of CPUs. If it is 1, the
+                deserialization is done in the current process.
+                The target class must be importable from a module, and the mapper must be picklable
+                (i.e. no lambdas).
+            chunk_size(int): optional
+                The number of records that are sent to a worker process in every task
+            keep_undefined(bool): optional
+                Same as in deserialize()
+            direct_trusted_mapping(bool): optional
+                Same as in deserialize()
+            validate_only(bool): optional
+                If True, the deserialized instances are not sent back from the workers. Instead, the result
+                has, for every record, None if it is valid, or the error message otherwise.
+                Default is False.
+
+        Returns:
+            A list of the deserialized instances, in the same order as the records. If validate_only is set,
+            a list of the validation errors.
+        """
+        return parallel.deserialize_many(
+            self,
+            records,
+            workers=workers,
+            chunk_size=chunk_size,
+            keep_undefined=keep_undefined,
+            direct_trusted_mapping=direct_trusted_mapping,
+            validate_only=validate_only,
         )
 
 
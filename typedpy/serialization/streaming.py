@@ -0,0 +1,143 @@
+"""
+Incremental reading of JSON documents from file-like objects, without loading
+the whole document into memory.
+"""
+import codecs
+import json
+from json import JSONDecodeError
+
+from typedpy.commons import wrap_val
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+_DELIMITERS = _WHITESPACE + ",:]}"
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+class _IncrementalReader:
+    """
+    A text buffer over a file-like object. The buffer only holds the part of the document
+    that was not consumed yet, so the memory is bounded by the largest single value.
+    """
+
+    def __init__(self, fileobj, chunk_size):
+        self._fileobj = fileobj
+        self._chunk_size = chunk_size
+        self._decoder = None
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _read_more(self, size) -> bool:
+        chunk = ""
+        while not chunk:
+            if self._eof:
+                return False
+            raw = self._fileobj.read(size)
+            # only an empty read is the end. A read that ends in the middle of a multibyte
+            # character is decoded to an empty string.
+            self._eof = not raw
+            if isinstance(raw, (bytes, bytearray, memoryview)):
+                if self._decoder is None:
+                    self._decoder = codecs.getincrementaldecoder("utf-8")()
+                chunk = self._decoder.decode(bytes(raw), final=self._eof)
+            else:
+                chunk = raw
+        if self._pos:
+            self._buffer = self._buffer[self._pos :]
+            self._pos = 0
+        self._buffer += chunk
+        return True
+
+    def peek(self):
+        """
+        :return: the next non-whitespace character without consuming it, or None at the end
+        """
+        while True:
+            buffer = self._buffer
+            pos = self._pos
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos < len(buffer):
+                return buffer[pos]
+            if not self._read_more(self._chunk_size):
+                return None
+
+    def expect(self, char):
+        found = self.peek()
+        if found != char:
+            raise ValueError(
+                f"Invalid JSON stream: Expected {wrap_val(char)}; Got {wrap_val(found)}"
+            )
+        self._pos += 1
+
+    def next_value(self):
+        """
+        Decode the next JSON value, reading more from the file until it is complete.
+        """
+        if self.peek() is None:
+            raise ValueError("Invalid JSON stream: Unexpected end of input")
+        read_size = self._chunk_size
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self._buffer, self._pos)
+                # a value that is not followed by a delimiter may be truncated (e.g. a number)
+                if self._eof or (
+                    end < len(self._buffer) and self._buffer[end] in _DELIMITERS
+                ):
+                    self._pos = end
+                    return value
+            except JSONDecodeError:
+                if self._eof:
+                    raise
+            if not self._read_more(read_size):
+                value, self._pos = _decoder.raw_decode(self._buffer, self._pos)
+                return value
+            read_size *= 2
+
+
+def _navigate_to(reader: _IncrementalReader, path_keys: list):
+    for key in path_keys:
+        reader.expect("{")
+        while True:
+            if reader.peek() == "}":
+                raise ValueError(f"Invalid JSON stream: key {wrap_val(key)} not found")
+            current_key = reader.next_value()
+            reader.expect(":")
+            if current_key == key:
+                break
+            reader.next_value()
+            if reader.peek() == ",":
+                reader.expect(",")
+
+
+def iter_json_array(fileobj, path: str = None, chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """
+    Lazily iterate over the elements of a JSON array in a file-like object.
+
+    Arguments:
+        fileobj:
+            An object with a read(size) method, that returns either str or bytes (utf-8).
+            For a socket, use socket.makefile("rb").
+        path(str): optional
+            The location of the array in the document, using dot notation, for example: "data.events".
+            If not provided, the document is expected to be an array.
+            Values that precede the array in the document are decoded and discarded.
+        chunk_size(int): optional
+            The size of every read from the file.
+
+    Returns:
+        A generator of the elements of the array, as Python objects.
+    """
+    reader = _IncrementalReader(fileobj, chunk_size)
+    _navigate_to(reader, path.split(".") if path else [])
+    reader.expect("[")
+    if reader.peek() == "]":
+        return
+    while True:
+        yield reader.next_value()
+        if reader.peek() == "]":
+            return
+        reader.expect(",")
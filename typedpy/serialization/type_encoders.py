@@ -0,0 +1,193 @@
+"""
+A registry of encoders and decoders for values of types that typedpy does not know how to serialize,
+such as UUID or user classes. Without an encoder, such values are serialized the way json.dumps
+would serialize them, if at all.
+"""
+import base64
+import dataclasses
+import json
+import uuid
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Callable
+
+from typedpy.commons import wrap_val
+
+_encoder_by_type = {}
+_decoder_by_type = {}
+
+# The resolved encoder/decoder by the class of the value, including classes that inherit from a
+# registered type, and classes for which nothing is registered (None).
+_resolved_encoders = {}
+_resolved_decoders = {}
+
+
+def register_type_encoder(
+    cls: type, encoder: Callable, decoder: Callable = None
+) -> None:
+    """
+    Register how to serialize values of the given type, and optionally how to deserialize them.
+    The encoder is also used for instances of subclasses of the type, unless a more specific
+    type is registered.
+    It is used for values of :class:`Anything` fields, of typed fields of the type
+    (e.g. Field[UUID]), and of undefined attributes. The decoder is used when deserializing a
+    typed field of the type.
+
+    Arguments:
+        cls(type):
+            The type
+        encoder(Callable):
+            A function that converts a value of the type to a JSON-compatible value
+        decoder(Callable): optional
+            A function that converts a serialized value back to the type
+
+    Example:
+
+    .. code-block:: python
+
+        register_type_encoder(UUID, str, UUID)
+
+        class Foo(Structure):
+            id: Field[UUID]
+            anything: Anything
+
+        foo = Foo(id=UUID(int=1), anything=UUID(int=2))
+        assert serialize(foo) == {"id": str(UUID(int=1)), "anything": str(UUID(int=2))}
+        assert Deserializer(Foo).deserialize(serialize(foo)).id == UUID(int=1)
+    """
+    if not isinstance(cls, type):
+        raise TypeError(f"Expected a type; Got {wrap_val(cls)}")
+    if not callable(encoder) or (decoder is not None and not callable(decoder)):
+        raise TypeError("encoder and decoder must be callable")
+    _encoder_by_type[cls] = encoder
+    if decoder is None:
+        _decoder_by_type.pop(cls, None)
+    else:
+        _decoder_by_type[cls] = decoder
+    _resolved_encoders.clear()
+    _resolved_decoders.clear()
+
+
+def unregister_type_encoder(cls: type) -> None:
+    """
+    Remove the encoder and decoder of the given type from the registry
+    """
+    _encoder_by_type.pop(cls, None)
+    _decoder_by_type.pop(cls, None)
+    _resolved_encoders.clear()
+    _resolved_decoders.clear()
+
+
+def _resolve(cls, registry: dict):
+    for base in cls.__mro__:
+        if base in registry:
+            return registry[base]
+    return None
+
+
+def get_type_encoder(cls: type):
+    """
+    Returns the encoder for values of the given class, or None if there is none
+    """
+    try:
+        return _resolved_encoders[cls]
+    except KeyError:
+        encoder = _resolved_encoders[cls] = _resolve(cls, _encoder_by_type)
+        return encoder
+
+
+def get_type_decoder(cls: type):
+    """
+    Returns the decoder for values of the given class, or None if there is none
+    """
+    try:
+        return _resolved_decoders[cls]
+    except KeyError:
+        decoder = _resolved_decoders[cls] = _resolve(cls, _decoder_by_type)
+        return decoder
+
+
+def register_standard_type_encoders() -> None:
+    """
+    Register encoders and decoders for common types of the standard library: UUID and Decimal as strings,
+    datetime, date and time in ISO-8601 format, and bytes in base64.
+    """
+    register_type_encoder(uuid.UUID, str, uuid.UUID)
+    register_type_encoder(Decimal, str, Decimal)
+    register_type_encoder(datetime, datetime.isoformat, datetime.fromisoformat)
+    register_type_encoder(date, date.isoformat, date.fromisoformat)
+    register_type_encoder(time, time.isoformat, time.fromisoformat)
+    register_type_encoder(
+        bytes,
+        lambda value: base64.b64encode(value).decode("ascii"),
+        base64.b64decode,
+    )
+
+
+def _is_numpy_scalar(cls) -> bool:
+    return cls.__module__ == "numpy" and hasattr(cls, "item")
+
+
+_JSON_TYPES = (str, int, float, bool, type(None))
+
+
+def _encode_key(key) -> str:
+    # the same conversion of keys as json.dumps
+    if isinstance(key, str):
+        return key
+    if key is True:
+        return "true"
+    if key is False:
+        return "false"
+    if key is None:
+        return "null"
+    if isinstance(key, int):
+        return int.__repr__(key)
+    if isinstance(key, float):
+        return json.dumps(key)
+    raise TypeError(
+        f"keys must be str, int, float, bool or None, not {key.__class__.__name__}"
+    )
+
+
+def encode_value(value):
+    """
+    Encode a value that typedpy does not know how to serialize: use the registered encoder, if
+    there is one. Lists, tuples and dicts are encoded item by item, dataclasses are converted to
+    dicts, and numpy scalars to the equivalent Python value. Other values are encoded the way
+    json.dumps would encode them, which fails for types that JSON does not support.
+    """
+    cls = value.__class__
+    if cls in _JSON_TYPES:
+        return value
+    encoder = get_type_encoder(cls)
+    if encoder is not None:
+        return encoder(value)
+    if isinstance(value, dict):
+        return {_encode_key(k): encode_value(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [encode_value(v) for v in value]
+    if dataclasses.is_dataclass(cls):
+        return {
+            f.name: encode_value(getattr(value, f.name))
+            for f in dataclasses.fields(value)
+        }
+    if _is_numpy_scalar(cls):
+        return value.item()
+    if isinstance(value, _JSON_TYPES):
+        # a subclass of a JSON type, e.g. an IntEnum
+        return json.loads(json.dumps(value))
+    raise TypeError(f"Object of type {cls.__name__} is not JSON serializable")
+
+
+def json_default(value):
+    """
+    A "default" function for json.dumps, that encodes values using the registry
+    """
+    cls = value.__class__
+    encoder = get_type_encoder(cls)
+    if encoder is not None:
+        return encoder(value)
+    if dataclasses.is_dataclass(cls) or _is_numpy_scalar(cls):
+        return encode_value(value)
+    raise TypeError(f"Object of type {cls.__name__} is not JSON serializable")
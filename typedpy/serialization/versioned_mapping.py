@@ -30,38 +30,183 @@ class Versioned(Structure):
         super().__init__(*args, **kwargs)
 
 
-def _convert(mapped_dict: dict, mapping):
-    out_dict = copy.deepcopy(mapped_dict)
+_converters_by_class = {}
+
+# the value of a key that is not in the dict
+_missing = object()
+
+
+def _absent(_in_dict, _memo):
+    return _missing
+
+
+def _input_value(key: str):
+    def evaluate(in_dict, _memo):
+        return in_dict.get(key, _missing)
+
+    return evaluate
+
+
+def _or_none(value):
+    return None if value is _missing else value
+
+
+def _memoized(func):
+    """
+    A value that is referred to by several keys, e.g. a function call that is then renamed, is
+    evaluated once per conversion, like in a step by step conversion
+    """
+
+    def evaluate(in_dict, memo):
+        try:
+            return memo[evaluate]
+        except KeyError:
+            value = memo[evaluate] = func(in_dict, memo)
+            return value
+
+    return evaluate
+
+
+def _renamed_value(source: str, state: dict):
+    if "." not in source:
+        value = _lookup(state, source)
+        return lambda in_dict, memo: _or_none(value(in_dict, memo))
+    root, path = source.split(".", 1)
+    value = _lookup(state, root)
+    return lambda in_dict, memo: deep_get(_or_none(value(in_dict, memo)), path)
+
+
+def _constant_value(constant: Constant):
+    return _memoized(lambda in_dict, memo: constant())
+
+
+def _function_call_value(key: str, function_call: FunctionCall, state: dict):
+    func = function_call.func
+    args = [
+        _lookup(state, k)
+        for k in (list(function_call.args) if function_call.args else [key])
+    ]
+
+    def evaluate(in_dict, memo):
+        # the function might modify its arguments, so it gets copies of them
+        return func(*[copy.deepcopy(_or_none(arg(in_dict, memo))) for arg in args])
+
+    return _memoized(evaluate)
+
+
+def _nested_value(mapping: dict, source):
+    # consecutive nested mappings of the same content are composed into one
+    mappings, source = getattr(source, "nested_mappings", ([], source))
+    mappings = mappings + [mapping]
+    convert = _compile_mappings(mappings)
+
+    def evaluate(in_dict, memo):
+        content = source(in_dict, memo)
+        if content is None or content is _missing:
+            return content
+        if isinstance(content, list):
+            return [convert(x) for x in content]
+        return convert(content)
+
+    result = _memoized(evaluate)
+    result.nested_mappings = (mappings, source)
+    return result
+
+
+def _version_value(previous):
+    def evaluate(in_dict, memo):
+        version = previous(in_dict, memo)
+        return (0 if version is _missing else version) + 1
+
+    return evaluate
+
+
+def _lookup(state: dict, key: str):
+    return state[key] if key in state else _input_value(key)
+
+
+def _apply_mapping(state: dict, mapping: dict) -> dict:
+    """
+    Returns the state after the given mapping, where the state maps every key that the mappings
+    so far touched to a function that evaluates its value from the original input
+    """
+    updated = dict(state)
+    renames = []
+    deletions = []
     for k, v in mapping.items():
         if isinstance(v, Constant):
-            out_dict[k] = v()
+            updated[k] = _constant_value(v)
         elif k.endswith("._mapper"):
             field_name = k[: -len("._mapper")]
-            content = mapped_dict.get(field_name, None)
-            if content is not None:
-                if isinstance(content, list):
-                    out_dict[field_name] = [_convert(x, v) for x in content]
-                else:
-                    out_dict[field_name] = _convert(content, v)
-
+            updated[field_name] = _nested_value(v, _lookup(state, field_name))
         elif isinstance(v, FunctionCall):
-            args = [out_dict.get(x) for x in v.args] if v.args else [out_dict.get(k)]
-            out_dict[k] = v.func(*args)
+            updated[k] = _function_call_value(k, v, updated)
+        elif isinstance(v, str):
+            renames.append((k, v))
+        elif v == Deleted:
+            deletions.append(k)
+    for key, source in renames:
+        updated[key] = _renamed_value(source, updated)
+    for key in deletions:
+        updated[key] = _absent
+    return updated
 
-    for k, v in mapping.items():
-        if isinstance(v, str):
-            out_dict[k] = deep_get(out_dict, v)
 
-    for k, v in mapping.items():
-        if v == Deleted and k in out_dict:
-            del out_dict[k]
-    return out_dict
+def _compile_mappings(mappings: list, count_versions: bool = False):
+    """
+    Compose a sequence of mappings into a function that converts a dict by all of them in a
+    single pass: every key that the mappings touch is evaluated once, directly from the input.
+    The result is a new dict, but only the values that the mappings touch are replaced, so the
+    input is never modified and untouched subtrees are shared rather than copied.
+    """
+    state = {}
+    for mapping in mappings:
+        state = _apply_mapping(state, mapping)
+        if count_versions:
+            state["version"] = _version_value(_lookup(state, "version"))
+    values = list(state.items())
+
+    def convert(in_dict: dict) -> dict:
+        out_dict = dict(in_dict)
+        memo = {}
+        for key, value in values:
+            result = value(in_dict, memo)
+            if result is _missing:
+                out_dict.pop(key, None)
+            else:
+                out_dict[key] = result
+        return out_dict
+
+    return convert
+
+
+def _compile_versions_mapping(versions_mapping, start_version: int):
+    return _compile_mappings(
+        versions_mapping[(start_version - 1) :], count_versions=True
+    )
+
+
+def get_versions_converter(cls, start_version: int):
+    """
+    Get the function that converts an input in the given version of a :class:`Versioned` class
+    to its latest version. The mappings from the start version on are composed into a single
+    mapping, that is applied in one pass. It is compiled once per class and start version.
+    The start version comes from the input, so only valid versions are cached, and all the versions
+    from the latest one and up share a single entry. Otherwise, the input could grow the cache
+    without bounds.
+    """
+    versions_mapping = getattr(cls, VERSIONS_MAPPING, [])
+    if not isinstance(start_version, int) or start_version < 1:
+        # an invalid version, that the validation of the class will reject
+        return dict
+    key = (cls, min(start_version, len(versions_mapping) + 1))
+    converter = _converters_by_class.get(key)
+    if converter is None:
+        converter = _compile_versions_mapping(versions_mapping, key[1])
+        _converters_by_class[key] = converter
+    return converter
 
 
 def convert_dict(the_dict: dict, versions_mapping):
     start_version = the_dict.get("version", 1)
-    mapped_dict = copy.deepcopy(the_dict)
-    for mapping in versions_mapping[(start_version - 1) :]:
-        mapped_dict = _convert(mapped_dict, mapping)
-        mapped_dict["version"] = mapped_dict.get("version", 0) + 1
-    return mapped_dict
+    return _compile_versions_mapping(versions_mapping, start_version)(the_dict)
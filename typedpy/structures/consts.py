@@ -11,6 +11,7 @@ DESERIALIZATION_MAPPER = "_deserialization_mapper"
 ENABLE_UNDEFINED = "_enable_undefined_value"
 DISABLE_PROTECTION = "_disable_protection"
 VERSIONS_MAPPING = "_versions_mapping"
+CACHE_SERIALIZATION = "_cache_serialization"
 
 SPECIAL_ATTRIBUTES = {
     REQUIRED_FIELDS,
@@ -24,6 +25,7 @@ SPECIAL_ATTRIBUTES = {
     IGNORE_NONE_VALUES,
     ENABLE_UNDEFINED,
     VERSIONS_MAPPING,
+    CACHE_SERIALIZATION,
 }
 CUSTOM_ATTRIBUTE_MARKER = "_custom_attribute_"
 MAX_NUMBER_OF_INSTANCES_TO_VERIFY_UNIQUENESS = 100000
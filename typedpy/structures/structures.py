@@ -8,7 +8,7 @@ import inspect
 import json
 from builtins import enumerate, issubclass
 from copy import deepcopy
-from collections import OrderedDict, defaultdict
+from collections import OrderedDict, defaultdict, deque
 from collections.abc import Mapping
 from inspect import Signature, Parameter, signature, currentframe
 import sys
@@ -50,9 +50,21 @@ from .type_mapping import convert_basic_types
 T = typing.TypeVar("T")
 
 _immutable_types = (int, float, str, tuple, bool, enum.Enum)
-_internal_props = ["_instantiated", "_none_fields", "_trust_supplied_values"]
+_internal_props = [
+    "_instantiated",
+    "_none_fields",
+    "_trust_supplied_values",
+    "_lazy_fields",
+    "_serialization_cache",
+    "_changed_fields",
+    "_changed_keys",
+]
 created_fast_serializer = "_created_fast_serializer"
 failed_to_create_fast_serializer = "_failed_serializer_creation"
+lazy_fields = "_lazy_fields"
+serialization_cache = "_serialization_cache"
+changed_fields = "_changed_fields"
+changed_keys = "_changed_keys"
 
 
 class ImmutableMixin:
@@ -228,6 +240,14 @@ def _check_for_final_violations(classes):
                 )
 
 
+# provided by the serialization layer, which depends on this module
+_type_encoder_lookup = {}
+
+
+def set_type_encoder_lookup(get_type_encoder: typing.Callable):
+    _type_encoder_lookup["get_type_encoder"] = get_type_encoder
+
+
 def _or_fields(first, other):
     from typedpy.fields import AnyOf, Enum
 
@@ -270,12 +290,6 @@ class FieldMeta(type):
                     raise TypeError
                 return FieldMeta.__getitem__(cls, converted)
             except TypeError:
-
-                def get_state(value):
-                    raise TypeError(
-                        "pickling of implicit wrappers for non-Typedpy fields are unsupported"
-                    )
-
                 if not isinstance(val, type):
                     raise TypeError(
                         f"Unsupported field type in definition: {wrap_val(val)}"
@@ -286,7 +300,6 @@ class FieldMeta(type):
                 short_hash = hashlib.sha256(the_class.encode("utf-8")).hexdigest()[:8]
                 new_name = f"Field_{the_class}_{short_hash}"
                 class_as_field = create_typed_field(new_name, val)
-                class_as_field.__getstate__ = get_state
                 FieldMeta._registry[the_class] = class_as_field
                 return class_as_field()
 
@@ -412,6 +425,9 @@ class Field(UniqueMixin, metaclass=FieldMeta):
             return field_by_name.get(name)
 
         if instance is not None and self._name not in instance.__dict__:
+            if self._name in instance.__dict__.get(lazy_fields, ()):
+                instance._load_lazy_field(self._name)
+                return getattr(instance, self._name)
             default_value = (
                 self._default()
                 if callable(self._default)
@@ -444,6 +460,8 @@ class Field(UniqueMixin, metaclass=FieldMeta):
                         int,
                         float,
                         str,
+                        bytes,
+                        memoryview,
                         bool,
                         enum.Enum,
                         Field,
@@ -472,6 +490,7 @@ class Field(UniqueMixin, metaclass=FieldMeta):
                             int,
                             float,
                             str,
+                            bytes,
                             bool,
                             enum.Enum,
                             ImmutableStructure,
@@ -481,7 +500,11 @@ class Field(UniqueMixin, metaclass=FieldMeta):
             )
             try:
                 instance.__dict__[self._name] = (
-                    deepcopy(value) if needs_defensive_copy else value
+                    _copy_memoryview(value)
+                    if isinstance(value, memoryview)
+                    else deepcopy(value)
+                    if needs_defensive_copy
+                    else value
                 )
             except TypeError:
                 raise TypeError(
@@ -493,9 +516,12 @@ class Field(UniqueMixin, metaclass=FieldMeta):
             instance.__dict__[self._name] = value
             if TypedPyDefaults.uniqueness_features_enabled:
                 instance.__manage__uniqueness_of_all_fields__()
-        if getattr(instance, "_instantiated", False) and not getattr(
-                instance, "_skip_validation", False
+        if (
+                getattr(instance, "_instantiated", False)
+                and not getattr(instance, "_skip_validation", False)
+                and not instance.__dict__.get(lazy_fields)
         ):
+            # with pending lazy fields, the structure is validated once they are loaded
             instance.__validate__()
 
     def __serialize__(self, value):
@@ -530,7 +556,9 @@ class Field(UniqueMixin, metaclass=FieldMeta):
             return value
         if isinstance(value, list):
             return [self.serialize(v) for v in value]
-        return json.dumps(value)
+        get_type_encoder = _type_encoder_lookup.get("get_type_encoder")
+        encoder = get_type_encoder(value.__class__) if get_type_encoder else None
+        return encoder(value) if encoder is not None else json.dumps(value)
 
     @property
     def get_type(self):
@@ -663,7 +691,7 @@ def _block_invalid_consts(cls_dict):
     known_attributes = (
             annotations.keys()
             | SPECIAL_ATTRIBUTES
-            | {"_fields", "_fail_fast", "_field_by_name", "_constants"}
+            | {"_fields", "_fail_fast", "_field_by_name", "_field_names", "_constants"}
     )
     ""
     for k, v in cls_dict.items():
@@ -771,6 +799,7 @@ class StructMeta(type):
         field_by_name = _get_all_fields_by_name(clsobj)
         setattr(clsobj, "__signature__", sig)
         setattr(clsobj, "_field_by_name", field_by_name)
+        setattr(clsobj, "_field_names", tuple(field_by_name))
         return clsobj
 
     def __str__(cls):
@@ -934,6 +963,102 @@ def convert_field_type_if_possible(the_field):
         return get_typing_lib_info(the_field)
 
 
+def _copy_memoryview(value: memoryview) -> memoryview:
+    """
+    A memoryview cannot be deep-copied. A read-only view of bytes is immutable, so it is
+    kept as is. Otherwise, the content is copied.
+    """
+    if value.readonly and isinstance(value.obj, bytes):
+        return value
+    return memoryview(value.tobytes())
+
+
+def _restore_structure(cls, field_names, values, present, none_fields, extra=None):
+    """
+    Restore a pickled Structure (see Structure.__reduce__). The values were validated before
+    they were pickled, so they are assigned as is, without validation.
+    If the fields of the class changed since it was pickled, the values are matched to the
+    fields by name, and the instance is created and validated as usual.
+    """
+    if field_names != cls._field_names:
+        return _restore_changed_structure(cls, field_names, values, present, extra)
+    instance = cls.__new__(cls)
+    the_dict = instance.__dict__
+    restored_none_fields = set()
+    remaining_values = iter(values)
+    for i, (name, field) in enumerate(cls.get_all_fields_by_name().items()):
+        if present >> i & 1:
+            value = next(remaining_values)
+            if hasattr(field, "_from_pickled_value"):
+                value = field._from_pickled_value(value, instance)
+            the_dict[name] = value
+        if none_fields >> i & 1:
+            restored_none_fields.add(name)
+    if extra:
+        the_dict.update(extra)
+    the_dict["_none_fields"] = restored_none_fields
+    the_dict["_instantiated"] = True
+    return instance
+
+
+def _restore_changed_structure(cls, field_names, values, present, extra):
+    kwargs = dict(extra or {})
+    remaining_values = iter(values)
+    for i, name in enumerate(field_names):
+        if present >> i & 1:
+            kwargs[name] = next(remaining_values)
+    return cls(**kwargs)
+
+
+def _track_change(structure, key, previous):
+    """
+    Record that a field was set or deleted, in a structure that tracks its changes. If it replaced
+    a mapping, the keys of the mapping are recorded too, so that the keys that are missing from the
+    new value can be serialized as deleted.
+    """
+    the_dict = structure.__dict__
+    changed = the_dict[changed_fields]
+    if key not in changed and isinstance(previous, Mapping):
+        keys_by_name = the_dict[changed_keys]
+        keys_by_name[key] = keys_by_name.get(key, set()) | set(previous)
+    changed.add(key)
+
+
+def _start_tracking_fields(structure):
+    """
+    Let the fields wrap their values for change tracking, if they need to (e.g. a Set)
+    """
+    the_dict = structure.__dict__
+    for name, field in structure.get_all_fields_by_name().items():
+        value = the_dict.get(name)
+        start_tracking = getattr(field, "_start_tracking", None)
+        if start_tracking is not None and value is not None:
+            the_dict[name] = start_tracking(value, structure)
+
+
+def _mark_clean_nested(value):
+    if isinstance(value, Structure):
+        value.mark_clean()
+    elif isinstance(value, Mapping):
+        for v in value.values():
+            _mark_clean_nested(v)
+    elif isinstance(value, (list, tuple, set, frozenset, deque)):
+        for v in value:
+            _mark_clean_nested(v)
+
+
+class LazyFieldValue:
+    """
+    A placeholder for a field value that is deserialized only when the field is first accessed.
+    Created by lazy deserialization.
+    """
+
+    __slots__ = ("load",)
+
+    def __init__(self, load):
+        self.load = load
+
+
 class Structure(UniqueMixin, metaclass=StructMeta):
     """
     The base class to support strictly defined structures. When creating a new instance of
@@ -1069,6 +1194,9 @@ class Structure(UniqueMixin, metaclass=StructMeta):
 
         if Structure.failing_fast():
             for name, val in bound.arguments.items():
+                if val.__class__ is LazyFieldValue:
+                    self.__dict__.setdefault(lazy_fields, {})[name] = val
+                    continue
                 try:
                     if val is not Undefined:
                         setattr(self, name, val)
@@ -1080,18 +1208,78 @@ class Structure(UniqueMixin, metaclass=StructMeta):
         else:
             errors = []
             for name, val in bound.arguments.items():
+                if val.__class__ is LazyFieldValue:
+                    self.__dict__.setdefault(lazy_fields, {})[name] = val
+                    continue
                 try:
                     setattr(self, name, val)
                 except (TypeError, ValueError) as ex:
                     errors.append(ex)
             raise_errs_if_needed(self.__class__, errors)
 
+        if lazy_fields in self.__dict__:
+            self._instantiated = True
+        else:
+            self._complete_instantiation()
+        super().__init__()
+
+    def _complete_instantiation(self):
         self.__validate__()
-        self._instantiated = True
+        self.__dict__["_instantiated"] = True
         if TypedPyDefaults.uniqueness_features_enabled:
             self.__manage_uniqueness__()
             self.__manage__uniqueness_of_all_fields__()
-        super().__init__()
+
+    def _load_lazy_field(self, name):
+        """
+        Deserialize and validate a lazy field. The value is set using the field itself, so that
+        an immutable structure stays immutable while it is loaded. The structure is validated
+        as a whole once the last lazy field was loaded. Until that succeeds, the structure
+        is still considered pending, so that a failure is raised again by the next access.
+        """
+        the_dict = self.__dict__
+        pending = the_dict[lazy_fields]
+        lazy_value = pending.get(name)
+        if lazy_value is not None:
+            field = self.get_all_fields_by_name()[name]
+            field.__set__(self, lazy_value.load())
+            pending.pop(name, None)
+        if not pending:
+            self._complete_instantiation()
+            the_dict.pop(lazy_fields, None)
+
+    def mark_clean(self):
+        """
+        Start tracking the changes in the structure, and in the structures nested in it, from this point.
+        The changes can be serialized using :func:`serialize_changes`. Calling it again resets the tracking.
+
+        Returns:
+            The structure itself
+        """
+        self.materialize()
+        self.__dict__[changed_fields] = set()
+        self.__dict__[changed_keys] = {}
+        _start_tracking_fields(self)
+        for name in self.get_all_fields_by_name():
+            _mark_clean_nested(self.__dict__.get(name))
+        return self
+
+    def materialize(self):
+        """
+        In a structure that was deserialized lazily, deserialize and validate all the fields that
+        were not accessed yet, and then validate the whole structure. Otherwise, does nothing.
+
+        Returns:
+            The structure itself
+        """
+        pending = self.__dict__.get(lazy_fields)
+        while pending:
+            self._load_lazy_field(next(iter(pending)))
+        if lazy_fields in self.__dict__:
+            # all the lazy fields were overridden, or the validation of the structure failed
+            self._complete_instantiation()
+            self.__dict__.pop(lazy_fields, None)
+        return self
 
     def _set_defaults(self, defaults_fields, field_by_name):
         for field_name in defaults_fields:
@@ -1106,9 +1294,21 @@ class Structure(UniqueMixin, metaclass=StructMeta):
                 field.__manage_uniqueness_for_field__(self, getattr(self, name, None))
 
     def __setattr__(self, key, value):
+        if changed_fields not in self.__dict__ or key in _internal_props:
+            self._set_attribute(key, value)
+            return
+        previous = self.__dict__.get(key)
+        self._set_attribute(key, value)
+        # only after the value was validated and set
+        _track_change(self, key, previous)
+
+    def _set_attribute(self, key, value):
         if getattr(self, "_trust_supplied_values", False):
             super().__setattr__(key, value)
             return
+        pending = self.__dict__.get(lazy_fields)
+        if pending:
+            pending.pop(key, None)
 
         if getattr(self, IS_IMMUTABLE, False):
             if getattr(self, "_instantiated", False):
@@ -1121,12 +1321,16 @@ class Structure(UniqueMixin, metaclass=StructMeta):
                         int,
                         float,
                         str,
+                        bytes,
                         bool,
                         enum.Enum,
                         ImmutableStructure,
                     ),
                 )
-                value = deepcopy(value) if needs_defensive_copy else value
+                if isinstance(value, memoryview):
+                    value = _copy_memoryview(value)
+                elif needs_defensive_copy:
+                    value = deepcopy(value)
 
         if key in getattr(self, "_constants", {}) and getattr(
                 self, "_instantiated", False
@@ -1182,6 +1386,7 @@ class Structure(UniqueMixin, metaclass=StructMeta):
             self.__manage_uniqueness__()
 
     def __getstate__(self):
+        self.materialize()
         fields_by_name = _get_all_fields_by_name(self.__class__)
         return {
             name: field.__serialize__(getattr(self, name, None))
@@ -1189,6 +1394,35 @@ class Structure(UniqueMixin, metaclass=StructMeta):
             if name in self.__dict__
         }
 
+    def __reduce__(self):
+        """
+        A compact pickle format: the class, the field names, a tuple of the raw values of the
+        fields that are set, ordered by the field definitions, and bitmasks of the fields that are
+        set and the fields that were explicitly set to None. The field names are the same tuple
+        for all the instances of the class, so pickle stores it once. The unpickled instance is
+        not validated again, unless the fields of the class changed in the meantime.
+        """
+        the_dict = self.materialize().__dict__
+        none_fields = the_dict.get("_none_fields", ())
+        fields_by_name = self.__class__.get_all_fields_by_name()
+        values = []
+        present = 0
+        none_mask = 0
+        for i, (name, field) in enumerate(fields_by_name.items()):
+            if name in the_dict:
+                values.append(field.__serialize__(the_dict[name]))
+                present |= 1 << i
+            if name in none_fields:
+                none_mask |= 1 << i
+        cls = self.__class__
+        args = (cls, cls._field_names, tuple(values), present, none_mask)
+        extra = {
+            k: v
+            for k, v in the_dict.items()
+            if k not in fields_by_name and k not in _internal_props
+        }
+        return _restore_structure, (*args, extra) if extra else args
+
     def __str__(self):
         def list_to_str(values):
             as_strings = [to_str(v) for v in values]
@@ -1209,6 +1443,7 @@ class Structure(UniqueMixin, metaclass=StructMeta):
                 return f"{{{dict_to_str(the_val)}}}"
             return str(the_val)
 
+        self.materialize()
         name = self.__class__.__name__
         if name.startswith("StructureReference_") and self.__class__.__bases__ == (
                 Structure,
@@ -1230,6 +1465,8 @@ class Structure(UniqueMixin, metaclass=StructMeta):
     def __eq__(self, other):
         if self.__class__ != other.__class__:
             return False
+        self.materialize()
+        other.materialize()
         merged = {**self.__dict__, **other.__dict__}
         for k in sorted(merged):
             if k in _internal_props:
@@ -1259,7 +1496,9 @@ class Structure(UniqueMixin, metaclass=StructMeta):
                 self, REQUIRED_FIELDS
         ):
             raise ValueError(f"{key} is mandatory")
-        del self.__dict__[key]
+        previous = self.__dict__.pop(key)
+        if changed_fields in self.__dict__:
+            _track_change(self, key, previous)
 
     def __validate__(self):
         pass
@@ -1279,25 +1518,40 @@ class Structure(UniqueMixin, metaclass=StructMeta):
                 ),
         ) and getattr(self, IS_IMMUTABLE, False):
             return self
+        self.materialize()
         cls = self.__class__
         result = cls.__new__(cls)
         memo[id(self)] = result
         result._skip_validation = True  # pylint: disable=attribute-defined-outside-init
         for k, v in self.__dict__.items():
-            setattr(result, k, deepcopy(v, memo))
+            copied = (
+                _copy_memoryview(v) if isinstance(v, memoryview) else deepcopy(v, memo)
+            )
+            setattr(result, k, copied)
         delattr(result, "_skip_validation")
+        if changed_fields in result.__dict__:
+            _start_tracking_fields(result)
         return result
 
     def __copy__(self):
+        self.materialize()
         cls = self.__class__
         result = cls.__new__(cls)
         result.__dict__.update(self.__dict__)
+        result.__dict__.pop(serialization_cache, None)
+        if changed_fields in result.__dict__:
+            result.__dict__[changed_fields] = set(self.__dict__[changed_fields])
+            result.__dict__[changed_keys] = {
+                k: set(v) for k, v in self.__dict__[changed_keys].items()
+            }
         return result
 
     def __dir__(self) -> Iterable[str]:
+        self.materialize()
         return [k for k in sorted(self.__dict__) if k not in _internal_props]
 
     def __bool__(self):
+        self.materialize()
         return any(
             v is not None for k, v in self.__dict__.items() if k not in _internal_props
         )
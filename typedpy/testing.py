@@ -17,6 +17,7 @@ from typedpy import (
 )
 from typedpy.commons import wrap_val
 from typedpy.structures import Structure
+from typedpy.structures.structures import _internal_props
 from typedpy.structures.consts import DESERIALIZATION_MAPPER, SERIALIZATION_MAPPER
 
 MISSING_VALUES = "missing values"
@@ -186,7 +187,7 @@ def _find_diff(
             struct, other, outer_result=outer_result, out_key=out_key
         )
 
-    internal_props = ["_instantiated", "_trust_supplied_values"]
+    internal_props = _internal_props
     res = {}
     if isinstance(struct, Structure):  # pylint: disable=too-many-nested-blocks
         _diff_structure_internal(internal_props, other, res, struct)